@@ -11,7 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from src.database.base import Base
-from src.database.models import Project, TrendingSnapshot, Summary
+from src.database.models import Project, FetchRun, TrendingSnapshot, Summary, DataVersion
 from src.config.settings import settings
 
 # this is the Alembic Config object, which provides
@@ -32,6 +32,16 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# Created by raw SQL in the full-text search migration and not part of the
+# metadata: the FTS5 virtual table, its shadow tables and their triggers
+UNMANAGED_PREFIXES = ("projects_fts",)
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Keep autogenerate and "alembic check" away from objects the models do not describe"""
+    return not (name and name.startswith(UNMANAGED_PREFIXES))
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -54,6 +64,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -77,7 +88,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
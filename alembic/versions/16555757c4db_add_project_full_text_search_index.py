@@ -0,0 +1,67 @@
+"""Add project full-text search index
+
+Revision ID: 16555757c4db
+Revises: 75088159bbc0
+Create Date: 2026-10-16 20:55:44.826570
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '16555757c4db'
+down_revision: Union[str, None] = '75088159bbc0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # FTS5 is SQLite-only; other databases search with LIKE
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute("""
+        CREATE VIRTUAL TABLE projects_fts USING fts5(
+            name, full_name, description,
+            content='projects', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+    op.execute("""
+        CREATE TRIGGER projects_fts_insert AFTER INSERT ON projects BEGIN
+            INSERT INTO projects_fts (rowid, name, full_name, description)
+            VALUES (new.id, new.name, new.full_name, new.description);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER projects_fts_delete AFTER DELETE ON projects BEGIN
+            INSERT INTO projects_fts (projects_fts, rowid, name, full_name, description)
+            VALUES ('delete', old.id, old.name, old.full_name, old.description);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER projects_fts_update AFTER UPDATE ON projects
+        WHEN old.name IS NOT new.name
+            OR old.full_name IS NOT new.full_name
+            OR old.description IS NOT new.description
+        BEGIN
+            INSERT INTO projects_fts (projects_fts, rowid, name, full_name, description)
+            VALUES ('delete', old.id, old.name, old.full_name, old.description);
+            INSERT INTO projects_fts (rowid, name, full_name, description)
+            VALUES (new.id, new.name, new.full_name, new.description);
+        END
+    """)
+    op.execute("INSERT INTO projects_fts (projects_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS projects_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS projects_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS projects_fts_insert")
+    op.execute("DROP TABLE IF EXISTS projects_fts")
@@ -0,0 +1,26 @@
+"""Add project history index
+
+Revision ID: 75088159bbc0
+Revises: 2e99ec420159
+Create Date: 2026-10-16 20:53:04.693955
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '75088159bbc0'
+down_revision: Union[str, None] = '2e99ec420159'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_project_date', 'trending_snapshots', ['project_id', 'date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_project_date', table_name='trending_snapshots')
@@ -0,0 +1,77 @@
+"""Make ingest idempotent per day with unique runs and snapshots
+
+Revision ID: be8506006a57
+Revises: d4f8357e1e33
+Create Date: 2026-10-16 21:02:47.903114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'be8506006a57'
+down_revision: Union[str, None] = 'd4f8357e1e33'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('fetch_runs') as batch_op:
+        batch_op.add_column(sa.Column('run_date', sa.Date(), nullable=True))
+    op.execute("UPDATE fetch_runs SET run_date = date(fetched_at)")
+
+    # Remove duplicates left by repeated same-day ingests. On large databases
+    # run `python main.py compact` first; it does the same work in small batches.
+    op.execute("""
+        DELETE FROM trending_snapshots
+        WHERE run_id IN (
+            SELECT r.id FROM fetch_runs r
+            WHERE EXISTS (
+                SELECT 1 FROM fetch_runs n
+                WHERE n.run_date = r.run_date AND n.since = r.since AND n.language = r.language
+                AND (n.fetched_at > r.fetched_at OR (n.fetched_at = r.fetched_at AND n.id > r.id))
+            )
+        )
+    """)
+    op.execute("""
+        DELETE FROM fetch_runs
+        WHERE EXISTS (
+            SELECT 1 FROM fetch_runs n
+            WHERE n.run_date = fetch_runs.run_date AND n.since = fetch_runs.since
+            AND n.language = fetch_runs.language
+            AND (n.fetched_at > fetch_runs.fetched_at
+                 OR (n.fetched_at = fetch_runs.fetched_at AND n.id > fetch_runs.id))
+        )
+    """)
+    op.execute("""
+        DELETE FROM trending_snapshots
+        WHERE EXISTS (
+            SELECT 1 FROM trending_snapshots t
+            WHERE t.run_id = trending_snapshots.run_id
+            AND t.project_id = trending_snapshots.project_id
+            AND t.id < trending_snapshots.id
+        )
+    """)
+    op.execute("""
+        UPDATE fetch_runs
+        SET row_count = (SELECT COUNT(*) FROM trending_snapshots WHERE trending_snapshots.run_id = fetch_runs.id)
+    """)
+
+    with op.batch_alter_table('fetch_runs') as batch_op:
+        batch_op.alter_column('run_date', existing_type=sa.Date(), nullable=False)
+        batch_op.create_unique_constraint('uq_fetch_run_day', ['run_date', 'since', 'language'])
+
+    with op.batch_alter_table('trending_snapshots') as batch_op:
+        batch_op.create_unique_constraint('uq_snapshot_run_project', ['run_id', 'project_id'])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('trending_snapshots') as batch_op:
+        batch_op.drop_constraint('uq_snapshot_run_project', type_='unique')
+
+    with op.batch_alter_table('fetch_runs') as batch_op:
+        batch_op.drop_constraint('uq_fetch_run_day', type_='unique')
+        batch_op.drop_column('run_date')
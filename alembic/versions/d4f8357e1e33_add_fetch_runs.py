@@ -0,0 +1,68 @@
+"""Add fetch_runs table and key snapshots by run
+
+Revision ID: d4f8357e1e33
+Revises: 14248374d24d
+Create Date: 2026-10-16 20:50:12.417305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f8357e1e33'
+down_revision: Union[str, None] = '14248374d24d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('fetch_runs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('since', sa.String(length=20), nullable=False),
+    sa.Column('language', sa.String(length=100), nullable=False),
+    sa.Column('fetched_at', sa.DateTime(), nullable=False),
+    sa.Column('row_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_fetch_runs_id'), 'fetch_runs', ['id'], unique=False)
+    op.create_index('idx_run_since_language_fetched', 'fetch_runs', ['since', 'language', 'fetched_at'], unique=False)
+
+    with op.batch_alter_table('trending_snapshots') as batch_op:
+        batch_op.add_column(sa.Column('run_id', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_trending_snapshots_run_id', 'fetch_runs', ['run_id'], ['id'], ondelete='CASCADE'
+        )
+        batch_op.create_index('idx_run_rank', ['run_id', 'rank'], unique=False)
+
+    # Every save_to_database call stamped its snapshots with one timestamp,
+    # so each distinct snapshot date is one historical (daily, all languages) run
+    op.execute("""
+        INSERT INTO fetch_runs (since, language, fetched_at, row_count, created_at)
+        SELECT 'daily', '', date, COUNT(*), MIN(created_at)
+        FROM trending_snapshots
+        GROUP BY date
+        ORDER BY date
+    """)
+    op.execute("""
+        UPDATE trending_snapshots
+        SET run_id = (
+            SELECT fetch_runs.id FROM fetch_runs
+            WHERE fetch_runs.fetched_at = trending_snapshots.date
+        )
+        WHERE run_id IS NULL
+    """)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('trending_snapshots') as batch_op:
+        batch_op.drop_index('idx_run_rank')
+        batch_op.drop_constraint('fk_trending_snapshots_run_id', type_='foreignkey')
+        batch_op.drop_column('run_id')
+
+    op.drop_index('idx_run_since_language_fetched', table_name='fetch_runs')
+    op.drop_index(op.f('ix_fetch_runs_id'), table_name='fetch_runs')
+    op.drop_table('fetch_runs')
@@ -0,0 +1,136 @@
+"""Load-test /api/trending with concurrent clients, sync vs async database access
+
+Usage: python -m benchmarks.bench_api_load [--clients 32] [--requests 2000] [--slow-every 50]
+
+Runs the same request mix against two apps in-process (httpx over ASGI,
+response cache disabled): the "sync" app is the endpoint as it was before
+the async port (a blocking Session inside an async route), the "async"
+app is src.api. Every --slow-every-th request goes to /slow, which runs
+a deliberately slow query, to show whether one slow query stalls the
+other in-flight requests. Prints throughput and latency percentiles of the
+/api/trending requests.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from benchmarks.common import make_repos, use_scratch_environment
+
+# Enough pooled connections for every client: a blocking handler that waits
+# for a connection would otherwise deadlock the event loop
+use_scratch_environment(API_CACHE_BACKEND='none', DB_MAX_OVERFLOW='100')
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from src.api import TrendingResponse, app as async_app  # noqa: E402
+from src.database.base import SessionLocal, get_async_db, get_async_engine, get_db, init_db  # noqa: E402
+from src.database.ingest import bulk_ingest  # noqa: E402
+from src.database.models import Project, TrendingSnapshot  # noqa: E402
+
+SLOW_QUERY = text(
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < :n) SELECT count(*) FROM c"
+)
+
+sync_app = FastAPI()
+
+
+@sync_app.get("/api/trending", response_model=List[TrendingResponse])
+async def sync_trending(limit: int = 30, language: str | None = None, db: Session = Depends(get_db)):
+    query = db.query(TrendingSnapshot).join(Project).order_by(
+        TrendingSnapshot.date.desc(),
+        TrendingSnapshot.rank
+    )
+    if language:
+        query = query.filter(Project.language == language)
+    return [{
+        "rank": snapshot.rank,
+        "project": snapshot.project,
+        "stars_at_snapshot": snapshot.stars_at_snapshot,
+        "date": snapshot.date
+    } for snapshot in query.limit(limit).all()]
+
+
+@sync_app.get("/slow")
+async def sync_slow(n: int, db: Session = Depends(get_db)):
+    return {"count": db.execute(SLOW_QUERY, {"n": n}).scalar()}
+
+
+@async_app.get("/slow", include_in_schema=False)
+async def async_slow(n: int, db: AsyncSession = Depends(get_async_db)):
+    return {"count": (await db.execute(SLOW_QUERY, {"n": n})).scalar()}
+
+
+def seed(days: int, rows: int):
+    init_db()
+    db = SessionLocal()
+    try:
+        for day in range(days):
+            bulk_ingest(db, make_repos(rows), snapshot_date=datetime(2024, 1, 1, 10) + timedelta(days=day))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def load(app, clients: int, requests: int, slow_every: int, slow_n: int):
+    """Issue ``requests`` from ``clients`` concurrent workers; returns (trending latencies, seconds)"""
+    latencies = []
+    counter = iter(range(requests))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            for i in counter:
+                slow = slow_every and i % slow_every == slow_every - 1
+                start = time.perf_counter()
+                if slow:
+                    response = await client.get("/slow", params={"n": slow_n})
+                else:
+                    response = await client.get("/api/trending", params={"limit": 30})
+                response.raise_for_status()
+                if not slow:
+                    latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def percentile(values, fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def run(args):
+    print(f"{'app':<6} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for name, app in (('sync', sync_app), ('async', async_app)):
+        # Warm-up: open the pooled connections before measuring
+        await load(app, args.clients, args.clients * 4, 0, 0)
+        latencies, elapsed = await load(app, args.clients, args.requests, args.slow_every, args.slow_n)
+        ms = [latency * 1000 for latency in latencies]
+        print(f"{name:<6} {args.requests / elapsed:>7,.0f} {statistics.median(ms):>8.1f} "
+              f"{percentile(ms, 0.95):>8.1f} {percentile(ms, 0.99):>8.1f} {max(ms):>8.1f}")
+    await get_async_engine().dispose()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--slow-every', type=int, default=50, help="Send every Nth request to /slow (0: never)")
+    parser.add_argument('--slow-n', type=int, default=1000000, help="Rows the slow query counts through")
+    parser.add_argument('--days', type=int, default=30, help="Days of trending data to seed")
+    parser.add_argument('--rows', type=int, default=100, help="Repositories per seeded day")
+    args = parser.parse_args(argv)
+
+    seed(args.days, args.rows)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
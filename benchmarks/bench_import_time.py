@@ -0,0 +1,50 @@
+"""Benchmark the cold-start import time of main.py, scheduler.py and src.api
+
+Usage: python -m benchmarks.bench_import_time [--runs 10]
+
+Each entry point and its third-party baseline (src.import_budget.BASELINES)
+is imported --runs times in fresh interpreters under -X importtime. Prints
+min/median/max, the budget the test suite enforces, and the heaviest
+direct imports of the fastest run.
+"""
+import argparse
+import statistics
+
+from src.import_budget import BASELINES, ENTRY_POINTS, measure, relative_budget, startup_modules
+
+
+def sample(statement: str, runs: int, startup):
+    timings, heaviest = [], []
+    for _ in range(runs):
+        milliseconds, modules, error = measure(statement, runs=1, startup=startup)
+        if error:
+            raise SystemExit(f"{statement!r} failed: {error}")
+        if not timings or milliseconds < min(timings):
+            heaviest = modules
+        timings.append(milliseconds)
+    return timings, heaviest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    startup = startup_modules()
+    print(f"{'entry point':<12} {'min ms':>7} {'median':>7} {'max':>7} {'baseline':>9} {'budget':>7}")
+    details = []
+    for name, statement in ENTRY_POINTS.items():
+        baseline, _ = sample(BASELINES[name], args.runs, startup)
+        timings, heaviest = sample(statement, args.runs, startup)
+        print(f"{name:<12} {min(timings):>7.0f} {statistics.median(timings):>7.0f} {max(timings):>7.0f} "
+              f"{min(baseline):>9.0f} {relative_budget(min(baseline)):>7.0f}")
+        details.append((name, heaviest))
+
+    for name, heaviest in details:
+        print(f"\nheaviest imports of {name}:")
+        for module, milliseconds in heaviest:
+            print(f"  {milliseconds:7.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark bulk_ingest against the old per-row ORM ingest
+
+Usage: python -m benchmarks.bench_ingest [--rows 30 1000 100000] [--baseline-max 10000]
+
+Every size is ingested into a fresh SQLite database, once as new projects
+and once more as updates of the same projects, and reported in rows/sec.
+The per-row baseline is the loop save_to_database used before bulk_ingest:
+one SELECT per repository, a flush per new project and one snapshot added
+at a time.
+"""
+import argparse
+import time
+from datetime import datetime
+
+from benchmarks.common import make_repos, use_scratch_environment
+
+use_scratch_environment()
+
+from sqlalchemy import text  # noqa: E402
+from src.database.base import Base, SessionLocal, engine  # noqa: E402
+from src.database.ingest import bulk_ingest  # noqa: E402
+from src.database.models import FetchRun, Project, TrendingSnapshot  # noqa: E402
+from src.database.search import DROP_SEARCH_INDEX_DDL  # noqa: E402
+
+
+def reset_database():
+    with engine.begin() as conn:
+        for statement in DROP_SEARCH_INDEX_DDL:
+            conn.execute(text(statement))
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def per_row_ingest(db, trending_data, snapshot_date):
+    run = FetchRun(
+        since="daily", language="", run_date=snapshot_date.date(),
+        fetched_at=snapshot_date, row_count=len(trending_data)
+    )
+    db.add(run)
+    db.flush()
+    for repo_data in trending_data:
+        project = db.query(Project).filter(Project.full_name == repo_data['full_name']).first()
+        if project:
+            project.stars = repo_data['stars']
+            project.description = repo_data['description']
+            project.updated_at = datetime.now()
+        else:
+            project = Project(
+                name=repo_data['name'],
+                full_name=repo_data['full_name'],
+                description=repo_data['description'],
+                language=repo_data['language'],
+                stars=repo_data['stars'],
+                url=repo_data['url'],
+                created_at=datetime.now()
+            )
+            db.add(project)
+            db.flush()
+        db.add(TrendingSnapshot(
+            date=snapshot_date,
+            project_id=project.id,
+            run_id=run.id,
+            stars_at_snapshot=repo_data['stars'],
+            rank=repo_data['rank'],
+            created_at=datetime.now()
+        ))
+    return len(trending_data)
+
+
+def bulk(db, trending_data, snapshot_date):
+    return bulk_ingest(db, trending_data, snapshot_date=snapshot_date)
+
+
+def rows_per_second(ingest, rows):
+    """Insert ``rows`` on day 1, then update them on day 2; returns (insert, update) rows/sec"""
+    reset_database()
+    rates = []
+    for day in (1, 2):
+        db = SessionLocal()
+        try:
+            start = time.perf_counter()
+            ingest(db, rows, datetime(2024, 1, day, 10))
+            db.commit()
+            rates.append(len(rows) / (time.perf_counter() - start))
+        finally:
+            db.close()
+    return rates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[30, 1000, 100000])
+    parser.add_argument('--baseline-max', type=int, default=10000,
+                        help="Skip the per-row baseline above this many rows (it is slow)")
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>7} {'path':<8} {'insert rows/s':>14} {'update rows/s':>14}")
+    for count in args.rows:
+        rows = make_repos(count)
+        for name, ingest in (('per-row', per_row_ingest), ('bulk', bulk)):
+            if ingest is per_row_ingest and count > args.baseline_max:
+                print(f"{count:>7} {name:<8} {'skipped':>14} {'skipped':>14}")
+                continue
+            inserted, updated = rows_per_second(ingest, rows)
+            print(f"{count:>7} {name:<8} {inserted:>14,.0f} {updated:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Benchmark the lxml and bs4 trending page parsers on the saved fixtures
+
+Usage: python -m benchmarks.bench_parsers [--repeat 50]
+
+Parses every tests/fixtures/*.html page with each backend and prints the
+median parse time per page and the number of repositories found.
+"""
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from src.fetch_data.parsers import PARSERS
+
+FIXTURES = Path(__file__).resolve().parents[1] / "tests" / "fixtures"
+
+
+def median_ms(parse, html: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(html)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    names = sorted(PARSERS)
+    print(f"{'page':<30} {'repos':>5} " + " ".join(f"{name + ' ms':>9}" for name in names))
+    for path in sorted(FIXTURES.glob("*.html")):
+        html = path.read_text(encoding="utf-8")
+        repos = len(PARSERS[names[0]](html))
+        timings = [median_ms(PARSERS[name], html, args.repeat) for name in names]
+        print(f"{path.name:<30} {repos:>5} " + " ".join(f"{ms:>9.2f}" for ms in timings))
+
+
+if __name__ == "__main__":
+    main()
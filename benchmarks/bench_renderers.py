@@ -0,0 +1,75 @@
+"""Benchmark the built-in table renderers against pandas/tabulate
+
+Usage: python -m benchmarks.bench_renderers [--rows 30 500] [--repeat 200]
+
+Prints the median render time of each format and the cold import time of
+src.generate.table_generator in a fresh interpreter.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from src.generate.table_generator import TableGenerator
+
+IMPORT_PROBE = (
+    "import sys, time; start = time.perf_counter(); import src.generate.table_generator; "
+    "print(time.perf_counter() - start, 'pandas' in sys.modules)"
+)
+
+
+def make_rows(count: int):
+    return [{
+        'rank': i,
+        'name': f"project-{i}",
+        'full_name': f"owner{i}/project-{i}",
+        'description': f"Project {i}: a fast, modern toolkit for building things & shipping them",
+        'language': ('Python', 'Rust', 'TypeScript', 'N/A')[i % 4],
+        'stars': 1000 * i + 7,
+        'url': f"https://github.com/owner{i}/project-{i}",
+        'has_summary': i % 3 == 0
+    } for i in range(1, count + 1)]
+
+
+def median_ms(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def cold_import(runs: int = 5):
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE], capture_output=True, text=True, check=True
+        ).stdout.split()
+        results.append((float(output[0]) * 1000, output[1] == "True"))
+    return min(ms for ms, _ in results), results[0][1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[30, 500])
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    builtin = TableGenerator(None)
+    pandas_gen = TableGenerator(None, use_pandas=True)
+    print(f"{'rows':>6} {'format':<9} {'built-in ms':>12} {'pandas ms':>10} {'speedup':>8}")
+    for count in args.rows:
+        rows = make_rows(count)
+        for name, method in (('markdown', 'generate_markdown_table'), ('html', 'generate_html_table'),
+                             ('csv', 'generate_csv')):
+            fast = median_ms(lambda: getattr(builtin, method)(rows), args.repeat)
+            slow = median_ms(lambda: getattr(pandas_gen, method)(rows), args.repeat)
+            print(f"{count:>6} {name:<9} {fast:>12.3f} {slow:>10.3f} {slow / fast:>7.1f}x")
+
+    ms, pandas_loaded = cold_import()
+    print(f"\ncold import of src.generate.table_generator: {ms:.0f} ms (pandas loaded: {pandas_loaded})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark concurrent scrape_many against fetching pages one at a time
+
+Usage: python -m benchmarks.bench_scrape [--languages 40] [--ranges daily weekly monthly] [--delay 0.2]
+
+Serves the saved trending page from a local stub server that waits
+--delay seconds per request (standing in for GitHub's response time), then
+scrapes every (language, range) page serially with scrape_trending and
+concurrently with scrape_many at several worker counts. Rate limiting and
+the response cache are disabled so only fetch concurrency is measured.
+"""
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from benchmarks.common import use_scratch_environment
+
+use_scratch_environment()
+
+from src.fetch_data.rate_limiter import RateLimiter  # noqa: E402
+from src.fetch_data.trending_scraper import TrendingScraper  # noqa: E402
+
+PAGE = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "trending_daily.html"
+
+
+class SlowTrending(BaseHTTPRequestHandler):
+    """Serves the saved trending page after a fixed delay"""
+
+    protocol_version = "HTTP/1.1"
+    body = PAGE.read_bytes()
+    delay = 0.0
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_scraper(url: str, workers: int) -> TrendingScraper:
+    scraper = TrendingScraper(None, max_workers=workers, rate_limiter=RateLimiter(rate=1e6, burst=10**6))
+    scraper.BASE_URL = url
+    return scraper
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--languages', type=int, default=40, help="Number of language pages per range")
+    parser.add_argument('--ranges', nargs='+', default=['daily', 'weekly', 'monthly'])
+    parser.add_argument('--delay', type=float, default=0.2, help="Seconds the stub server waits per page")
+    parser.add_argument('--workers', type=int, nargs='+', default=[4, 8, 16])
+    args = parser.parse_args(argv)
+
+    SlowTrending.delay = args.delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowTrending)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/trending"
+    languages = [f"lang{i}" for i in range(args.languages)]
+    pages = len(languages) * len(args.ranges)
+
+    try:
+        print(f"{pages} pages, {args.delay * 1000:.0f} ms per page on the server")
+        print(f"{'mode':<14} {'seconds':>8} {'pages/s':>8}")
+
+        scraper = make_scraper(url, 1)
+        start = time.perf_counter()
+        for since in args.ranges:
+            for language in languages:
+                scraper.scrape_trending(language=language, since=since)
+        elapsed = time.perf_counter() - start
+        print(f"{'serial':<14} {elapsed:>8.2f} {pages / elapsed:>8.1f}")
+
+        for workers in args.workers:
+            scraper = make_scraper(url, workers)
+            start = time.perf_counter()
+            fetched = sum(1 for _ in scraper.scrape_many(languages, args.ranges))
+            elapsed = time.perf_counter() - start
+            assert fetched == pages, f"only {fetched} of {pages} pages were scraped"
+            print(f"{f'{workers} workers':<14} {elapsed:>8.2f} {pages / elapsed:>8.1f}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
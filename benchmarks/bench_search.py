@@ -0,0 +1,69 @@
+"""Benchmark FTS5 project search against the LIKE scan it replaced
+
+Usage: python -m benchmarks.bench_search [--projects 100000] [--queries vector repo4242] [--repeat 20]
+
+Seeds --projects projects (the FTS index is filled by the insert triggers),
+then times search_stmt on SQLite (FTS5 MATCH ordered by bm25) and the LIKE
+fallback search_stmt builds for other databases, run on the same SQLite
+file. Prints the median time per query and the number of rows returned
+(LIKE matches a multi-word query as one phrase, FTS matches every word).
+"""
+import argparse
+import statistics
+import time
+from datetime import datetime
+
+from benchmarks.common import make_repos, use_scratch_environment
+
+use_scratch_environment()
+
+from src.database.base import SessionLocal, init_db  # noqa: E402
+from src.database.ingest import bulk_ingest  # noqa: E402
+from src.database.search import search_stmt  # noqa: E402
+
+SEED_BATCH = 10000
+
+
+def seed(count: int):
+    init_db()
+    repos = make_repos(count)
+    db = SessionLocal()
+    try:
+        for start in range(0, count, SEED_BATCH):
+            bulk_ingest(db, repos[start:start + SEED_BATCH], snapshot_date=datetime(2024, 1, 1, 10))
+        db.commit()
+    finally:
+        db.close()
+
+
+def measure(db, statement, repeat: int):
+    timings, rows = [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = len(db.execute(statement).all())
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000, rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--projects', type=int, default=100000)
+    parser.add_argument('--queries', nargs='+', default=['vector', 'kubernetes inference', 'repo4242'])
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    seed(args.projects)
+    db = SessionLocal()
+    try:
+        print(f"{'query':<22} {'fts ms':>8} {'rows':>5} {'like ms':>8} {'rows':>5} {'speedup':>8}")
+        for q in args.queries:
+            fts_ms, fts_rows = measure(db, search_stmt(q, 'sqlite', limit=args.limit), args.repeat)
+            like_ms, like_rows = measure(db, search_stmt(q, 'like', limit=args.limit), args.repeat)
+            print(f"{q:<22} {fts_ms:>8.2f} {fts_rows:>5} {like_ms:>8.2f} {like_rows:>5} {like_ms / fts_ms:>7.1f}x")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Benchmark concurrent readers and an ingest writer under each SQLite profile
+
+Usage: python -m benchmarks.bench_sqlite_profile [--readers 8] [--seconds 5] [--rows 1000]
+
+For the "default" and "performance" SQLITE_PROFILE, a fresh database file
+is seeded, then reader processes repeatedly load the latest daily run (the
+/api/trending query) while one writer process bulk-ingests a new day of
+--rows repositories per transaction. Prints reads/sec, ingests/sec, reader
+latency and the number of "database is locked" errors.
+"""
+import argparse
+import multiprocessing
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import make_repos, use_scratch_environment
+
+SCRATCH = use_scratch_environment()
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from src.config.settings import settings  # noqa: E402
+from src.database.base import Base, configure_sqlite, engine_options  # noqa: E402
+from src.database.ingest import bulk_ingest  # noqa: E402
+from src.database.models import FetchRun, Project, TrendingSnapshot  # noqa: E402
+from src.database.runs import latest_run_stmt  # noqa: E402
+
+FIRST_DAY = datetime(2024, 1, 1, 10)
+
+
+def make_session_factory(profile: str):
+    settings.SQLITE_PROFILE = profile
+    url = f"sqlite:///{SCRATCH / f'{profile}.db'}"
+    engine = create_engine(url, **engine_options(url))
+    configure_sqlite(engine)
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(autoflush=False, bind=engine)
+
+
+def read_trending(db):
+    run_id = db.execute(latest_run_stmt(since="daily").with_only_columns(FetchRun.id)).scalar()
+    return db.execute(
+        select(TrendingSnapshot.rank, Project.full_name, Project.stars)
+        .join(Project, TrendingSnapshot.project_id == Project.id)
+        .where(TrendingSnapshot.run_id == run_id)
+        .order_by(TrendingSnapshot.rank)
+        .limit(30)
+    ).all()
+
+
+def reader(profile: str, stop, results):
+    engine, Session = make_session_factory(profile)
+    latencies, errors = [], []
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            with Session() as db:
+                read_trending(db)
+        except OperationalError as e:
+            errors.append(str(e.orig))
+            continue
+        latencies.append(time.perf_counter() - start)
+    engine.dispose()
+    results.put(('reader', latencies, errors))
+
+
+def writer(profile: str, rows: int, stop, results):
+    engine, Session = make_session_factory(profile)
+    repos = make_repos(rows)
+    ingests, errors = 0, []
+    day = 1
+    while not stop.is_set():
+        for repo in repos:
+            repo['stars'] += 1
+        try:
+            with Session() as db:
+                bulk_ingest(db, repos, snapshot_date=FIRST_DAY + timedelta(days=day))
+                db.commit()
+            ingests += 1
+            day += 1
+        except OperationalError as e:
+            errors.append(str(e.orig))
+    engine.dispose()
+    results.put(('writer', ingests, errors))
+
+
+def run_profile(profile: str, readers: int, seconds: float, rows: int):
+    engine, Session = make_session_factory(profile)
+    with Session() as db:
+        bulk_ingest(db, make_repos(rows), snapshot_date=FIRST_DAY)
+        db.commit()
+    engine.dispose()
+
+    # Processes rather than threads, so the GIL does not serialize readers and writer
+    stop = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=reader, args=(profile, stop, results)) for _ in range(readers)]
+    processes.append(multiprocessing.Process(target=writer, args=(profile, rows, stop, results)))
+    for process in processes:
+        process.start()
+    time.sleep(seconds)
+    stop.set()
+
+    latencies, errors, ingests = [], [], 0
+    for _ in processes:
+        kind, value, process_errors = results.get()
+        if kind == 'reader':
+            latencies.extend(value)
+        else:
+            ingests = value
+        errors.extend(process_errors)
+    for process in processes:
+        process.join()
+
+    latencies.sort()
+    return {
+        'reads': len(latencies) / seconds,
+        'ingests': ingests / seconds,
+        'p50': statistics.median(latencies) * 1000 if latencies else float('nan'),
+        'p99': latencies[int(len(latencies) * 0.99)] * 1000 if latencies else float('nan'),
+        'locked': sum('locked' in error for error in errors),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--rows', type=int, default=1000, help="Repositories per ingest transaction")
+    args = parser.parse_args(argv)
+
+    print(f"{'profile':<12} {'reads/s':>9} {'ingests/s':>10} {'read p50 ms':>12} {'read p99 ms':>12} {'locked':>7}")
+    for profile in ('default', 'performance'):
+        result = run_profile(profile, args.readers, args.seconds, args.rows)
+        print(f"{profile:<12} {result['reads']:>9,.0f} {result['ingests']:>10.1f} "
+              f"{result['p50']:>12.2f} {result['p99']:>12.2f} {result['locked']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark the get_trending query and serialization at several page sizes
+
+Usage: python -m benchmarks.bench_trending [--limits 30 500 5000] [--repeat 20]
+
+Compares the endpoint as it was before the joined-column path (ORM
+snapshots with lazy-loaded projects, validated and dumped through the
+TrendingResponse model) with the current _trending_rows + orjson path.
+Prints the median time and the number of SQL statements per call.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime
+from typing import List
+
+from benchmarks.common import make_repos, use_scratch_environment
+
+use_scratch_environment()
+
+import orjson  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from src.api import TrendingResponse, _trending_rows  # noqa: E402
+from src.database.base import SessionLocal, engine, get_async_engine, get_async_sessionmaker, init_db  # noqa: E402
+from src.database.ingest import bulk_ingest  # noqa: E402
+from src.database.models import Project, TrendingSnapshot  # noqa: E402
+
+TRENDING_LIST = TypeAdapter(List[TrendingResponse])
+
+
+class StatementCounter:
+    """Count statements executed on an engine"""
+
+    def __init__(self, *engines):
+        self.count = 0
+        for target in engines:
+            event.listen(target, "before_cursor_execute", self._count)
+
+    def _count(self, *args):
+        self.count += 1
+
+
+def orm_trending(db, limit: int) -> bytes:
+    snapshots = db.query(TrendingSnapshot).join(Project).order_by(
+        TrendingSnapshot.date.desc(),
+        TrendingSnapshot.rank
+    ).limit(limit).all()
+    # What FastAPI does with response_model: validate, then serialize
+    return TRENDING_LIST.dump_json(TRENDING_LIST.validate_python([{
+        "rank": snapshot.rank,
+        "project": snapshot.project,
+        "stars_at_snapshot": snapshot.stars_at_snapshot,
+        "date": snapshot.date
+    } for snapshot in snapshots]))
+
+
+async def measure_joined(limit: int, repeat: int, counter: StatementCounter):
+    timings, statements = [], 0
+    async with get_async_sessionmaker()() as db:
+        for _ in range(repeat):
+            before = counter.count
+            start = time.perf_counter()
+            orjson.dumps(await _trending_rows(db, limit, None))
+            timings.append(time.perf_counter() - start)
+            statements = counter.count - before
+    return statistics.median(timings) * 1000, statements
+
+
+def measure_orm(limit: int, repeat: int, counter: StatementCounter):
+    timings, statements = [], 0
+    for _ in range(repeat):
+        # A new session per call, as per request, so projects are not cached in the identity map
+        db = SessionLocal()
+        try:
+            before = counter.count
+            start = time.perf_counter()
+            orm_trending(db, limit)
+            timings.append(time.perf_counter() - start)
+            statements = counter.count - before
+        finally:
+            db.close()
+    return statistics.median(timings) * 1000, statements
+
+
+async def run(args):
+    counter = StatementCounter(engine, get_async_engine().sync_engine)
+    print(f"{'limit':>6} {'orm ms':>9} {'queries':>8} {'joined ms':>10} {'queries':>8} {'speedup':>8}")
+    for limit in args.limits:
+        orm_ms, orm_queries = measure_orm(limit, args.repeat, counter)
+        joined_ms, joined_queries = await measure_joined(limit, args.repeat, counter)
+        print(f"{limit:>6} {orm_ms:>9.2f} {orm_queries:>8} {joined_ms:>10.2f} {joined_queries:>8} "
+              f"{orm_ms / joined_ms:>7.1f}x")
+    await get_async_engine().dispose()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--limits', type=int, nargs='+', default=[30, 500, 5000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    init_db()
+    db = SessionLocal()
+    try:
+        bulk_ingest(db, make_repos(max(args.limits)), snapshot_date=datetime(2024, 1, 1, 10))
+        db.commit()
+    finally:
+        db.close()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Setup shared by the benchmark scripts"""
+import os
+import tempfile
+from pathlib import Path
+
+WORDS = (
+    "fast", "async", "database", "python", "rust", "compiler", "agent", "llm", "vector", "search",
+    "framework", "web", "server", "cli", "terminal", "editor", "graph", "query", "engine", "cache",
+    "stream", "parser", "kubernetes", "cloud", "model", "training", "inference", "browser", "ui", "game",
+)
+
+
+def use_scratch_environment(**overrides) -> Path:
+    """
+    Point the database and every cache at a new temporary directory
+
+    Settings are read at import time, so call this before importing any
+    src module.
+
+    Args:
+        overrides: Extra environment variables (e.g. SQLITE_PROFILE="default")
+
+    Returns:
+        The temporary directory
+    """
+    tmp = Path(tempfile.mkdtemp(prefix="gh_trending_bench_"))
+    os.environ.update({
+        'DATABASE_URL': f"sqlite:///{tmp / 'bench.db'}",
+        'SCRAPER_CACHE_DIR': '',
+        'SCRAPER_ARCHIVE_DIR': '',
+        'INGEST_LOCK_PATH': str(tmp / 'ingest.lock'),
+        'API_CACHE_PATH': str(tmp / 'api_cache.db'),
+        'REPORT_CACHE_DIR': str(tmp / 'reports'),
+        'OPENAI_API_KEY': '',
+        'LOG_LEVEL': 'WARNING',
+    })
+    os.environ.update(overrides)
+    return tmp
+
+
+def make_repos(count: int, prefix: str = "owner"):
+    """Scraped repository dictionaries shaped like the parsers' output"""
+    return [{
+        'rank': i,
+        'name': f"repo{i}",
+        'full_name': f"{prefix}/repo{i}",
+        'owner': prefix,
+        'description': " ".join(WORDS[(i * k) % len(WORDS)] for k in (1, 7, 11, 13)),
+        'language': ('Python', 'Rust', 'TypeScript', 'Go')[i % 4],
+        'stars': 100000 - i,
+        'url': f"https://github.com/{prefix}/repo{i}",
+    } for i in range(1, count + 1)]
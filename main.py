@@ -3,7 +3,9 @@
 GitHub Trending Analysis Tool - Main Entry Point
 """
 import sys
+import argparse
 import logging
+from datetime import datetime
 from src.config.settings import settings
 
 
@@ -19,14 +21,181 @@ def setup_logging():
     )
 
 
-def main():
+def _parse_date(value: str):
+    """Parse a YYYY-MM-DD command line argument"""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date '{value}', expected YYYY-MM-DD")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
+    parser = argparse.ArgumentParser(description="GitHub Trending Analysis Tool")
+    subparsers = parser.add_subparsers(dest='command')
+
+    backfill = subparsers.add_parser('backfill', help="Re-parse archived trending pages into the database")
+    backfill.add_argument('--from', dest='date_from', type=_parse_date, required=True, help="First day (YYYY-MM-DD)")
+    backfill.add_argument('--to', dest='date_to', type=_parse_date, required=True, help="Last day (YYYY-MM-DD)")
+    backfill.add_argument('--workers', type=int, default=None, help="Parser processes (default: CPU count)")
+    backfill.add_argument('--parser', choices=['lxml', 'bs4'], default=None, help="Page parser backend")
+
+    compact = subparsers.add_parser('compact', help="Remove duplicate same-day trending snapshots")
+    compact.add_argument('--batch-size', type=int, default=1000, help="Rows deleted per transaction")
+
+    subparsers.add_parser('search-rebuild', help="Rebuild the project full-text search index")
+
+    export = subparsers.add_parser('export', help="Stream the dataset to CSV, NDJSON or Parquet files")
+    export.add_argument('--format', choices=['csv', 'ndjson', 'parquet'], default='csv', help="Output format")
+    export.add_argument('--tables', nargs='+', choices=['projects', 'runs', 'snapshots', 'summaries'],
+                        default=['projects', 'runs', 'snapshots', 'summaries'], help="Tables to export")
+    export.add_argument('--output-dir', default='exports', help="Directory for <table>.<format> files")
+    export.add_argument('--from', dest='date_from', type=_parse_date, default=None, help="First day (YYYY-MM-DD)")
+    export.add_argument('--to', dest='date_to', type=_parse_date, default=None, help="Last day (YYYY-MM-DD)")
+    export.add_argument('--batch-size', type=int, default=10000, help="Rows fetched per batch")
+
+    reports = subparsers.add_parser('reports', help="Generate the daily reports of a date range in parallel")
+    reports.add_argument('--from', dest='date_from', type=_parse_date, required=True, help="First day (YYYY-MM-DD)")
+    reports.add_argument('--to', dest='date_to', type=_parse_date, required=True, help="Last day (YYYY-MM-DD)")
+    reports.add_argument('--workers', type=int, default=None, help="Report processes (default: CPU count)")
+    reports.add_argument('--output-dir', default='reports', help="Directory for trending_report_<date>.md files")
+    reports.add_argument('--no-analysis', action='store_true', help="Leave out the trend analysis")
+    reports.add_argument('--no-commentary', action='store_true', help="Leave out the AI commentary")
+
+    import_budget = subparsers.add_parser(
+        'import-budget', help="Check the startup import time of main.py, scheduler.py and the API"
+    )
+    import_budget.add_argument('--runs', type=int, default=5, help="Fresh interpreters per entry point")
+
+    return parser
+
+
+def run_backfill(args):
+    """Run the archive backfill command"""
+    from src.database.base import SessionLocal
+    from src.fetch_data.backfill import backfill_archive
+    from src.jobs import ingest_lock
+
+    db = SessionLocal()
+    try:
+        with ingest_lock():
+            return backfill_archive(db, args.date_from, args.date_to, workers=args.workers, parser=args.parser)
+    finally:
+        db.close()
+
+
+def run_compact(args):
+    """Run the duplicate snapshot compaction command"""
+    from src.database.base import SessionLocal
+    from src.database.maintenance import compact_snapshots
+    from src.jobs import ingest_lock
+
+    db = SessionLocal()
+    try:
+        with ingest_lock():
+            return compact_snapshots(db, batch_size=args.batch_size)
+    finally:
+        db.close()
+
+
+def run_search_rebuild(args):
+    """Run the search index rebuild command"""
+    from src.database.base import SessionLocal
+    from src.database.search import rebuild_search_index
+
+    db = SessionLocal()
+    try:
+        return rebuild_search_index(db)
+    finally:
+        db.close()
+
+
+def run_export(args):
+    """Run the dataset export command"""
+    from pathlib import Path
+    from src.database.base import SessionLocal
+    from src.export import EXPORT_FORMATS, export_table
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    extension = EXPORT_FORMATS[args.format][0]
+
+    db = SessionLocal()
+    try:
+        for name in args.tables:
+            path = output_dir / f"{name}.{extension}"
+            with open(path, 'wb') as f:
+                for chunk in export_table(db, name, args.format, args.date_from, args.date_to, args.batch_size):
+                    f.write(chunk)
+            logging.getLogger(__name__).info(f"Exported {name} to {path}")
+    finally:
+        db.close()
+
+
+def run_reports(args):
+    """Run the date-range report build command"""
+    from src.database.base import SessionLocal
+    from src.generate.report_backfill import build_reports
+
+    db = SessionLocal()
+    try:
+        return build_reports(
+            db, args.date_from, args.date_to,
+            output_dir=args.output_dir,
+            workers=args.workers,
+            include_analysis=not args.no_analysis,
+            include_commentary=not args.no_commentary
+        )
+    finally:
+        db.close()
+
+
+def run_import_budget(args):
+    """Run the import-time budget check; returns True if every entry point is within budget"""
+    from src.import_budget import check_import_budgets, format_report
+
+    timings = check_import_budgets(runs=args.runs)
+    print(format_report(timings))
+    return all(timing.ok for timing in timings)
+
+
+def main(argv=None):
     """Main application entry point"""
+    args = build_parser().parse_args(argv)
     setup_logging()
     logger = logging.getLogger(__name__)
 
     try:
         # Validate environment configuration
         settings.validate()
+
+        if args.command == 'backfill':
+            count = run_backfill(args)
+            logger.info(f"Backfilled {count} trending snapshots")
+            return
+
+        if args.command == 'compact':
+            run_compact(args)
+            return
+
+        if args.command == 'search-rebuild':
+            run_search_rebuild(args)
+            return
+
+        if args.command == 'export':
+            run_export(args)
+            return
+
+        if args.command == 'reports':
+            paths = run_reports(args)
+            logger.info(f"Wrote {len(paths)} reports to {args.output_dir}")
+            return
+
+        if args.command == 'import-budget':
+            if not run_import_budget(args):
+                sys.exit(1)
+            return
+
         logger.info("GitHub Trending Analysis Tool started successfully")
         logger.info(f"Debug mode: {settings.DEBUG}")
 
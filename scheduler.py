@@ -7,9 +7,7 @@ import schedule
 import time
 from datetime import datetime
 from src.config.settings import settings
-from src.database.base import SessionLocal
-from src.summarize import ProjectSummarizer
-from src.generate import ReportGenerator
+from src.jobs import ingest_lock
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,27 +19,37 @@ logger = logging.getLogger(__name__)
 def daily_job():
     """Single daily job - fetch, summarize, and generate report"""
     logger.info("Starting daily GitHub trending job...")
+    # Imported here so the long-running scheduler starts without SQLAlchemy
+    from src.database.base import SessionLocal
     db = SessionLocal()
 
     try:
-        # 1. Fetch trending repositories
+        # 1. Fetch trending repositories (waits for any API-triggered fetch)
         logger.info("Fetching trending repositories...")
         from src.fetch_data import TrendingScraper
         scraper = TrendingScraper(db)
-        count = scraper.fetch_and_save(since="daily")
+        with ingest_lock():
+            count = scraper.fetch_and_save_many(
+                languages=settings.SCRAPER_LANGUAGES,
+                ranges=settings.SCRAPER_RANGES
+            )
         logger.info(f"Fetched {count} trending repositories")
 
         # 2. Generate AI summaries (optional, limited to save costs)
         logger.info("Generating summaries for new projects...")
+        from src.summarize import ProjectSummarizer
         summarizer = ProjectSummarizer(db)
         summary_count = summarizer.batch_summarize(limit=5)  # Only 5 to save costs
         logger.info(f"Generated {summary_count} summaries")
 
         # 3. Generate daily report
         logger.info("Generating daily report...")
+        from src.generate import ReportGenerator
         report_gen = ReportGenerator(db)
         filepath = report_gen.generate_and_save()
         logger.info(f"Report generated: {filepath}")
+        if report_gen.cache is not None:
+            report_gen.cache.prune()
 
         logger.info("Daily job completed successfully!")
 
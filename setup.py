@@ -32,19 +32,27 @@ setup(
         "PyGithub>=2.1.1",
         "openai>=1.12.0",
         "SQLAlchemy>=2.0.25",
+        "aiosqlite>=0.20.0",
         "alembic>=1.13.1",
         "fastapi>=0.109.2",
         "uvicorn>=0.27.1",
+        "orjson>=3.9.15",
         "python-dotenv>=1.0.1",
-        "pandas>=2.2.0",
-        "tabulate>=0.9.0",
         "requests>=2.31.0",
         "python-dateutil>=2.8.2",
     ],
     extras_require={
+        "parquet": [
+            "pyarrow>=15.0.0",
+        ],
+        "pandas": [
+            "pandas>=2.2.0",
+            "tabulate>=0.9.0",
+        ],
         "dev": [
-            "pytest>=8.0.0",
+            "pytest>=7.4.4,<8",
             "pytest-asyncio>=0.23.4",
+            "httpx>=0.26,<0.28",
         ],
     },
     entry_points={
@@ -1,17 +1,31 @@
 """FastAPI backend for GitHub Trending"""
-from fastapi import FastAPI, Depends, HTTPException
+import asyncio
+from fastapi import FastAPI, Depends, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
-from datetime import datetime
-from typing import List
-from pydantic import BaseModel
+from fastapi.responses import FileResponse, HTMLResponse, Response, StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime
+import orjson
+from typing import AsyncIterator, Awaitable, Callable, List, Literal, Tuple
+from pydantic import BaseModel, TypeAdapter
 
-from src.database.base import get_db
-from src.database.models import Project, TrendingSnapshot, Summary
-from src.fetch_data import TrendingScraper
-from src.generate import TableGenerator, ReportGenerator
+from src.api_cache import CachedResponse, DataVersionTracker, create_response_cache, make_etag
+from src.config.settings import settings
+from src.database.base import SessionLocal, get_async_db, get_async_engine, get_async_sessionmaker
+from src.database.history import decode_cursor, encode_cursor, snapshot_page_stmt, snapshot_row_to_dict
+from src.database.models import FetchRun, Project, TrendingSnapshot, Summary
+from src.database.profiler import ProfilerMiddleware
+from src.database.runs import get_run_for_date, latest_run_stmt
+from src.database.search import match_query, search_row_to_dict, search_stmt
+from src.events import RunBroadcaster
+from src.export import EXPORT_FORMATS, EXPORT_TABLES, export_table
+from src.generate import TableGenerator
+from src.generate.report_cache import ReportCache
+from src.jobs import JobQueue, ingest_lock
+from src.metrics import MetricsMiddleware, REPORT_STAGE, registry
 
 app = FastAPI(title="GitHub Trending API", version="0.1.0")
 
@@ -24,6 +38,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON and HTML bodies for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=settings.API_GZIP_MIN_SIZE)
+
+if settings.SQL_PROFILE:
+    app.add_middleware(ProfilerMiddleware)
+
+# Outermost, so latency includes compression
+app.add_middleware(MetricsMiddleware)
+
+data_version = DataVersionTracker(settings.API_CACHE_VERSION_CHECK_INTERVAL)
+response_cache = create_response_cache()
+job_queue = JobQueue()
+broadcaster = RunBroadcaster()
+report_cache = ReportCache() if settings.REPORT_CACHE_ENABLED else None
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop the job pool and close pooled async connections"""
+    # aiosqlite connections run on non-daemon threads and would keep the process alive
+    job_queue.shutdown(wait=False)
+    await get_async_engine().dispose()
+
 
 # Pydantic models
 class ProjectResponse(BaseModel):
@@ -46,6 +83,95 @@ class TrendingResponse(BaseModel):
     date: datetime
 
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client already holds the representation ``etag`` (weak comparison)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return opaque in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+
+
+def _validator_headers(etag: str) -> dict:
+    # Caches must not hand a gzipped body to a client that did not ask for it
+    return {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=_validator_headers(etag))
+
+
+async def _revalidate(request: Request, db: AsyncSession, variant: str = "") -> Tuple[int, str, bool]:
+    """
+    Compute the ETag of a read-only endpoint and compare it with If-None-Match
+
+    While the data version read is fresh, a matching If-None-Match is
+    detected before the database is touched.
+
+    Args:
+        request: Incoming request
+        db: Async database session
+        variant: Extra input the response depends on besides the data
+
+    Returns:
+        (data version, ETag, whether the client's copy is current)
+    """
+    version = data_version.cached()
+    if version is not None:
+        etag = make_etag(request, version, variant)
+        if _etag_matches(request, etag):
+            return version, etag, True
+
+    version = await data_version.current(db)
+    etag = make_etag(request, version, variant)
+    return version, etag, _etag_matches(request, etag)
+
+
+async def _cached_response(
+    request: Request,
+    db: AsyncSession,
+    build: Callable[[], Awaitable[CachedResponse]],
+    variant: str = ""
+) -> Response:
+    """
+    Serve a read-only endpoint with ETag revalidation and the response cache
+
+    Args:
+        request: Incoming request (path and query form the cache key)
+        db: Async database session
+        build: Coroutine producing the serialized response on a miss
+        variant: Extra input the response depends on besides the data,
+            part of both the ETag and the cache key
+
+    Returns:
+        304 response, or a response with the cached or freshly built body
+    """
+    version, etag, not_modified = await _revalidate(request, db, variant)
+    if not_modified:
+        return _not_modified(etag)
+
+    if response_cache is None:
+        cached = await build()
+    else:
+        key = response_cache.key_for(request, version, variant)
+        cached = response_cache.get(key)
+        if cached is None:
+            cached = await build()
+            response_cache.set(key, cached)
+    return Response(
+        content=cached.body,
+        media_type=cached.media_type,
+        headers=_validator_headers(etag)
+    )
+
+
+def _json(model_type, value) -> CachedResponse:
+    """Serialize a response model to a cacheable JSON body"""
+    return CachedResponse(body=TypeAdapter(model_type).dump_json(value), media_type="application/json")
+
+
 @app.get("/")
 async def root():
     return {"message": "GitHub Trending API", "version": "0.1.0"}
@@ -53,46 +179,253 @@ async def root():
 
 @app.get("/api/trending", response_model=List[TrendingResponse])
 async def get_trending(
+    request: Request,
     limit: int = 30,
     language: str | None = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get current trending repositories"""
-    query = db.query(TrendingSnapshot).join(Project).order_by(
-        TrendingSnapshot.date.desc(),
-        TrendingSnapshot.rank
-    )
+    async def build():
+        rows = await _trending_rows(db, limit, language)
+        return CachedResponse(body=orjson.dumps(rows), media_type="application/json")
 
-    if language:
-        query = query.filter(Project.language == language)
+    return await _cached_response(request, db, build)
+
+
+async def _trending_rows(db: AsyncSession, limit: int, language: str | None) -> list:
+    """
+    Load the latest daily run's snapshots with their projects
+
+    Selects plain columns in one joined query and returns dicts shaped like
+    TrendingResponse, so no ORM objects or Pydantic models are built.
+    """
+    latest_run = (await db.execute(
+        latest_run_stmt(since="daily").with_only_columns(FetchRun.id)
+    )).scalar()
+    if latest_run is None:
+        return []
 
-    snapshots = query.limit(limit).all()
+    query = select(
+        TrendingSnapshot.rank,
+        TrendingSnapshot.stars_at_snapshot,
+        TrendingSnapshot.date,
+        Project.id,
+        Project.name,
+        Project.full_name,
+        Project.description,
+        Project.language,
+        Project.stars,
+        Project.url
+    ).join(Project, TrendingSnapshot.project_id == Project.id).where(
+        TrendingSnapshot.run_id == latest_run
+    ).order_by(TrendingSnapshot.rank)
 
-    results = []
-    for snapshot in snapshots:
-        results.append({
-            "rank": snapshot.rank,
-            "project": snapshot.project,
-            "stars_at_snapshot": snapshot.stars_at_snapshot,
-            "date": snapshot.date
-        })
+    if language:
+        query = query.where(Project.language == language)
+
+    rows = (await db.execute(query.limit(limit))).all()
 
-    return results
+    return [
+        {
+            "rank": rank,
+            "project": {
+                "id": project_id,
+                "name": name,
+                "full_name": full_name,
+                "description": description,
+                "language": project_language,
+                "stars": stars,
+                "url": url
+            },
+            "stars_at_snapshot": stars_at_snapshot,
+            "date": date
+        }
+        for (rank, stars_at_snapshot, date, project_id, name, full_name,
+             description, project_language, stars, url) in rows
+    ]
 
 
 @app.get("/api/projects/{project_id}", response_model=ProjectResponse)
-async def get_project(project_id: int, db: Session = Depends(get_db)):
+async def get_project(project_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
     """Get project details"""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    async def build():
+        project = await db.get(Project, project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return _json(ProjectResponse, ProjectResponse.model_validate(project))
+
+    return await _cached_response(request, db, build)
+
+
+async def _stream_snapshots(filters: dict, after) -> AsyncIterator[bytes]:
+    """
+    Stream snapshots as NDJSON in keyset batches
+
+    Uses its own session because request-scoped dependencies are closed
+    before a streaming body is sent. Only one batch is held in memory.
+    """
+    batch_size = settings.API_STREAM_BATCH_SIZE
+    async with get_async_sessionmaker()() as session:
+        while True:
+            rows = (await session.execute(snapshot_page_stmt(batch_size, after, **filters))).all()
+            if not rows:
+                return
+            yield b"".join(orjson.dumps(snapshot_row_to_dict(row)) + b"\n" for row in rows)
+            if len(rows) < batch_size:
+                return
+            after = (rows[-1].date, rows[-1].id)
+
+
+async def _snapshot_feed(
+    request: Request,
+    db: AsyncSession,
+    cursor: str | None,
+    limit: int,
+    format: str,
+    check: Callable[[], Awaitable[None]] | None = None,
+    **filters
+) -> Response:
+    """
+    Serve a page of snapshots as JSON, or the rest of the range as NDJSON
+
+    ``check`` (e.g. "the project exists") runs only when a body is built, so
+    a conditional request still revalidates without touching the database.
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if format == "ndjson" or "application/x-ndjson" in request.headers.get("accept", ""):
+        if check:
+            await check()
+        return StreamingResponse(_stream_snapshots(filters, after), media_type="application/x-ndjson")
+
+    async def build():
+        if check:
+            await check()
+        rows = (await db.execute(snapshot_page_stmt(limit, after, **filters))).all()
+        next_cursor = encode_cursor(rows[-1].date, rows[-1].id) if len(rows) == limit else None
+        page = {"items": [snapshot_row_to_dict(row) for row in rows], "next_cursor": next_cursor}
+        return CachedResponse(body=orjson.dumps(page), media_type="application/json")
+
+    return await _cached_response(request, db, build)
+
+
+@app.get("/api/projects/{project_id}/history")
+async def get_project_history(
+    project_id: int,
+    request: Request,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=1000),
+    since: str | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    format: Literal["json", "ndjson"] = "json",
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a project's trending history, oldest first, paginated by cursor"""
+    async def require_project():
+        if not await db.get(Project, project_id):
+            raise HTTPException(status_code=404, detail="Project not found")
+
+    return await _snapshot_feed(
+        request, db, cursor, limit, format, check=require_project,
+        project_id=project_id, since=since, date_from=date_from, date_to=date_to
+    )
+
+
+@app.get("/api/snapshots")
+async def get_snapshots(
+    request: Request,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=1000),
+    since: str | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    format: Literal["json", "ndjson"] = "json",
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get all trending snapshots, oldest first, paginated by cursor"""
+    return await _snapshot_feed(
+        request, db, cursor, limit, format,
+        since=since, date_from=date_from, date_to=date_to
+    )
+
+
+def _export_stream(table: str, format: str, date_from, date_to):
+    """Start an export on its own session; the chunks are iterated in the threadpool"""
+    db = SessionLocal()
+    try:
+        chunks = export_table(db, table, format, date_from, date_to, settings.API_STREAM_BATCH_SIZE)
+    except Exception:
+        db.close()
+        raise
+
+    def stream():
+        try:
+            yield from chunks
+        finally:
+            db.close()
+
+    return stream()
+
+
+@app.get("/api/export/{table}")
+async def export_dataset(
+    table: str,
+    format: Literal["csv", "ndjson", "parquet"] = "csv",
+    date_from: date | None = None,
+    date_to: date | None = None
+):
+    """Stream a full table dump as CSV, NDJSON or Parquet"""
+    if table not in EXPORT_TABLES:
+        raise HTTPException(status_code=404, detail=f"Unknown export table '{table}'")
+    extension, media_type = EXPORT_FORMATS[format]
+    try:
+        chunks = _export_stream(table, format, date_from, date_to)
+    except RuntimeError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{table}.{extension}"'}
+    )
+
+
+@app.get("/api/search")
+async def search_projects(
+    request: Request,
+    q: str,
+    language: str | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=10000),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Search projects by name and description, best matches first"""
+    if not match_query(q):
+        raise HTTPException(status_code=400, detail="Query must contain at least one word")
+
+    async def build():
+        query = search_stmt(q, db.bind.dialect.name, language, date_from, date_to, limit, offset)
+        rows = (await db.execute(query)).all()
+        page = {
+            "items": [search_row_to_dict(row) for row in rows],
+            "next_offset": offset + limit if len(rows) == limit else None
+        }
+        return CachedResponse(body=orjson.dumps(page), media_type="application/json")
+
+    return await _cached_response(request, db, build)
 
 
 @app.get("/api/projects/{project_id}/summary")
-async def get_project_summary(project_id: int, db: Session = Depends(get_db)):
+async def get_project_summary(project_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get project summary"""
-    summary = db.query(Summary).filter(Summary.project_id == project_id).first()
+    summary = (await db.scalars(
+        select(Summary).where(Summary.project_id == project_id).limit(1)
+    )).first()
     if not summary:
         raise HTTPException(status_code=404, detail="Summary not found")
     return {
@@ -103,13 +436,49 @@ async def get_project_summary(project_id: int, db: Session = Depends(get_db)):
     }
 
 
-@app.get("/api/report/html")
-async def get_html_report(db: Session = Depends(get_db)):
-    """Get trending report as HTML"""
-    table_gen = TableGenerator(db)
-    trending_data = table_gen.get_trending_data(limit=30)
-    html_table = table_gen.generate_html_table(trending_data)
+def _render_trending_table(session, day: date) -> str:
+    """Render a day's trending table with the sync TableGenerator"""
+    table_gen = TableGenerator(session)
+    with REPORT_STAGE.time(stage="data"):
+        trending_data = table_gen.get_trending_data(date=day, limit=30)
+    with REPORT_STAGE.time(stage="html_table"):
+        return table_gen.generate_html_table(trending_data)
+
+
+def _html_report_file(session, day: date, version: int) -> str:
+    """Path of a day's HTML report in the report cache, rendering it on a miss"""
+    run = get_run_for_date(session, day)
+    key = report_cache.make_key('report_html', {
+        'date': day.isoformat(), 'run_id': run.id if run else None, 'data_version': version
+    })
+    path = report_cache.lookup('report_html', key, suffix=".html")
+    if path is None:
+        html = _report_page(_render_trending_table(session, day), day)
+        path = report_cache.put('report_html', key, html, suffix=".html")
+    return str(path)
+
 
+@app.get("/api/report/html", response_class=HTMLResponse)
+async def get_html_report(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """Get trending report as HTML (served from the on-disk report cache)"""
+    # Today's report changes at midnight without an ingest
+    day = datetime.now().date()
+    if report_cache is None:
+        async def build():
+            html = _report_page(await db.run_sync(_render_trending_table, day), day)
+            return CachedResponse(body=html.encode("utf-8"), media_type="text/html; charset=utf-8")
+
+        return await _cached_response(request, db, build, variant=day.isoformat())
+
+    version, etag, not_modified = await _revalidate(request, db, variant=day.isoformat())
+    if not_modified:
+        return _not_modified(etag)
+    path = await db.run_sync(_html_report_file, day, version)
+    return FileResponse(path, media_type="text/html; charset=utf-8", headers=_validator_headers(etag))
+
+
+def _report_page(html_table: str, day: date) -> str:
+    """Wrap the trending table in the standalone HTML report page"""
     html = f"""
     <!DOCTYPE html>
     <html>
@@ -144,20 +513,86 @@ async def get_html_report(db: Session = Depends(get_db)):
         </style>
     </head>
     <body>
-        <h1>GitHub Trending - {datetime.now().strftime('%Y-%m-%d')}</h1>
+        <h1>GitHub Trending - {day.strftime('%Y-%m-%d')}</h1>
         {html_table}
     </body>
     </html>
     """
-    return HTMLResponse(content=html)
+    return html
+
+
+def _fetch_daily() -> int:
+    """Scrape and save the daily trending page (blocking, runs on a job worker)"""
+    from src.fetch_data import TrendingScraper
+
+    with ingest_lock():
+        db = SessionLocal()
+        try:
+            count = TrendingScraper(db).fetch_and_save(since="daily")
+        finally:
+            db.close()
+    data_version.invalidate()
+    broadcaster.notify()
+    return count
+
+
+@app.post("/api/fetch", status_code=202)
+async def trigger_fetch():
+    """Queue a trending data fetch and return its job"""
+    # Concurrent clicks while a fetch is queued or running share that job
+    try:
+        job = job_queue.submit("fetch:daily", _fetch_daily)
+    except RuntimeError:
+        raise HTTPException(status_code=503, detail="Job queue is shutting down")
+    return {"message": "Fetch queued", **job.to_dict()}
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get the status of a background job"""
+    job = job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+
+async def _event_stream(request: Request) -> AsyncIterator[bytes]:
+    """Relay broadcaster events to one client, with heartbeats to keep proxies open"""
+    queue = broadcaster.subscribe()
+    try:
+        yield b"retry: 5000\n\n"
+        while not await request.is_disconnected():
+            try:
+                yield await asyncio.wait_for(queue.get(), timeout=settings.SSE_HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                yield b": ping\n\n"
+    finally:
+        broadcaster.unsubscribe(queue)
+
+
+@app.get("/api/events")
+async def stream_events(request: Request):
+    """Server-Sent Events stream announcing new trending runs"""
+    return StreamingResponse(
+        _event_stream(request),
+        media_type="text/event-stream",
+        # An explicit Content-Encoding keeps GZipMiddleware from buffering events
+        headers={"Cache-Control": "no-cache", "Content-Encoding": "identity", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics of this process"""
+    return Response(content=registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 
-@app.post("/api/fetch")
-async def trigger_fetch(db: Session = Depends(get_db)):
-    """Manually trigger trending data fetch"""
-    scraper = TrendingScraper(db)
-    count = scraper.fetch_and_save(since="daily")
-    return {"message": f"Fetched {count} trending repositories"}
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """Get API response cache hit/miss/eviction statistics"""
+    if response_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **response_cache.stats()}
 
 
 if __name__ == "__main__":
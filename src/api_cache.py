@@ -0,0 +1,298 @@
+"""Ingest-invalidated response cache for read-only API endpoints"""
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+from src.config.settings import settings
+from src.database.data_version import data_version_stmt
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse(NamedTuple):
+    """Serialized response body and its media type"""
+    body: bytes
+    media_type: str
+
+    def pack(self) -> bytes:
+        return self.media_type.encode('utf-8') + b'\n' + self.body
+
+    @classmethod
+    def unpack(cls, data: bytes) -> 'CachedResponse':
+        media_type, body = data.split(b'\n', 1)
+        return cls(body=body, media_type=media_type.decode('utf-8'))
+
+
+class MemoryCacheBackend:
+    """Per-process LRU cache with TTL and a total byte budget"""
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize memory backend
+
+        Args:
+            max_bytes: Maximum total size of cached values
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self.size -= len(value)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self.size, 'evictions': self.evictions}
+
+
+class SQLiteCacheBackend:
+    """Cache shared by every worker process through a local SQLite file"""
+
+    def __init__(self, path: str, max_bytes: int):
+        """
+        Initialize SQLite backend
+
+        Args:
+            path: Cache database file
+            max_bytes: Maximum total size of cached values
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS response_cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON response_cache (accessed_at)")
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM response_cache WHERE key = ? AND expires_at >= ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE response_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache (key, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value), now + ttl, now)
+            )
+            self._conn.execute("DELETE FROM response_cache WHERE expires_at < ?", (now,))
+
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM response_cache").fetchone()[0]
+            while total > self.max_bytes:
+                key_to_evict, size = self._conn.execute(
+                    "SELECT key, size FROM response_cache ORDER BY accessed_at LIMIT 1"
+                ).fetchone()
+                self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key_to_evict,))
+                total -= size
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM response_cache"
+            ).fetchone()
+        return {'entries': entries, 'bytes': size, 'evictions': self.evictions}
+
+
+class DataVersionTracker:
+    """Read the ingest data version at most once per check interval"""
+
+    def __init__(self, check_interval: float):
+        """
+        Initialize tracker
+
+        Args:
+            check_interval: Seconds a fetched version is trusted before re-reading
+        """
+        self.check_interval = check_interval
+        self._version = None
+        self._checked_at = 0.0
+
+    def cached(self) -> Optional[int]:
+        """Get the version if it was read within the check interval"""
+        if self._version is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return self._version
+        return None
+
+    async def current(self, db: AsyncSession) -> int:
+        """
+        Get the current data version
+
+        Args:
+            db: Async database session
+
+        Returns:
+            Data version
+        """
+        version = self.cached()
+        if version is None:
+            version = (await db.scalar(data_version_stmt())) or 0
+            self._version = version
+            self._checked_at = time.monotonic()
+        return version
+
+    def invalidate(self) -> None:
+        """Force the next current() call to re-read the version"""
+        self._version = None
+
+
+def request_key(request: Request, variant: str = "") -> str:
+    """
+    Identify a GET request by its path and sorted query parameters
+
+    Args:
+        request: Incoming request
+        variant: Extra input the response depends on besides the data
+            (e.g. the report date)
+
+    Returns:
+        Canonical request string
+    """
+    params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    key = f"{request.url.path}?{params}"
+    return f"{key}#{variant}" if variant else key
+
+
+def make_etag(request: Request, version: int, variant: str = "") -> str:
+    """
+    Build a weak ETag for a read-only response
+
+    The body of a read-only endpoint only changes when an ingest bumps the
+    data version (or its variant changes), so these identify it. The tag is
+    weak because GZipMiddleware may or may not compress the same body, and
+    a strong tag must differ between content codings.
+
+    Args:
+        request: Incoming request
+        version: Current data version
+        variant: Extra input the response depends on besides the data
+
+    Returns:
+        Weak ETag value
+    """
+    digest = hashlib.sha1(request_key(request, variant).encode('utf-8')).hexdigest()[:16]
+    return f'W/"v{version}-{digest}"'
+
+
+class ResponseCache:
+    """Response cache keyed by endpoint, query parameters and data version"""
+
+    def __init__(self, backend, ttl: float):
+        """
+        Initialize response cache
+
+        Args:
+            backend: MemoryCacheBackend or SQLiteCacheBackend
+            ttl: Seconds a cached response stays valid
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, request: Request, version: int, variant: str = "") -> str:
+        """
+        Build the cache key of a request
+
+        Args:
+            request: Incoming request
+            version: Current data version
+            variant: Extra input the response depends on besides the data
+
+        Returns:
+            Cache key
+        """
+        return f"v{version}:{request_key(request, variant)}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Look up a cached response"""
+        data = self.backend.get(key)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return CachedResponse.unpack(data)
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        """Store a response"""
+        self.backend.set(key, response.pack(), self.ttl)
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss/eviction statistics"""
+        stats = {'hits': self.hits, 'misses': self.misses}
+        stats.update(self.backend.stats())
+        return stats
+
+
+def create_response_cache() -> Optional[ResponseCache]:
+    """
+    Create the response cache configured in settings
+
+    Returns:
+        Response cache, or None if API_CACHE_BACKEND is "none"
+    """
+    backend_name = settings.API_CACHE_BACKEND
+    if backend_name == 'none':
+        return None
+    if backend_name == 'memory':
+        backend = MemoryCacheBackend(settings.API_CACHE_MAX_BYTES)
+    elif backend_name == 'sqlite':
+        backend = SQLiteCacheBackend(settings.API_CACHE_PATH, settings.API_CACHE_MAX_BYTES)
+    else:
+        raise ValueError(f"Unknown API_CACHE_BACKEND '{backend_name}', expected memory, sqlite or none")
+
+    logger.info(f"API response cache enabled ({backend_name} backend)")
+    return ResponseCache(backend, ttl=settings.API_CACHE_TTL)
@@ -14,6 +14,85 @@ class Settings:
 
     # Database Configuration
     DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./gh_trending.db')
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '10'))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '20'))
+    DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', '30'))  # seconds
+
+    # SQLite performance profile: "performance" applies the pragmas below on
+    # every connection (WAL lets API readers run while the scraper writes),
+    # "default" keeps SQLite's built-in settings
+    SQLITE_PROFILE = os.getenv('SQLITE_PROFILE', 'performance')
+    SQLITE_JOURNAL_MODE = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+    SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))  # bytes
+    SQLITE_CACHE_SIZE = int(os.getenv('SQLITE_CACHE_SIZE', '-64000'))  # negative = KiB
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+
+    # Scraper Configuration
+    # Comma-separated programming languages to track; empty entry means "all languages"
+    SCRAPER_LANGUAGES = [
+        lang.strip() or None
+        for lang in os.getenv('SCRAPER_LANGUAGES', '').split(',')
+    ]
+    SCRAPER_RANGES = [
+        since.strip()
+        for since in os.getenv('SCRAPER_RANGES', 'daily').split(',')
+        if since.strip()
+    ]
+    SCRAPER_MAX_WORKERS = int(os.getenv('SCRAPER_MAX_WORKERS', '8'))
+    # Outbound request pacing, shared by every scraper in a process
+    SCRAPER_RATE_LIMIT = float(os.getenv('SCRAPER_RATE_LIMIT', '2'))  # requests per second
+    SCRAPER_RATE_BURST = int(os.getenv('SCRAPER_RATE_BURST', '4'))
+    SCRAPER_MAX_RETRIES = int(os.getenv('SCRAPER_MAX_RETRIES', '4'))
+    SCRAPER_BACKOFF_BASE = float(os.getenv('SCRAPER_BACKOFF_BASE', '1'))  # seconds
+    SCRAPER_BACKOFF_MAX = float(os.getenv('SCRAPER_BACKOFF_MAX', '60'))  # seconds
+    # Trending page parser backend: "lxml" (fast) or "bs4" (BeautifulSoup fallback)
+    SCRAPER_PARSER = os.getenv('SCRAPER_PARSER', 'lxml')
+    # Directory for the conditional-request response cache; empty disables it
+    SCRAPER_CACHE_DIR = os.getenv('SCRAPER_CACHE_DIR', 'cache/http')
+    # Directory for the raw page archive used by backfills; empty disables it
+    SCRAPER_ARCHIVE_DIR = os.getenv('SCRAPER_ARCHIVE_DIR', 'archive/pages')
+
+    # API response cache: "memory" (per process), "sqlite" (shared by every
+    # worker through API_CACHE_PATH) or "none"; entries are invalidated by ingest
+    API_CACHE_BACKEND = os.getenv('API_CACHE_BACKEND', 'memory')
+    API_CACHE_TTL = float(os.getenv('API_CACHE_TTL', '300'))  # seconds
+    API_CACHE_MAX_BYTES = int(os.getenv('API_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+    API_CACHE_PATH = os.getenv('API_CACHE_PATH', 'cache/api_cache.db')
+    # How long a read of the ingest data version is trusted before re-checking
+    API_CACHE_VERSION_CHECK_INTERVAL = float(os.getenv('API_CACHE_VERSION_CHECK_INTERVAL', '1'))  # seconds
+    # Responses smaller than this many bytes are sent uncompressed
+    API_GZIP_MIN_SIZE = int(os.getenv('API_GZIP_MIN_SIZE', '1000'))
+    # Rows fetched per query when streaming NDJSON responses
+    API_STREAM_BATCH_SIZE = int(os.getenv('API_STREAM_BATCH_SIZE', '1000'))
+
+    # Server-Sent Events: one poll of the data version serves every client
+    SSE_POLL_INTERVAL = float(os.getenv('SSE_POLL_INTERVAL', '2'))  # seconds
+    SSE_HEARTBEAT_INTERVAL = float(os.getenv('SSE_HEARTBEAT_INTERVAL', '15'))  # seconds
+
+    # Background jobs started from the API (e.g. POST /api/fetch)
+    JOB_MAX_WORKERS = int(os.getenv('JOB_MAX_WORKERS', '2'))
+    JOB_HISTORY = int(os.getenv('JOB_HISTORY', '100'))  # finished jobs kept for status lookups
+    # File lock shared by the API, scheduler and CLI so only one ingest runs at a time
+    INGEST_LOCK_PATH = os.getenv('INGEST_LOCK_PATH', 'cache/ingest.lock')
+
+    # Development SQL profiler: groups statements per request/job, warns about
+    # N+1 patterns and logs EXPLAIN QUERY PLAN for slow queries
+    SQL_PROFILE = os.getenv('SQL_PROFILE', 'False').lower() == 'true'
+    SQL_SLOW_QUERY_MS = float(os.getenv('SQL_SLOW_QUERY_MS', '100'))
+    SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv('SQL_N_PLUS_ONE_THRESHOLD', '5'))
+
+    # Report cache: rendered reports and sections keyed by their inputs
+    REPORT_CACHE_ENABLED = os.getenv('REPORT_CACHE_ENABLED', 'True').lower() == 'true'
+    REPORT_CACHE_DIR = os.getenv('REPORT_CACHE_DIR', 'cache/reports')
+    REPORT_CACHE_MAX_AGE_DAYS = float(os.getenv('REPORT_CACHE_MAX_AGE_DAYS', '30'))
+
+    # Startup import-time budgets (checked by "main.py import-budget" and the
+    # test suite): each entry point may take RATIO times the import time of
+    # the third-party packages it cannot avoid, measured on the same
+    # machine, plus SLACK_MS for noise
+    IMPORT_BUDGET_RATIO = float(os.getenv('IMPORT_BUDGET_RATIO', '1.5'))
+    IMPORT_BUDGET_SLACK_MS = float(os.getenv('IMPORT_BUDGET_SLACK_MS', '50'))
 
     # Application Configuration
     DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
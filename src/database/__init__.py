@@ -1,14 +1,27 @@
 """Database models and connection management"""
-from src.database.base import Base, engine, SessionLocal, get_db, init_db
-from src.database.models import Project, TrendingSnapshot, Summary
+from src.database.base import Base, engine, SessionLocal, get_db, get_async_db, init_db
+from src.database.models import Project, FetchRun, TrendingSnapshot, Summary, DataVersion
+from src.database.data_version import get_data_version, bump_data_version
+from src.database.ingest import bulk_ingest
+from src.database.runs import get_latest_run, get_run_for_date
+from src.database.search import rebuild_search_index
 
 __all__ = [
     'Base',
     'engine',
     'SessionLocal',
     'get_db',
+    'get_async_db',
     'init_db',
     'Project',
+    'FetchRun',
     'TrendingSnapshot',
-    'Summary'
+    'Summary',
+    'DataVersion',
+    'get_data_version',
+    'bump_data_version',
+    'bulk_ingest',
+    'get_latest_run',
+    'get_run_for_date',
+    'rebuild_search_index'
 ]
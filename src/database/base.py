@@ -1,19 +1,144 @@
 """Database base configuration and session management"""
-from sqlalchemy import create_engine
+from typing import TYPE_CHECKING, Dict, Any
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from src.config.settings import settings
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """
+    Get the PRAGMA settings of the configured SQLite profile
+
+    Returns:
+        Dictionary of pragma name -> value (empty for the "default" profile)
+    """
+    if settings.SQLITE_PROFILE != 'performance':
+        return {}
+    return {
+        'journal_mode': settings.SQLITE_JOURNAL_MODE,
+        'synchronous': settings.SQLITE_SYNCHRONOUS,
+        'mmap_size': settings.SQLITE_MMAP_SIZE,
+        'cache_size': settings.SQLITE_CACHE_SIZE,
+        'busy_timeout': settings.SQLITE_BUSY_TIMEOUT_MS,
+    }
+
+
+def configure_sqlite(engine: Engine) -> None:
+    """
+    Apply the SQLite profile to every new connection of an engine
+
+    Args:
+        engine: SQLAlchemy engine (sync, or the sync_engine of an async one)
+    """
+    pragmas = sqlite_pragmas()
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    Build create_engine keyword arguments for a database URL
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        Engine keyword arguments
+    """
+    options = {'echo': settings.DEBUG}
+    if "sqlite" in database_url:
+        options['connect_args'] = {"check_same_thread": False}
+        if ":memory:" in database_url or database_url.rstrip('/').endswith('sqlite:'):
+            # In-memory databases use a single-connection pool
+            return options
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    return options
+
+
 # Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-    echo=settings.DEBUG
-)
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+if engine.dialect.name == 'sqlite':
+    configure_sqlite(engine)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async drivers for the sync URLs we support
+ASYNC_DRIVERS = {
+    'sqlite': 'aiosqlite',
+    'postgresql': 'asyncpg',
+    'mysql': 'aiomysql',
+}
+
+
+def async_database_url(database_url: str) -> str:
+    """
+    Convert a sync database URL to its asyncio driver equivalent
+
+    Args:
+        database_url: SQLAlchemy database URL (e.g., "sqlite:///./gh_trending.db")
+
+    Returns:
+        Async database URL (e.g., "sqlite+aiosqlite:///./gh_trending.db")
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+_async_engine = None
+_async_session_factory = None
+
+
+def get_async_engine() -> "AsyncEngine":
+    """Get the shared async engine, creating it on first use"""
+    global _async_engine
+    if _async_engine is None:
+        # The asyncio extension is only loaded by processes that use it (the API)
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+        options = engine_options(settings.DATABASE_URL)
+        if 'pool_size' in options:
+            # aiosqlite defaults to NullPool; keep connections (and their pragmas) pooled
+            options['poolclass'] = AsyncAdaptedQueuePool
+        _async_engine = create_async_engine(async_database_url(settings.DATABASE_URL), **options)
+        if _async_engine.dialect.name == 'sqlite':
+            configure_sqlite(_async_engine.sync_engine)
+    return _async_engine
+
+
+def get_async_sessionmaker() -> "async_sessionmaker":
+    """Get the async session factory bound to the shared async engine"""
+    global _async_session_factory
+    if _async_session_factory is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        _async_session_factory = async_sessionmaker(
+            get_async_engine(), autoflush=False, expire_on_commit=False
+        )
+    return _async_session_factory
+
 # Create Base class for declarative models
 Base = declarative_base()
 
@@ -30,6 +155,15 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Dependency function to get an async database session.
+    Yields an AsyncSession and ensures it's closed after use.
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
 def init_db():
     """Initialize database - create all tables"""
     Base.metadata.create_all(bind=engine)
@@ -0,0 +1,43 @@
+"""Global data version, bumped whenever ingest changes trending data"""
+from datetime import datetime
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from src.database.models import DataVersion
+
+DATA_VERSION_ID = 1
+
+
+def data_version_stmt() -> Select:
+    """Build the query for the current data version (sync and async sessions)"""
+    return select(DataVersion.version).where(DataVersion.id == DATA_VERSION_ID)
+
+
+def get_data_version(db: Session) -> int:
+    """
+    Get the current data version
+
+    Args:
+        db: Database session
+
+    Returns:
+        Data version (0 if nothing was ever ingested)
+    """
+    return db.scalar(data_version_stmt()) or 0
+
+
+def bump_data_version(db: Session) -> None:
+    """
+    Increment the data version inside the caller's transaction
+
+    Args:
+        db: Database session
+    """
+    result = db.execute(
+        update(DataVersion)
+        .where(DataVersion.id == DATA_VERSION_ID)
+        .values(version=DataVersion.version + 1, updated_at=datetime.now())
+    )
+    if result.rowcount == 0:
+        db.add(DataVersion(id=DATA_VERSION_ID, version=1, updated_at=datetime.now()))
+        db.flush()
@@ -0,0 +1,111 @@
+"""Keyset-paginated reads of trending snapshot history"""
+import base64
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy import select, tuple_
+from sqlalchemy.sql import Select
+from src.database.models import FetchRun, Project, TrendingSnapshot
+
+Cursor = Tuple[datetime, int]
+
+
+def encode_cursor(date: datetime, snapshot_id: int) -> str:
+    """
+    Encode the (date, id) position after a snapshot as an opaque cursor
+
+    Args:
+        date: Snapshot date
+        snapshot_id: Snapshot id
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{date.isoformat()}|{snapshot_id}".encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        (date, id) position
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('utf-8')
+        date, snapshot_id = raw.split('|')
+        return datetime.fromisoformat(date), int(snapshot_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor '{cursor}'") from e
+
+
+def snapshot_page_stmt(
+    limit: int,
+    after: Optional[Cursor] = None,
+    project_id: Optional[int] = None,
+    since: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None
+) -> Select:
+    """
+    Build the query for one page of snapshots ordered by (date, id)
+
+    Seeks past ``after`` instead of using OFFSET, so every page costs the
+    same regardless of how deep into the history it is.
+
+    Args:
+        limit: Maximum rows
+        after: Position of the last row of the previous page
+        project_id: Only this project's history (uses idx_project_date)
+        since: Only snapshots of runs with this time range
+        date_from: Earliest snapshot date (inclusive)
+        date_to: Latest snapshot date (inclusive)
+
+    Returns:
+        SELECT statement usable with sync and async sessions
+    """
+    query = select(
+        TrendingSnapshot.id,
+        TrendingSnapshot.project_id,
+        Project.full_name,
+        TrendingSnapshot.date,
+        TrendingSnapshot.rank,
+        TrendingSnapshot.stars_at_snapshot,
+        FetchRun.since
+    ).join(
+        Project, TrendingSnapshot.project_id == Project.id
+    ).outerjoin(
+        FetchRun, TrendingSnapshot.run_id == FetchRun.id
+    )
+
+    if project_id is not None:
+        query = query.where(TrendingSnapshot.project_id == project_id)
+    if since:
+        query = query.where(FetchRun.since == since)
+    if date_from:
+        query = query.where(TrendingSnapshot.date >= date_from)
+    if date_to:
+        query = query.where(TrendingSnapshot.date <= date_to)
+    if after is not None:
+        query = query.where(tuple_(TrendingSnapshot.date, TrendingSnapshot.id) > tuple_(*after))
+
+    return query.order_by(TrendingSnapshot.date, TrendingSnapshot.id).limit(limit)
+
+
+def snapshot_row_to_dict(row) -> Dict[str, Any]:
+    """Convert a snapshot_page_stmt row to its API representation"""
+    return {
+        "id": row.id,
+        "project_id": row.project_id,
+        "full_name": row.full_name,
+        "date": row.date,
+        "rank": row.rank,
+        "stars_at_snapshot": row.stars_at_snapshot,
+        "since": row.since
+    }
@@ -0,0 +1,260 @@
+"""Set-based ingest of scraped trending data"""
+import logging
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+from sqlalchemy import select, insert, update, delete, bindparam
+from sqlalchemy.orm import Session
+from src.database.data_version import bump_data_version
+from src.database.models import Project, FetchRun, TrendingSnapshot
+
+logger = logging.getLogger(__name__)
+
+# Keep IN (...) lookups well below SQLite's bound-parameter limit
+MAX_PARAMS_PER_STATEMENT = 900
+
+
+def _chunks(items: List[Any], size: int):
+    """Yield successive slices of ``items`` with at most ``size`` elements"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _dialect_insert(db: Session):
+    """
+    Get the dialect-specific INSERT construct supporting upserts
+
+    Args:
+        db: Database session
+
+    Returns:
+        Insert factory, or None if the dialect has no ON CONFLICT support
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        return sqlite_insert
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        return pg_insert
+    return None
+
+
+def _upsert_projects(db: Session, rows: List[Dict[str, Any]], now: datetime) -> None:
+    """
+    Insert new projects and refresh stars/description of existing ones
+
+    Args:
+        db: Database session
+        rows: Project rows, unique by full_name
+        now: Timestamp used for created_at/updated_at
+    """
+    values = [{
+        'name': r['name'],
+        'full_name': r['full_name'],
+        'description': r['description'],
+        'language': r['language'],
+        'stars': r['stars'],
+        'url': r['url'],
+        'created_at': now,
+        'updated_at': now,
+    } for r in rows]
+    projects = Project.__table__
+
+    dialect_insert = _dialect_insert(db)
+    if dialect_insert is not None:
+        # Executed as executemany: compiled once, batched by the driver
+        stmt = dialect_insert(projects)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[projects.c.full_name],
+            set_={
+                'stars': stmt.excluded.stars,
+                'description': stmt.excluded.description,
+                'updated_at': stmt.excluded.updated_at,
+            }
+        )
+        db.execute(stmt, values)
+        return
+
+    # Portable fallback: one lookup, then bulk insert + bulk update
+    existing = _resolve_project_ids(db, [r['full_name'] for r in values])
+    new_rows = [v for v in values if v['full_name'] not in existing]
+    changed_rows = [{
+        'b_full_name': v['full_name'],
+        'stars': v['stars'],
+        'description': v['description'],
+        'updated_at': now,
+    } for v in values if v['full_name'] in existing]
+
+    if new_rows:
+        db.execute(insert(projects), new_rows)
+    if changed_rows:
+        db.execute(
+            update(projects).where(projects.c.full_name == bindparam('b_full_name')),
+            changed_rows
+        )
+
+
+def _resolve_project_ids(db: Session, full_names: List[str]) -> Dict[str, int]:
+    """
+    Map full_name to project id for the given names
+
+    Args:
+        db: Database session
+        full_names: Repository full names
+
+    Returns:
+        Dictionary of full_name -> project id
+    """
+    ids = {}
+    for chunk in _chunks(full_names, MAX_PARAMS_PER_STATEMENT):
+        result = db.execute(
+            select(Project.full_name, Project.id).where(Project.full_name.in_(chunk))
+        )
+        ids.update(dict(result.all()))
+    return ids
+
+
+def bulk_ingest(
+    db: Session,
+    trending_data: List[Dict[str, Any]],
+    snapshot_date: datetime = None,
+    since: str = "daily",
+    language: Optional[str] = None
+) -> int:
+    """
+    Save scraped repositories with a constant number of statements per batch
+
+    Ingest is idempotent per (day, since, language): the day's fetch run for
+    the page is reused and its snapshots are upserted on (run, project), so
+    re-running a scrape on the same day replaces that day's rows instead of
+    adding another set. Projects are upserted in bulk and their ids resolved
+    with a single lookup. The data version is bumped so read caches
+    invalidate once the caller commits. The caller owns the transaction.
+
+    Args:
+        db: Database session
+        trending_data: List of repository data dictionaries
+        snapshot_date: Snapshot timestamp (default: now)
+        since: Time range of the scraped page
+        language: Programming language filter of the scraped page
+
+    Returns:
+        Number of saved snapshots
+    """
+    if not trending_data:
+        return 0
+
+    now = datetime.now()
+    snapshot_date = snapshot_date or now
+
+    projects = {}
+    for repo_data in trending_data:
+        projects[repo_data['full_name']] = repo_data
+
+    _upsert_projects(db, list(projects.values()), now)
+    project_ids = _resolve_project_ids(db, list(projects))
+
+    # A repository listed twice on a page keeps its first (best) rank
+    snapshots = {}
+    for repo_data in trending_data:
+        project_id = project_ids[repo_data['full_name']]
+        snapshots.setdefault(project_id, {
+            'date': snapshot_date,
+            'project_id': project_id,
+            'stars_at_snapshot': repo_data['stars'],
+            'rank': repo_data['rank'],
+            'created_at': now,
+        })
+
+    run = _get_or_create_run(db, snapshot_date, since, language or "", len(snapshots), now)
+    for snapshot in snapshots.values():
+        snapshot['run_id'] = run.id
+    _upsert_snapshots(db, run.id, list(snapshots.values()))
+    bump_data_version(db)
+
+    logger.debug(f"Bulk ingested {len(snapshots)} snapshots for {len(projects)} projects")
+    return len(snapshots)
+
+
+def _get_or_create_run(
+    db: Session,
+    fetched_at: datetime,
+    since: str,
+    language: str,
+    row_count: int,
+    now: datetime
+) -> FetchRun:
+    """
+    Get the fetch run for a page and day, creating or refreshing it
+
+    Args:
+        db: Database session
+        fetched_at: Fetch timestamp
+        since: Time range of the page
+        language: Language filter of the page ("" for all languages)
+        row_count: Number of snapshots in the run
+        now: Timestamp used for created_at
+
+    Returns:
+        Fetch run with its id assigned
+    """
+    run = db.query(FetchRun).filter(
+        FetchRun.run_date == fetched_at.date(),
+        FetchRun.since == since,
+        FetchRun.language == language
+    ).first()
+
+    if run:
+        run.fetched_at = fetched_at
+        run.row_count = row_count
+    else:
+        run = FetchRun(
+            run_date=fetched_at.date(),
+            since=since,
+            language=language,
+            fetched_at=fetched_at,
+            row_count=row_count,
+            created_at=now
+        )
+        db.add(run)
+    db.flush()
+    return run
+
+
+def _upsert_snapshots(db: Session, run_id: int, rows: List[Dict[str, Any]]) -> None:
+    """
+    Make a run's snapshots exactly ``rows``, upserting on (run_id, project_id)
+
+    Args:
+        db: Database session
+        run_id: Fetch run id
+        rows: Snapshot rows, unique by project_id
+    """
+    snapshots = TrendingSnapshot.__table__
+    project_ids = [r['project_id'] for r in rows]
+
+    dialect_insert = _dialect_insert(db)
+    if dialect_insert is None:
+        db.execute(delete(snapshots).where(snapshots.c.run_id == run_id))
+        db.execute(insert(snapshots), rows)
+        return
+
+    # Drop projects that fell off the page since the earlier same-day run
+    if len(project_ids) < MAX_PARAMS_PER_STATEMENT:
+        db.execute(delete(snapshots).where(
+            snapshots.c.run_id == run_id,
+            snapshots.c.project_id.notin_(project_ids)
+        ))
+    else:
+        db.execute(delete(snapshots).where(snapshots.c.run_id == run_id))
+
+    stmt = dialect_insert(snapshots)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[snapshots.c.run_id, snapshots.c.project_id],
+        set_={
+            'date': stmt.excluded.date,
+            'stars_at_snapshot': stmt.excluded.stars_at_snapshot,
+            'rank': stmt.excluded.rank,
+        }
+    )
+    db.execute(stmt, rows)
@@ -0,0 +1,122 @@
+"""Maintenance commands for existing databases"""
+import logging
+import time
+from typing import Dict, List, Sequence
+from sqlalchemy import select, delete, update, exists, and_, func, inspect
+from sqlalchemy.orm import Session, aliased
+from src.database.data_version import bump_data_version
+from src.database.models import FetchRun, TrendingSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+def _delete_in_batches(db: Session, ids: Sequence[int], batch_size: int, pause: float) -> int:
+    """
+    Delete the given snapshots in short committed batches
+
+    The ids are collected once by the caller, so each batch is a primary
+    key lookup instead of a re-run of the query that found them.
+
+    Args:
+        db: Database session
+        ids: trending_snapshots ids to delete
+        batch_size: Rows deleted per transaction
+        pause: Seconds to sleep between batches so readers get the lock
+
+    Returns:
+        Number of deleted rows
+    """
+    snapshots = TrendingSnapshot.__table__
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start:start + batch_size]
+        db.execute(delete(snapshots).where(snapshots.c.id.in_(batch)))
+        db.commit()
+        if pause and start + batch_size < len(ids):
+            time.sleep(pause)
+    return len(ids)
+
+
+def _superseded_run_ids(db: Session) -> List[int]:
+    """
+    Find fetch runs that share a (day, since, language) with a later run
+
+    The day is fetch_runs.run_date, the key ingest reuses runs by. Databases
+    created before that column existed fall back to the date of fetched_at,
+    which is what the migration fills run_date with.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Ids of every run except the latest of each group
+    """
+    runs = FetchRun.__table__
+    columns = {column['name'] for column in inspect(db.connection()).get_columns(runs.name)}
+    day = runs.c.run_date if 'run_date' in columns else func.date(runs.c.fetched_at)
+    rows = db.execute(
+        select(runs.c.id, runs.c.since, runs.c.language, day)
+        .order_by(runs.c.fetched_at, runs.c.id)
+    ).all()
+
+    latest = {}
+    superseded = []
+    for run_id, since, language, run_day in rows:
+        key = (run_day, since, language)
+        if key in latest:
+            superseded.append(latest[key])
+        latest[key] = run_id
+    return superseded
+
+
+def compact_snapshots(db: Session, batch_size: int = 1000, pause: float = 0.05) -> Dict[str, int]:
+    """
+    Remove duplicate trending snapshots from an existing database
+
+    Keeps only the latest run of each (day, since, language) and one
+    snapshot per (run, project). Work is done in small committed batches
+    so the API is never locked out for long. Safe to run repeatedly; run
+    it before upgrading a large database to the unique-constraint schema.
+    Callers should hold the ingest lock (src.jobs.ingest_lock) so no ingest
+    writes while rows are removed. The data version is bumped when
+    anything was removed, so API caches and ETags drop the deleted rows.
+
+    Args:
+        db: Database session
+        batch_size: Rows deleted per transaction
+        pause: Seconds to sleep between batches
+
+    Returns:
+        Dictionary with the number of removed runs and snapshots
+    """
+    snapshots = TrendingSnapshot.__table__
+    runs = FetchRun.__table__
+    removed_runs = 0
+    removed_snapshots = 0
+
+    for run_id in _superseded_run_ids(db):
+        ids = db.execute(select(snapshots.c.id).where(snapshots.c.run_id == run_id)).scalars().all()
+        removed_snapshots += _delete_in_batches(db, ids, batch_size, pause)
+        db.execute(delete(runs).where(runs.c.id == run_id))
+        db.commit()
+        removed_runs += 1
+
+    # Same project twice within one run: keep the earliest row
+    other = aliased(snapshots)
+    duplicate_ids = db.execute(select(snapshots.c.id).where(exists().where(and_(
+        other.c.run_id == snapshots.c.run_id,
+        other.c.project_id == snapshots.c.project_id,
+        other.c.id < snapshots.c.id
+    ))).order_by(snapshots.c.id)).scalars().all()
+    removed_snapshots += _delete_in_batches(db, duplicate_ids, batch_size, pause)
+
+    if removed_snapshots:
+        row_count = select(func.count(snapshots.c.id)).where(
+            snapshots.c.run_id == runs.c.id
+        ).scalar_subquery()
+        db.execute(update(runs).values(row_count=row_count))
+    if removed_runs or removed_snapshots:
+        bump_data_version(db)
+        db.commit()
+
+    logger.info(f"Compaction removed {removed_runs} duplicate runs and {removed_snapshots} snapshots")
+    return {'runs': removed_runs, 'snapshots': removed_snapshots}
@@ -1,6 +1,6 @@
 """SQLAlchemy ORM models for GitHub trending projects"""
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from src.database.base import Base
 
@@ -27,6 +27,32 @@ class Project(Base):
         return f"<Project(id={self.id}, full_name='{self.full_name}', stars={self.stars})>"
 
 
+class FetchRun(Base):
+    """Model for storing the scrape of one trending page on one day"""
+    __tablename__ = "fetch_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    since = Column(String(20), nullable=False, default="daily")
+    language = Column(String(100), nullable=False, default="")  # "" means all languages
+    run_date = Column(Date, nullable=False)
+    fetched_at = Column(DateTime, nullable=False)
+    row_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    snapshots = relationship("TrendingSnapshot", back_populates="run")
+
+    # Latest run / run for a date are point lookups on these indexes;
+    # one run per page and day keeps same-day re-ingests idempotent
+    __table_args__ = (
+        Index('idx_run_since_language_fetched', 'since', 'language', 'fetched_at'),
+        UniqueConstraint('run_date', 'since', 'language', name='uq_fetch_run_day'),
+    )
+
+    def __repr__(self):
+        return f"<FetchRun(id={self.id}, since='{self.since}', language='{self.language}', fetched_at={self.fetched_at})>"
+
+
 class TrendingSnapshot(Base):
     """Model for storing daily trending snapshots"""
     __tablename__ = "trending_snapshots"
@@ -34,16 +60,21 @@ class TrendingSnapshot(Base):
     id = Column(Integer, primary_key=True, index=True)
     date = Column(DateTime, nullable=False, index=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    run_id = Column(Integer, ForeignKey("fetch_runs.id", ondelete="CASCADE"), nullable=True)
     stars_at_snapshot = Column(Integer, default=0)
     rank = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
     project = relationship("Project", back_populates="trending_snapshots")
+    run = relationship("FetchRun", back_populates="snapshots")
 
-    # Composite index for efficient queries
+    # Composite indexes for efficient queries
     __table_args__ = (
         Index('idx_date_rank', 'date', 'rank'),
+        Index('idx_run_rank', 'run_id', 'rank'),
+        Index('idx_project_date', 'project_id', 'date'),
+        UniqueConstraint('run_id', 'project_id', name='uq_snapshot_run_project'),
     )
 
     def __repr__(self):
@@ -66,3 +97,15 @@ class Summary(Base):
 
     def __repr__(self):
         return f"<Summary(id={self.id}, project_id={self.project_id})>"
+
+
+class DataVersion(Base):
+    """Single-row counter bumped by every ingest, used to invalidate caches"""
+    __tablename__ = "data_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<DataVersion(version={self.version})>"
@@ -0,0 +1,215 @@
+"""Opt-in SQL profiler: statement grouping, N+1 detection and query budgets"""
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Reduce a statement to its shape so repeated queries group together
+
+    Literals become ``?``, IN lists collapse to ``(?...)`` and whitespace
+    is squeezed.
+
+    Args:
+        statement: SQL as sent to the driver
+
+    Returns:
+        Normalized SQL
+    """
+    statement = _STRING.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    statement = _IN_LIST.sub("(?...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+class StatementStats:
+    """Executions of one normalized statement"""
+
+    __slots__ = ("sql", "count", "total", "max")
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class QueryProfile:
+    """Statements executed within one profiled request or job"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.total = 0.0
+        self.statements: Dict[str, StatementStats] = OrderedDict()
+        self.slow: List[Dict] = []
+
+    def record(self, statement: str, elapsed: float) -> None:
+        sql = normalize_sql(statement)
+        stats = self.statements.get(sql)
+        if stats is None:
+            stats = self.statements[sql] = StatementStats(sql)
+        stats.count += 1
+        stats.total += elapsed
+        stats.max = max(stats.max, elapsed)
+        self.count += 1
+        self.total += elapsed
+
+    def n_plus_one(self, threshold: Optional[int] = None) -> List[StatementStats]:
+        """
+        Find statements repeated often enough to suggest per-row queries
+
+        Args:
+            threshold: Executions that count as N+1 (defaults to settings.SQL_N_PLUS_ONE_THRESHOLD)
+
+        Returns:
+            Offending statements, most repeated first
+        """
+        threshold = threshold or settings.SQL_N_PLUS_ONE_THRESHOLD
+        repeated = [stats for stats in self.statements.values() if stats.count >= threshold]
+        return sorted(repeated, key=lambda stats: stats.count, reverse=True)
+
+    def report(self, top: int = 10) -> str:
+        """Render the heaviest statements as text"""
+        lines = [f"{self.name}: {self.count} queries, {self.total * 1000:.1f} ms"]
+        by_time = sorted(self.statements.values(), key=lambda stats: stats.total, reverse=True)
+        for stats in by_time[:top]:
+            lines.append(f"  {stats.count:>5}x {stats.total * 1000:8.2f} ms  {stats.sql[:200]}")
+        return "\n".join(lines)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a code path runs more statements than its budget"""
+
+    def __init__(self, profile: QueryProfile, budget: int):
+        self.profile = profile
+        self.budget = budget
+        super().__init__(f"Query budget of {budget} exceeded\n{profile.report()}")
+
+
+_current: ContextVar[Optional[QueryProfile]] = ContextVar("sql_profile", default=None)
+_install_lock = threading.Lock()
+_installed = False
+
+
+def _explain(conn, statement: str, parameters) -> List:
+    """Run EXPLAIN (QUERY PLAN on SQLite) for a statement on a fresh driver cursor"""
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    explain_cursor = conn.connection.cursor()
+    try:
+        explain_cursor.execute(prefix + statement, parameters)
+        return explain_cursor.fetchall()
+    finally:
+        explain_cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault("profiler_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    current = _current.get()
+    starts = conn.info.get("profiler_start")
+    if current is None or not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    current.record(statement, elapsed)
+
+    if elapsed * 1000 < settings.SQL_SLOW_QUERY_MS or executemany:
+        return
+    try:
+        plan = _explain(conn, statement, parameters)
+    except Exception as e:
+        plan = [f"EXPLAIN failed: {e}"]
+    current.slow.append({"sql": statement, "seconds": elapsed, "plan": plan})
+    logger.warning(
+        f"Slow query ({elapsed * 1000:.1f} ms) in {current.name}: {normalize_sql(statement)[:500]}\n"
+        + "\n".join(f"  {row}" for row in plan)
+    )
+
+
+def install() -> None:
+    """Attach the profiler's cursor listeners to every engine (idempotent)"""
+    global _installed
+    with _install_lock:
+        if not _installed:
+            event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+            _installed = True
+
+
+@contextmanager
+def profile(name: str, log: bool = True):
+    """
+    Profile the SQL executed by the current request, job or thread
+
+    Args:
+        name: Label used in log output
+        log: Log a summary and warn about N+1 patterns on exit
+
+    Yields:
+        QueryProfile filled in as statements run
+    """
+    install()
+    current = QueryProfile(name)
+    token = _current.set(current)
+    try:
+        yield current
+    finally:
+        _current.reset(token)
+        if log:
+            for stats in current.n_plus_one():
+                logger.warning(f"Possible N+1 in {name}: {stats.count}x {stats.sql[:300]}")
+            logger.debug(current.report())
+
+
+@contextmanager
+def query_budget(max_queries: int, name: str = "query budget"):
+    """
+    Fail when the with-block executes more than ``max_queries`` statements
+
+    Args:
+        max_queries: Allowed statements
+        name: Label used in the failure report
+
+    Yields:
+        QueryProfile of the block
+
+    Raises:
+        QueryBudgetExceeded: If the budget is exceeded
+    """
+    with profile(name, log=False) as current:
+        yield current
+    if current.count > max_queries:
+        raise QueryBudgetExceeded(current, max_queries)
+
+
+class ProfilerMiddleware:
+    """ASGI middleware profiling the SQL of every request (enable with SQL_PROFILE)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with profile(f"{scope['method']} {scope['path']}"):
+            await self.app(scope, receive, send)
@@ -0,0 +1,40 @@
+"""pytest plugin enforcing SQL query budgets
+
+Enable with ``pytest -p src.database.pytest_plugin`` (or list it in a
+conftest's ``pytest_plugins``), then either mark a test::
+
+    @pytest.mark.query_budget(3)
+    def test_report(db): ...
+
+(only the test body counts, not fixture setup) or limit just part of
+it with the fixture::
+
+    def test_report(db, query_budget):
+        with query_budget(3):
+            TableGenerator(db).get_trending_data()
+"""
+import pytest
+from src.database.profiler import query_budget as _query_budget
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "query_budget(n): fail the test if it executes more than n SQL statements"
+    )
+
+
+@pytest.fixture
+def query_budget():
+    """Context manager factory: ``with query_budget(n): ...``"""
+    return _query_budget
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    # Only the test body counts: fixture setup (e.g. creating tables) is
+    # outside the budget, and going over it fails the test itself
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+    with _query_budget(marker.args[0], item.nodeid):
+        return (yield)
@@ -0,0 +1,127 @@
+"""Lookups of fetch runs (the scrape of one trending page on one day)"""
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from src.database.models import FetchRun
+
+
+def latest_run_stmt(since: str = "daily", language: Optional[str] = None) -> Select:
+    """
+    Build the query for the most recent fetch run of a trending page
+
+    Args:
+        since: Time range - "daily", "weekly", or "monthly"
+        language: Programming language filter (None for all languages)
+
+    Returns:
+        SELECT statement usable with sync and async sessions
+    """
+    return select(FetchRun).where(
+        FetchRun.since == since,
+        FetchRun.language == (language or "")
+    ).order_by(FetchRun.fetched_at.desc()).limit(1)
+
+
+def run_for_date_stmt(day: date, since: str = "daily", language: Optional[str] = None) -> Select:
+    """
+    Build the query for the fetch run of a trending page on a given day
+
+    Args:
+        day: Calendar day
+        since: Time range - "daily", "weekly", or "monthly"
+        language: Programming language filter (None for all languages)
+
+    Returns:
+        SELECT statement usable with sync and async sessions
+    """
+    if isinstance(day, datetime):
+        day = day.date()
+    return select(FetchRun).where(
+        FetchRun.run_date == day,
+        FetchRun.since == since,
+        FetchRun.language == (language or "")
+    )
+
+
+def get_latest_run(db: Session, since: str = "daily", language: Optional[str] = None) -> Optional[FetchRun]:
+    """
+    Get the most recent fetch run for a trending page
+
+    Args:
+        db: Database session
+        since: Time range - "daily", "weekly", or "monthly"
+        language: Programming language filter (None for all languages)
+
+    Returns:
+        Latest fetch run, or None if the page was never fetched
+    """
+    return db.scalars(latest_run_stmt(since, language)).first()
+
+
+def get_run_for_date(
+    db: Session,
+    day: date,
+    since: str = "daily",
+    language: Optional[str] = None
+) -> Optional[FetchRun]:
+    """
+    Get the fetch run of a trending page on a given day
+
+    Args:
+        db: Database session
+        day: Calendar day
+        since: Time range - "daily", "weekly", or "monthly"
+        language: Programming language filter (None for all languages)
+
+    Returns:
+        Fetch run, or None if the page was not fetched that day
+    """
+    return db.scalars(run_for_date_stmt(day, since, language)).first()
+
+
+def get_runs_for_range(
+    db: Session,
+    start: date,
+    end: date,
+    since: str = "daily",
+    language: Optional[str] = None
+) -> Dict[date, FetchRun]:
+    """
+    Get the fetch runs of a trending page for every day of a date range
+
+    Args:
+        db: Database session
+        start: First day
+        end: Last day (inclusive)
+        since: Time range - "daily", "weekly", or "monthly"
+        language: Programming language filter (None for all languages)
+
+    Returns:
+        Mapping of day to fetch run (days without a fetch are absent)
+    """
+    runs = db.scalars(select(FetchRun).where(
+        FetchRun.run_date >= start,
+        FetchRun.run_date <= end,
+        FetchRun.since == since,
+        FetchRun.language == (language or "")
+    ))
+    return {run.run_date: run for run in runs}
+
+
+def get_runs_between(db: Session, start: date, end: date) -> List[FetchRun]:
+    """
+    Get the fetch runs of every trending page within a date range
+
+    Args:
+        db: Database session
+        start: First day
+        end: Last day (inclusive)
+
+    Returns:
+        Fetch runs of all ranges and languages, oldest day first
+    """
+    return list(db.scalars(
+        select(FetchRun).where(FetchRun.run_date >= start, FetchRun.run_date <= end).order_by(FetchRun.run_date)
+    ))
@@ -0,0 +1,192 @@
+"""Full-text search over project names and descriptions (SQLite FTS5)"""
+import logging
+import re
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import DDL, and_, column, event, exists, func, literal_column, or_, select, table, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from src.database.models import Project, TrendingSnapshot
+
+logger = logging.getLogger(__name__)
+
+# External-content index: the text lives only in projects, the FTS table
+# stores the inverted index keyed by projects.id
+SEARCH_INDEX_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5(
+        name, full_name, description,
+        content='projects', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_fts_insert AFTER INSERT ON projects BEGIN
+        INSERT INTO projects_fts (rowid, name, full_name, description)
+        VALUES (new.id, new.name, new.full_name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_fts_delete AFTER DELETE ON projects BEGIN
+        INSERT INTO projects_fts (projects_fts, rowid, name, full_name, description)
+        VALUES ('delete', old.id, old.name, old.full_name, old.description);
+    END
+    """,
+    # Every ingest upserts description along with stars; only reindex when
+    # the indexed text actually changed
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_fts_update AFTER UPDATE ON projects
+    WHEN old.name IS NOT new.name
+        OR old.full_name IS NOT new.full_name
+        OR old.description IS NOT new.description
+    BEGIN
+        INSERT INTO projects_fts (projects_fts, rowid, name, full_name, description)
+        VALUES ('delete', old.id, old.name, old.full_name, old.description);
+        INSERT INTO projects_fts (rowid, name, full_name, description)
+        VALUES (new.id, new.name, new.full_name, new.description);
+    END
+    """,
+]
+
+DROP_SEARCH_INDEX_DDL = [
+    "DROP TRIGGER IF EXISTS projects_fts_update",
+    "DROP TRIGGER IF EXISTS projects_fts_delete",
+    "DROP TRIGGER IF EXISTS projects_fts_insert",
+    "DROP TABLE IF EXISTS projects_fts",
+]
+
+# Tables created with Base.metadata.create_all get the index as well
+for _statement in SEARCH_INDEX_DDL:
+    event.listen(Project.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+
+projects_fts = table('projects_fts', column('rowid'))
+
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+
+def match_query(q: str) -> str:
+    """
+    Turn free text into a safe FTS5 MATCH expression
+
+    Every word must match; the last one also matches as a prefix so
+    search-as-you-type works. FTS5 operators in the input are ignored.
+
+    Args:
+        q: User query
+
+    Returns:
+        FTS5 query, or "" if the input has no searchable words
+    """
+    tokens = _TOKEN.findall(q)
+    if not tokens:
+        return ""
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += '*'
+    return " ".join(terms)
+
+
+def _apply_filters(query: Select, language: Optional[str], date_from: Optional[datetime],
+                   date_to: Optional[datetime]) -> Select:
+    if language:
+        query = query.where(Project.language == language)
+    if date_from or date_to:
+        conditions = [TrendingSnapshot.project_id == Project.id]
+        if date_from:
+            conditions.append(TrendingSnapshot.date >= date_from)
+        if date_to:
+            conditions.append(TrendingSnapshot.date <= date_to)
+        query = query.where(exists().where(and_(*conditions)))
+    return query
+
+
+def search_stmt(
+    q: str,
+    dialect: str,
+    language: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    limit: int = 20,
+    offset: int = 0
+) -> Select:
+    """
+    Build the ranked project search query
+
+    On SQLite the FTS5 index is matched and ordered by bm25 (name and
+    full_name weigh more than description). Other databases fall back to
+    a LIKE scan ordered by stars.
+
+    Args:
+        q: User query
+        dialect: Database dialect name
+        language: Only projects in this language
+        date_from: Only projects that trended on or after this date
+        date_to: Only projects that trended on or before this date
+        limit: Page size
+        offset: Rows to skip
+
+    Returns:
+        SELECT of project columns plus a "score" column (lower is better)
+    """
+    columns = [
+        Project.id, Project.name, Project.full_name, Project.description,
+        Project.language, Project.stars, Project.url
+    ]
+
+    if dialect == 'sqlite':
+        score = func.bm25(literal_column('projects_fts'), 10.0, 5.0, 1.0).label('score')
+        query = select(*columns, score).select_from(projects_fts).join(
+            Project, Project.id == projects_fts.c.rowid
+        ).where(text("projects_fts MATCH :match").bindparams(match=match_query(q)))
+    else:
+        pattern = f"%{q}%"
+        score = (-Project.stars).label('score')
+        query = select(*columns, score).where(or_(
+            Project.full_name.ilike(pattern), Project.description.ilike(pattern)
+        ))
+
+    query = _apply_filters(query, language, date_from, date_to)
+    return query.order_by(score, Project.id).limit(limit).offset(offset)
+
+
+def rebuild_search_index(db: Session) -> int:
+    """
+    Recreate the FTS5 index from the projects table
+
+    Creates the index and triggers if they are missing, then rebuilds the
+    whole index (use after bulk edits made with triggers disabled, or to
+    compact it).
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of indexed projects
+    """
+    if db.get_bind().dialect.name != 'sqlite':
+        logger.info("Full-text index is SQLite-only; search uses LIKE on this database")
+        return 0
+
+    for statement in SEARCH_INDEX_DDL:
+        db.execute(text(statement))
+    db.execute(text("INSERT INTO projects_fts (projects_fts) VALUES ('rebuild')"))
+    db.execute(text("INSERT INTO projects_fts (projects_fts) VALUES ('optimize')"))
+    db.commit()
+
+    count = db.scalar(select(func.count(Project.id)))
+    logger.info(f"Rebuilt search index for {count} projects")
+    return count
+
+
+def search_row_to_dict(row) -> dict:
+    """Convert a search_stmt row to its API representation"""
+    return {
+        "id": row.id,
+        "name": row.name,
+        "full_name": row.full_name,
+        "description": row.description,
+        "language": row.language,
+        "stars": row.stars,
+        "url": row.url,
+        "score": row.score
+    }
+
@@ -0,0 +1,150 @@
+"""Server-Sent Events broadcast of new trending runs"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set
+import orjson
+from sqlalchemy import select
+from src.config.settings import settings
+from src.database.base import get_async_sessionmaker
+from src.database.data_version import data_version_stmt
+from src.database.models import FetchRun, Project, TrendingSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+def rank_diff(previous: Dict[str, int], current: Dict[str, int]) -> Dict[str, List]:
+    """
+    Compare the ranks of two runs
+
+    Args:
+        previous: full_name -> rank of the older run
+        current: full_name -> rank of the newer run
+
+    Returns:
+        Projects that entered, left, or moved (with old and new rank)
+    """
+    return {
+        "entered": sorted(set(current) - set(previous), key=current.get),
+        "left": sorted(set(previous) - set(current), key=previous.get),
+        "moved": [
+            {"full_name": name, "from": previous[name], "to": rank}
+            for name, rank in sorted(current.items(), key=lambda item: item[1])
+            if name in previous and previous[name] != rank
+        ]
+    }
+
+
+def format_event(event: str, data: Dict[str, Any]) -> bytes:
+    """Encode one SSE message"""
+    return b"event: " + event.encode('utf-8') + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+class RunBroadcaster:
+    """
+    Single polling task that fans new-run events out to every SSE client
+
+    The database is read once per poll interval no matter how many clients
+    are connected; idle clients only cost a queue.
+    """
+
+    def __init__(self, poll_interval: Optional[float] = None, queue_size: int = 8):
+        """
+        Initialize broadcaster
+
+        Args:
+            poll_interval: Seconds between data version checks (defaults to settings.SSE_POLL_INTERVAL)
+            queue_size: Events buffered per client before it misses some
+        """
+        self.poll_interval = poll_interval or settings.SSE_POLL_INTERVAL
+        self.queue_size = queue_size
+        self.version = None
+        self.latest_run = None
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task = None
+        self._wake = None
+        self._loop = None
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a client and start the poller if needed"""
+        if self._task is None or self._task.done():
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._poll())
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def notify(self) -> None:
+        """Check for a new run now instead of at the next poll (thread-safe)"""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def publish(self, event: str, data: Dict[str, Any]) -> None:
+        message = format_event(event, data)
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                logger.debug("Dropping event for a slow SSE client")
+
+    async def _poll(self) -> None:
+        while self._subscribers:
+            try:
+                await self._check()
+            except Exception as e:
+                logger.error(f"SSE poll failed: {e}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def _check(self) -> None:
+        async with get_async_sessionmaker()() as session:
+            version = await session.scalar(data_version_stmt())
+            if version == self.version:
+                return
+            first_check = self.version is None
+            self.version = version
+
+            # Ingests of other pages bump the version too; only announce a
+            # new or re-fetched latest daily run
+            runs = (await session.execute(
+                select(FetchRun.id, FetchRun.fetched_at).where(
+                    FetchRun.since == "daily", FetchRun.language == ""
+                ).order_by(FetchRun.fetched_at.desc()).limit(2)
+            )).all()
+            latest = (runs[0].id, runs[0].fetched_at) if runs else None
+            announce = not first_check and latest != self.latest_run
+            self.latest_run = latest
+            if not announce:
+                return
+            event = await self._run_event(session, runs)
+
+        event["version"] = version
+        self.publish("run", event)
+
+    async def _run_event(self, session, runs) -> Dict[str, Any]:
+        """Describe the latest daily run and its rank changes from the previous one"""
+        if not runs:
+            return {"run_id": None}
+
+        ranks = {run.id: {} for run in runs}
+        rows = await session.execute(
+            select(TrendingSnapshot.run_id, Project.full_name, TrendingSnapshot.rank)
+            .join(Project, TrendingSnapshot.project_id == Project.id)
+            .where(TrendingSnapshot.run_id.in_(ranks))
+        )
+        for run_id, full_name, rank in rows:
+            ranks[run_id][full_name] = rank
+
+        latest = runs[0]
+        previous = ranks[runs[1].id] if len(runs) > 1 else {}
+        return {
+            "run_id": latest.id,
+            "fetched_at": latest.fetched_at.isoformat(),
+            **rank_diff(previous, ranks[latest.id])
+        }
@@ -0,0 +1,208 @@
+"""Streaming export of the full dataset as CSV, NDJSON or Parquet"""
+import csv
+import io
+from datetime import date, datetime
+from typing import Iterable, Iterator, List, Optional, Sequence
+import orjson
+from sqlalchemy import Date, DateTime, Integer, Table, exists, select
+from sqlalchemy.orm import Session
+from src.database.models import FetchRun, Project, TrendingSnapshot, Summary
+
+EXPORT_TABLES = {
+    'projects': Project.__table__,
+    'runs': FetchRun.__table__,
+    'snapshots': TrendingSnapshot.__table__,
+    'summaries': Summary.__table__,
+}
+
+EXPORT_FORMATS = {
+    'csv': ('csv', 'text/csv'),
+    'ndjson': ('ndjson', 'application/x-ndjson'),
+    'parquet': ('parquet', 'application/vnd.apache.parquet'),
+}
+
+
+def export_stmt(name: str, date_from: Optional[date] = None, date_to: Optional[date] = None):
+    """
+    Build the SELECT for one exported table
+
+    Date filters apply to snapshot and run dates. Projects and summaries are
+    limited to projects that trended within the range.
+
+    Args:
+        name: Table name in EXPORT_TABLES
+        date_from: First day (inclusive)
+        date_to: Last day (inclusive)
+
+    Returns:
+        SELECT statement ordered by primary key
+    """
+    table = EXPORT_TABLES[name]
+    query = select(table).order_by(table.c.id)
+    if date_from is None and date_to is None:
+        return query
+
+    snapshots = TrendingSnapshot.__table__
+
+    def in_range(column):
+        conditions = []
+        if date_from is not None:
+            conditions.append(column >= datetime.combine(date_from, datetime.min.time()))
+        if date_to is not None:
+            conditions.append(column <= datetime.combine(date_to, datetime.max.time()))
+        return conditions
+
+    if name == 'snapshots':
+        return query.where(*in_range(table.c.date))
+    if name == 'runs':
+        return query.where(*in_range(table.c.fetched_at))
+    project_id = table.c.id if name == 'projects' else table.c.project_id
+    return query.where(exists().where(snapshots.c.project_id == project_id, *in_range(snapshots.c.date)))
+
+
+def iter_batches(db: Session, stmt, batch_size: int) -> Iterator[Sequence]:
+    """
+    Execute a SELECT on a server-side cursor and yield rows in batches
+
+    Args:
+        db: Database session
+        stmt: SELECT statement
+        batch_size: Rows per batch
+
+    Yields:
+        Lists of row tuples
+    """
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    for partition in result.partitions():
+        yield partition
+
+
+class _Drain(io.RawIOBase):
+    """Write-only buffer whose contents are handed out after every write"""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def take(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _csv_chunks(columns: List[str], batches: Iterable[Sequence]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in batches:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def _ndjson_chunks(columns: List[str], batches: Iterable[Sequence]) -> Iterator[bytes]:
+    for rows in batches:
+        yield b"".join(orjson.dumps(dict(zip(columns, row))) + b"\n" for row in rows)
+
+
+def _arrow_schema(table: Table):
+    """Map a table's SQLAlchemy column types to a pyarrow schema"""
+    import pyarrow as pa
+
+    fields = []
+    for column in table.columns:
+        if isinstance(column.type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column.type, DateTime):
+            arrow_type = pa.timestamp('us')
+        elif isinstance(column.type, Date):
+            arrow_type = pa.date32()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.name, arrow_type, nullable=column.nullable))
+    return pa.schema(fields)
+
+
+def _parquet_chunks(table: Table, batches: Iterable[Sequence]) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema(table)
+    sink = _Drain()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        # One row group per batch, flushed to the caller before the next is read
+        for rows in batches:
+            columns = list(zip(*rows))
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                schema=schema
+            ))
+            yield sink.take()
+    finally:
+        writer.close()
+    yield sink.take()
+
+
+def export_table(
+    db: Session,
+    name: str,
+    format: str = 'csv',
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    batch_size: int = 10000
+) -> Iterator[bytes]:
+    """
+    Stream one table in the requested format
+
+    Memory use is bounded by ``batch_size`` regardless of table size.
+
+    Args:
+        db: Database session
+        name: Table name in EXPORT_TABLES
+        format: "csv", "ndjson" or "parquet"
+        date_from: First day (inclusive)
+        date_to: Last day (inclusive)
+        batch_size: Rows fetched (and Parquet row group size)
+
+    Returns:
+        Iterator of encoded output chunks
+
+    Raises:
+        ValueError: If the table or format is unknown
+        RuntimeError: If Parquet is requested without pyarrow installed
+    """
+    if name not in EXPORT_TABLES:
+        raise ValueError(f"Unknown export table '{name}', expected one of {', '.join(EXPORT_TABLES)}")
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{format}', expected one of {', '.join(EXPORT_FORMATS)}")
+
+    if format == 'parquet':
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    table = EXPORT_TABLES[name]
+    columns = [column.name for column in table.columns]
+    batches = iter_batches(db, export_stmt(name, date_from, date_to), batch_size)
+
+    if format == 'csv':
+        return _csv_chunks(columns, batches)
+    if format == 'ndjson':
+        return _ndjson_chunks(columns, batches)
+    return _parquet_chunks(table, batches)
@@ -1,4 +1,13 @@
 """GitHub data fetching module"""
-from src.fetch_data.trending_scraper import TrendingScraper
+from typing import TYPE_CHECKING
+from src.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.fetch_data.trending_scraper import TrendingScraper
+
+# requests and the HTML parsers load when the scraper is first used
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'TrendingScraper': 'src.fetch_data.trending_scraper'
+})
 
 __all__ = ['TrendingScraper']
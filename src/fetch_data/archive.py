@@ -0,0 +1,126 @@
+"""Append-only compressed archive of raw trending pages"""
+import gzip
+import json
+import logging
+import os
+import threading
+import zlib
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PageArchive:
+    """
+    Store every fetched trending page so history can be re-parsed offline
+
+    Pages are grouped into one file per day (``YYYY/YYYY-MM-DD.jsonl.gz``).
+    Each page is appended as its own gzip member holding one JSON record,
+    so files are only ever appended to and stay readable with gzip.open.
+    """
+
+    def __init__(self, root_dir: str):
+        """
+        Initialize page archive
+
+        Args:
+            root_dir: Directory to store archive files
+        """
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def day_path(self, day: date) -> Path:
+        """Get the archive file for a day"""
+        return self.root_dir / f"{day:%Y}" / f"{day:%Y-%m-%d}.jsonl.gz"
+
+    def append(
+        self,
+        html: str,
+        url: str,
+        since: Optional[str] = None,
+        language: Optional[str] = None,
+        fetched_at: datetime = None
+    ) -> Path:
+        """
+        Append a fetched page to the archive
+
+        Args:
+            html: Page HTML
+            url: Page URL
+            since: Time range of the page
+            language: Programming language filter of the page
+            fetched_at: Fetch timestamp (default: now)
+
+        Returns:
+            Path of the archive file written to
+        """
+        fetched_at = fetched_at or datetime.now()
+        record = {
+            'fetched_at': fetched_at.isoformat(),
+            'url': url,
+            'since': since,
+            'language': language,
+            'html': html,
+        }
+        member = gzip.compress((json.dumps(record) + '\n').encode('utf-8'))
+
+        path = self.day_path(fetched_at.date())
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # A single O_APPEND write keeps concurrent writers from interleaving
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, member)
+            finally:
+                os.close(fd)
+        return path
+
+    def day_files(self, start: date, end: date) -> List[Path]:
+        """
+        List archive files for an inclusive date range
+
+        Args:
+            start: First day
+            end: Last day
+
+        Returns:
+            Existing archive files in chronological order
+        """
+        paths = []
+        day = start
+        while day <= end:
+            path = self.day_path(day)
+            if path.exists():
+                paths.append(path)
+            day += timedelta(days=1)
+        return paths
+
+
+def read_archive_file(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Read page records from an archive file
+
+    A truncated or corrupt file yields the records before the damage and
+    logs a warning, so one bad day does not abort a backfill.
+
+    Args:
+        path: Archive file path
+
+    Yields:
+        Page records with fetched_at parsed to datetime
+    """
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                record['fetched_at'] = datetime.fromisoformat(record['fetched_at'])
+                yield record
+    except EOFError:
+        # A writer was interrupted mid-append; earlier records are intact
+        logger.warning(f"Truncated archive file {path}, ignoring incomplete trailing record")
+    except (gzip.BadGzipFile, zlib.error, ValueError) as e:
+        # Corrupt member, or a partial/invalid JSON record (json.JSONDecodeError)
+        logger.warning(f"Corrupt archive file {path}, ignoring the rest of it: {e}")
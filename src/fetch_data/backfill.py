@@ -0,0 +1,122 @@
+"""Offline re-parse of archived trending pages into the database"""
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from sqlalchemy.orm import Session
+from src.config.settings import settings
+from src.database.ingest import bulk_ingest
+from src.fetch_data.archive import PageArchive, read_archive_file
+from src.fetch_data.parsers import get_parser
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_archive_file(args: Tuple[str, str]) -> List[Dict[str, Any]]:
+    """
+    Parse every page of one archive file (runs in a worker process)
+
+    Args:
+        args: Tuple of (archive file path, parser backend name)
+
+    Returns:
+        List of page dictionaries with fetched_at, since, language and repos
+    """
+    path, parser_name = args
+    parser = get_parser(parser_name)
+
+    pages = []
+    for record in read_archive_file(Path(path)):
+        pages.append({
+            'fetched_at': record['fetched_at'],
+            'since': record['since'],
+            'language': record['language'],
+            'repos': parser(record['html']),
+        })
+    return pages
+
+
+def backfill_archive(
+    db: Session,
+    start: date,
+    end: date,
+    archive: PageArchive = None,
+    workers: int = None,
+    parser: str = None
+) -> int:
+    """
+    Re-parse archived pages for a date range and bulk-load them
+
+    Archive files are parsed on a process pool, one file (day) per task;
+    results are ingested in chronological order on the calling process and
+    committed once per day. At most two tasks per worker are in flight, so
+    parsed pages waiting for a slower ingest do not pile up in memory.
+
+    Args:
+        db: Database session
+        start: First day to backfill
+        end: Last day to backfill (inclusive)
+        archive: Page archive (default: settings.SCRAPER_ARCHIVE_DIR)
+        workers: Number of parser processes (default: CPU count)
+        parser: Page parser backend (default: settings.SCRAPER_PARSER)
+
+    Returns:
+        Number of saved snapshots
+    """
+    archive = archive or PageArchive(settings.SCRAPER_ARCHIVE_DIR)
+    parser = parser or settings.SCRAPER_PARSER
+
+    paths = archive.day_files(start, end)
+    logger.info(f"Backfilling {len(paths)} archive days from {start} to {end}")
+    if not paths:
+        return 0
+
+    started = time.monotonic()
+    total_pages = 0
+    total_rows = 0
+    workers = workers or os.cpu_count() or 1
+    remaining = iter(paths)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque()
+
+        def submit_next() -> None:
+            path = next(remaining, None)
+            if path is not None:
+                in_flight.append((path, executor.submit(_parse_archive_file, (str(path), parser))))
+
+        for _ in range(2 * workers):
+            submit_next()
+
+        while in_flight:
+            path, future = in_flight.popleft()
+            pages = future.result()
+            # Refill before ingesting so the workers stay busy meanwhile
+            submit_next()
+            try:
+                for page in pages:
+                    total_rows += bulk_ingest(
+                        db, page['repos'],
+                        snapshot_date=page['fetched_at'],
+                        since=page['since'] or "daily",
+                        language=page['language']
+                    )
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.error(f"Error backfilling {path}: {e}")
+                raise
+
+            total_pages += len(pages)
+            logger.debug(f"Backfilled {path.name}: {len(pages)} pages")
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        f"Backfill finished: {total_pages} pages, {total_rows} snapshots in {elapsed:.1f}s "
+        f"({total_pages / elapsed if elapsed else 0:.0f} pages/s)"
+    )
+    return total_rows
@@ -0,0 +1,184 @@
+"""Parser backends for GitHub trending pages"""
+import logging
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _build_repo_data(
+    rank: int,
+    href: str,
+    description: str,
+    language: Optional[str],
+    stars_text: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Build a repository data dictionary from extracted fields
+
+    Args:
+        rank: Position on the trending page
+        href: Repository link (e.g., "/owner/name")
+        description: Repository description
+        language: Programming language
+        stars_text: Raw star count text (e.g., "1,234")
+
+    Returns:
+        Repository data dictionary
+    """
+    full_name = href.strip('/')
+    name = full_name.split('/')[-1]
+    owner = full_name.split('/')[0]
+
+    stars = 0
+    if stars_text is not None:
+        try:
+            stars = int(stars_text.strip().replace(',', ''))
+        except ValueError:
+            pass
+
+    return {
+        'rank': rank,
+        'name': name,
+        'full_name': full_name,
+        'owner': owner,
+        'description': description,
+        'language': language,
+        'stars': stars,
+        'url': f"https://github.com/{full_name}",
+    }
+
+
+def parse_with_bs4(html: str) -> List[Dict[str, Any]]:
+    """
+    Parse a trending page with BeautifulSoup CSS selectors
+
+    Args:
+        html: Trending page HTML
+
+    Returns:
+        List of repository data dictionaries
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'lxml')
+
+    trending_data = []
+    for rank, repo in enumerate(soup.select('article.Box-row'), 1):
+        try:
+            h2 = repo.select_one('h2 a')
+            if not h2:
+                continue
+
+            desc_elem = repo.select_one('p')
+            lang_elem = repo.select_one('[itemprop="programmingLanguage"]')
+            stars_elem = repo.select_one('a[href*="/stargazers"]')
+
+            trending_data.append(_build_repo_data(
+                rank=rank,
+                href=h2['href'],
+                description=desc_elem.text.strip() if desc_elem else "",
+                language=lang_elem.text.strip() if lang_elem else None,
+                stars_text=stars_elem.text if stars_elem else None,
+            ))
+
+        except Exception as e:
+            logger.warning(f"Failed to parse repo: {e}")
+            continue
+
+    return trending_data
+
+
+@lru_cache(maxsize=None)
+def _xpaths() -> Dict[str, Any]:
+    """XPath equivalents of the BeautifulSoup selectors, compiled on first use"""
+    from lxml import etree
+
+    return {
+        'articles': etree.XPath(
+            "//article[contains(concat(' ', normalize-space(@class), ' '), ' Box-row ')]", smart_strings=False
+        ),
+        'link': etree.XPath("(.//h2//a)[1]"),
+        'description': etree.XPath("(.//p)[1]"),
+        'language': etree.XPath("(.//*[@itemprop='programmingLanguage'])[1]"),
+        'stars': etree.XPath("(.//a[contains(@href, '/stargazers')])[1]"),
+    }
+
+
+def _first(xpath, element) -> Optional[Any]:
+    """Return the first XPath match under ``element``, or None"""
+    found = xpath(element)
+    return found[0] if found else None
+
+
+def parse_with_lxml(html: str) -> List[Dict[str, Any]]:
+    """
+    Parse a trending page with lxml and precompiled XPath
+
+    Produces the same output as parse_with_bs4 without building a
+    BeautifulSoup tree.
+
+    Args:
+        html: Trending page HTML
+
+    Returns:
+        List of repository data dictionaries
+    """
+    if not html or not html.strip():
+        return []
+
+    import lxml.html
+
+    xpaths = _xpaths()
+    root = lxml.html.fromstring(html)
+
+    trending_data = []
+    for rank, repo in enumerate(xpaths['articles'](root), 1):
+        try:
+            link = _first(xpaths['link'], repo)
+            if link is None:
+                continue
+
+            href = link.get('href')
+            if href is None:
+                raise KeyError('href')
+
+            desc_elem = _first(xpaths['description'], repo)
+            lang_elem = _first(xpaths['language'], repo)
+            stars_elem = _first(xpaths['stars'], repo)
+
+            trending_data.append(_build_repo_data(
+                rank=rank,
+                href=href,
+                description=desc_elem.text_content().strip() if desc_elem is not None else "",
+                language=lang_elem.text_content().strip() if lang_elem is not None else None,
+                stars_text=stars_elem.text_content() if stars_elem is not None else None,
+            ))
+
+        except Exception as e:
+            logger.warning(f"Failed to parse repo: {e}")
+            continue
+
+    return trending_data
+
+
+PARSERS: Dict[str, Callable[[str], List[Dict[str, Any]]]] = {
+    'lxml': parse_with_lxml,
+    'bs4': parse_with_bs4,
+}
+
+
+def get_parser(name: str) -> Callable[[str], List[Dict[str, Any]]]:
+    """
+    Get a trending page parser by name
+
+    Args:
+        name: Backend name - "lxml" or "bs4"
+
+    Returns:
+        Parser function taking page HTML and returning repository data
+    """
+    try:
+        return PARSERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown trending parser '{name}', expected one of {sorted(PARSERS)}")
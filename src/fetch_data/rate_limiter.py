@@ -0,0 +1,147 @@
+"""Process-wide rate limiting and retry policy for outbound scraper traffic"""
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Thread-safe token bucket with a shared back-off window"""
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize rate limiter
+
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum number of requests allowed back to back
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.requests = 0
+        self.wait_seconds = 0.0
+        self.retries = 0
+        self.throttled = 0
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    self.requests += 1
+                    self.wait_seconds += waited
+                    return waited
+
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    delay = (1 - self._tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back every caller for a while, e.g. after a 429 response
+
+        Args:
+            seconds: Back-off duration
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+    def record_retry(self, throttled: bool = False) -> None:
+        """Count a retried request, and whether the server throttled it"""
+        with self._lock:
+            self.retries += 1
+            if throttled:
+                self.throttled += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Get limiter metrics"""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'wait_seconds': round(self.wait_seconds, 3),
+                'retries': self.retries,
+                'throttled': self.throttled,
+            }
+
+
+def backoff_delay(attempt: int, base: float = None, cap: float = None) -> float:
+    """
+    Exponential back-off with full jitter
+
+    Args:
+        attempt: Zero-based retry attempt
+        base: Initial delay in seconds (default: settings.SCRAPER_BACKOFF_BASE)
+        cap: Maximum delay in seconds (default: settings.SCRAPER_BACKOFF_MAX)
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    base = settings.SCRAPER_BACKOFF_BASE if base is None else base
+    cap = settings.SCRAPER_BACKOFF_MAX if cap is None else cap
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if absent or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the rate limiter shared by every scraper in this process"""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(rate=settings.SCRAPER_RATE_LIMIT, burst=settings.SCRAPER_RATE_BURST)
+        return _rate_limiter
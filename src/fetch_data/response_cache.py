@@ -0,0 +1,180 @@
+"""Persistent HTTP response cache with conditional-request support"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """On-disk cache of page bodies and their validators, keyed by URL + params"""
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize response cache
+
+        Args:
+            cache_dir: Directory to store cached responses
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, params: Dict[str, str] = None) -> str:
+        """
+        Build a stable cache key for a request
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Hex digest identifying the request
+        """
+        canonical = json.dumps([url, sorted((params or {}).items())])
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def content_hash(body: str) -> str:
+        """Hash a response body"""
+        return hashlib.sha256(body.encode('utf-8')).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _body_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.html.gz"
+
+    def get(self, url: str, params: Dict[str, str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get cached validators for a request
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Dictionary with etag, last_modified and content_hash, or None
+        """
+        path = self._meta_path(self.make_key(url, params))
+        try:
+            return json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Build If-None-Match / If-Modified-Since headers from a cache entry
+
+        Args:
+            entry: Cache entry returned by get()
+
+        Returns:
+            Request headers (empty if nothing is cached)
+        """
+        headers = {}
+        if entry and self._body_path(entry['key']).exists():
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def load_body(self, entry: Dict[str, Any]) -> str:
+        """
+        Read the cached body for an entry
+
+        Args:
+            entry: Cache entry returned by get()
+
+        Returns:
+            Cached page body
+        """
+        with gzip.open(self._body_path(entry['key']), 'rt', encoding='utf-8') as f:
+            return f.read()
+
+    def store(
+        self,
+        url: str,
+        params: Dict[str, str],
+        body: str,
+        etag: str = None,
+        last_modified: str = None
+    ) -> bool:
+        """
+        Store a freshly downloaded response
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            body: Response body
+            etag: ETag response header
+            last_modified: Last-Modified response header
+
+        Returns:
+            True if the body differs from the cached one
+        """
+        key = self.make_key(url, params)
+        previous = self.get(url, params)
+        digest = self.content_hash(body)
+        changed = not previous or previous.get('content_hash') != digest
+
+        if changed:
+            self._atomic_write(self._body_path(key), gzip.compress(body.encode('utf-8')))
+
+        entry = {
+            'key': key,
+            'url': url,
+            'params': params or {},
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_hash': digest,
+        }
+        self._atomic_write(self._meta_path(key), json.dumps(entry).encode('utf-8'))
+        return changed
+
+    def invalidate(self, url: str, params: Dict[str, str] = None) -> None:
+        """
+        Forget a cached response so the next fetch downloads and parses it again
+
+        Used when a page was stored but never made it into the database,
+        otherwise the next fetch would revalidate to 304 and skip it.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+        """
+        key = self.make_key(url, params)
+        for path in (self._meta_path(key), self._body_path(key)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def record(self, hit: bool) -> None:
+        """Count a cache hit (unchanged page) or miss (new or changed page)"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache hit/miss counts"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        """Write a file so readers never observe a partial write"""
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
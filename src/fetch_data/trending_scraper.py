@@ -1,11 +1,18 @@
 """Scrape trending repositories from GitHub without API token"""
 import logging
+import time
 import requests
-from datetime import datetime
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from requests.adapters import HTTPAdapter
 from sqlalchemy.orm import Session
-from src.database.models import Project, TrendingSnapshot
+from src.config.settings import settings
+from src.database.ingest import bulk_ingest
+from src.fetch_data.archive import PageArchive
+from src.fetch_data.parsers import get_parser
+from src.fetch_data.rate_limiter import RateLimiter, backoff_delay, get_rate_limiter, parse_retry_after
+from src.fetch_data.response_cache import ResponseCache
+from src.metrics import ROWS_INGESTED, SCRAPER_PAGES, SCRAPER_STAGE
 
 logger = logging.getLogger(__name__)
 
@@ -15,157 +22,286 @@ class TrendingScraper:
 
     BASE_URL = "https://github.com/trending"
 
-    def __init__(self, db_session: Session):
+    def __init__(
+        self,
+        db_session: Session,
+        max_workers: int = None,
+        cache: ResponseCache = None,
+        parser: str = None,
+        archive: PageArchive = None,
+        rate_limiter: RateLimiter = None
+    ):
         """
         Initialize trending scraper
 
         Args:
             db_session: Database session
+            max_workers: Maximum number of concurrent page fetches
+                (default: settings.SCRAPER_MAX_WORKERS)
+            cache: Response cache (default: one in settings.SCRAPER_CACHE_DIR,
+                or none if that setting is empty)
+            parser: Page parser backend - "lxml" or "bs4"
+                (default: settings.SCRAPER_PARSER)
+            archive: Raw page archive (default: one in settings.SCRAPER_ARCHIVE_DIR,
+                or none if that setting is empty)
+            rate_limiter: Rate limiter (default: the process-wide shared one)
         """
         self.db = db_session
+        self.max_workers = max_workers or settings.SCRAPER_MAX_WORKERS
+        if cache is None and settings.SCRAPER_CACHE_DIR:
+            cache = ResponseCache(settings.SCRAPER_CACHE_DIR)
+        self.cache = cache
+        self.parser = get_parser(parser or settings.SCRAPER_PARSER)
+        if archive is None and settings.SCRAPER_ARCHIVE_DIR:
+            archive = PageArchive(settings.SCRAPER_ARCHIVE_DIR)
+        self.archive = archive
+        self.rate_limiter = rate_limiter or get_rate_limiter()
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
 
-    def scrape_trending(self, language: str = None, since: str = "daily") -> List[Dict[str, Any]]:
+        # Size the connection pool so concurrent fetches share keep-alive
+        # connections instead of opening a new one per page
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _build_request(self, language: str = None, since: str = "daily") -> Tuple[str, Dict[str, str]]:
         """
-        Scrape trending repositories from GitHub
+        Build trending page URL and query parameters
 
         Args:
             language: Programming language filter (e.g., "python")
             since: Time range - "daily", "weekly", or "monthly"
 
         Returns:
-            List of repository data dictionaries
+            Tuple of (url, params)
         """
-        # Build URL
-        url = self.BASE_URL
+        url = f"{self.BASE_URL}/{language}" if language else self.BASE_URL
         params = {}
-        if language:
-            params['spoken_language_code'] = language
         if since:
             params['since'] = since
+        return url, params
 
-        logger.info(f"Scraping GitHub trending: {url} with params {params}")
+    def _get(self, url: str, params: Dict[str, str], headers: Dict[str, str] = None) -> requests.Response:
+        """
+        Send a rate-limited GET, retrying throttled, failed and 5xx requests
 
-        try:
-            response = self.session.get(url, params=params, timeout=30)
+        Retries use jittered exponential back-off, or the server's
+        Retry-After when given. A 429 pauses the shared limiter so every
+        scraper in the process backs off together.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            headers: Extra request headers
+
+        Returns:
+            Final response (may still be an error status once retries run out)
+        """
+        max_retries = settings.SCRAPER_MAX_RETRIES
+        for attempt in range(max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=30)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == max_retries:
+                    raise
+                delay = backoff_delay(attempt)
+                logger.warning(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+                self.rate_limiter.record_retry()
+                time.sleep(delay)
+                continue
+
+            throttled = response.status_code == 429
+            if not (throttled or response.status_code >= 500) or attempt == max_retries:
+                return response
+
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            delay = min(retry_after, settings.SCRAPER_BACKOFF_MAX) if retry_after is not None else backoff_delay(attempt)
+            logger.warning(f"Request to {url} returned {response.status_code}, retrying in {delay:.1f}s")
+            self.rate_limiter.record_retry(throttled=throttled)
+            if throttled:
+                self.rate_limiter.pause(delay)
+            else:
+                time.sleep(delay)
+
+        return response
+
+    def _fetch_page(self, url: str, params: Dict[str, str]) -> Tuple[str, bool]:
+        """
+        Download a trending page, revalidating against the response cache
+
+        Args:
+            url: Page URL
+            params: Query parameters
+
+        Returns:
+            Tuple of (page HTML, whether it changed since the cached copy)
+        """
+        if not self.cache:
+            response = self._get(url, params)
             response.raise_for_status()
+            return response.text, True
 
-            soup = BeautifulSoup(response.text, 'lxml')
+        entry = self.cache.get(url, params)
+        response = self._get(url, params, headers=self.cache.conditional_headers(entry))
 
-            # Find all repository articles
-            repos = soup.select('article.Box-row')
+        if response.status_code == 304:
+            self.cache.record(hit=True)
+            return self.cache.load_body(entry), False
 
-            trending_data = []
-            for rank, repo in enumerate(repos, 1):
-                try:
-                    # Extract repository name and owner
-                    h2 = repo.select_one('h2 a')
-                    if not h2:
-                        continue
-
-                    full_name = h2['href'].strip('/')
-                    name = full_name.split('/')[-1]
-                    owner = full_name.split('/')[0]
-
-                    # Extract description
-                    desc_elem = repo.select_one('p')
-                    description = desc_elem.text.strip() if desc_elem else ""
-
-                    # Extract language
-                    lang_elem = repo.select_one('[itemprop="programmingLanguage"]')
-                    language = lang_elem.text.strip() if lang_elem else None
-
-                    # Extract stars
-                    stars_elem = repo.select_one('a[href*="/stargazers"]')
-                    stars = 0
-                    if stars_elem:
-                        stars_text = stars_elem.text.strip().replace(',', '')
-                        try:
-                            stars = int(stars_text)
-                        except ValueError:
-                            pass
-
-                    # Build URL
-                    url = f"https://github.com/{full_name}"
-
-                    repo_data = {
-                        'rank': rank,
-                        'name': name,
-                        'full_name': full_name,
-                        'owner': owner,
-                        'description': description,
-                        'language': language,
-                        'stars': stars,
-                        'url': url,
-                    }
-
-                    trending_data.append(repo_data)
+        response.raise_for_status()
+        changed = self.cache.store(
+            url, params, response.text,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+        self.cache.record(hit=not changed)
+        return response.text, changed
 
-                except Exception as e:
-                    logger.warning(f"Failed to parse repo: {e}")
-                    continue
+    def parse_trending(self, html: str) -> List[Dict[str, Any]]:
+        """
+        Parse repositories from a trending page
+
+        Args:
+            html: Trending page HTML
+
+        Returns:
+            List of repository data dictionaries
+        """
+        return self.parser(html)
+
+    def scrape_trending(
+        self,
+        language: str = None,
+        since: str = "daily",
+        skip_unchanged: bool = False
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Scrape trending repositories from GitHub
+
+        Args:
+            language: Programming language filter (e.g., "python")
+            since: Time range - "daily", "weekly", or "monthly"
+            skip_unchanged: Return None instead of parsing when the page is
+                identical to the cached copy
+
+        Returns:
+            List of repository data dictionaries, or None if skipped
+        """
+        url, params = self._build_request(language=language, since=since)
+        logger.info(f"Scraping GitHub trending: {url} with params {params}")
+
+        fetched = False
+        try:
+            with SCRAPER_STAGE.time(stage="fetch"):
+                html, changed = self._fetch_page(url, params)
+            fetched = True
+            SCRAPER_PAGES.inc(result="changed" if changed else "unchanged")
+            # Unchanged (304) pages are archived too, so a backfill can
+            # rebuild every day's run, not only the days the page changed
+            if self.archive:
+                with SCRAPER_STAGE.time(stage="archive"):
+                    self.archive.append(html, url=url, since=since, language=language)
+            if skip_unchanged and not changed:
+                logger.info(f"Trending page unchanged, skipping: {url} with params {params}")
+                return None
+
+            with SCRAPER_STAGE.time(stage="parse"):
+                trending_data = self.parse_trending(html)
 
             logger.info(f"Successfully scraped {len(trending_data)} trending repositories")
             return trending_data
 
         except Exception as e:
+            SCRAPER_PAGES.inc(result="failed")
             logger.error(f"Error scraping trending: {e}")
+            if fetched:
+                self._forget_page(language=language, since=since)
             raise
 
-    def save_to_database(self, trending_data: List[Dict[str, Any]]) -> int:
+    def _forget_page(self, language: str = None, since: str = "daily") -> None:
+        """
+        Drop a page from the response cache after it failed to parse or save
+
+        The cache entry is written as soon as the page is downloaded; without
+        this the next fetch would get a 304 and the page would never be saved.
+
+        Args:
+            language: Programming language filter
+            since: Time range
+        """
+        if self.cache:
+            url, params = self._build_request(language=language, since=since)
+            self.cache.invalidate(url, params)
+
+    def scrape_many(
+        self,
+        languages: Iterable[Optional[str]] = (None,),
+        ranges: Iterable[str] = ("daily",),
+        skip_unchanged: bool = False
+    ) -> Iterator[Tuple[Optional[str], str, List[Dict[str, Any]]]]:
+        """
+        Scrape several trending pages concurrently
+
+        Every (language, since) combination is fetched on a bounded thread
+        pool sharing this scraper's HTTP session. Results are yielded as
+        soon as each page finishes, not in submission order. A page that
+        fails is logged and skipped so one bad page does not abort the batch.
+
+        Args:
+            languages: Programming language filters (None for all languages)
+            ranges: Time ranges - "daily", "weekly", or "monthly"
+            skip_unchanged: Leave out pages identical to their cached copy
+
+        Yields:
+            Tuples of (language, since, trending_data)
+        """
+        jobs = [(language, since) for language in languages for since in ranges]
+        if not jobs:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+            futures = {
+                executor.submit(
+                    self.scrape_trending, language=language, since=since, skip_unchanged=skip_unchanged
+                ): (language, since)
+                for language, since in jobs
+            }
+            for future in as_completed(futures):
+                language, since = futures[future]
+                try:
+                    trending_data = future.result()
+                except Exception as e:
+                    logger.error(f"Skipping trending page language={language} since={since}: {e}")
+                    continue
+                if trending_data is not None:
+                    yield language, since, trending_data
+
+    def save_to_database(
+        self,
+        trending_data: List[Dict[str, Any]],
+        since: str = "daily",
+        language: str = None
+    ) -> int:
         """
         Save scraped data to database
 
         Args:
             trending_data: List of repository data dictionaries
+            since: Time range of the scraped page
+            language: Programming language filter of the scraped page
 
         Returns:
             Number of saved repositories
         """
-        saved_count = 0
-        snapshot_date = datetime.now()
-
         try:
-            for repo_data in trending_data:
-                # Check if project exists
-                project = self.db.query(Project).filter(
-                    Project.full_name == repo_data['full_name']
-                ).first()
-
-                if project:
-                    # Update existing project
-                    project.stars = repo_data['stars']
-                    project.description = repo_data['description']
-                    project.updated_at = datetime.now()
-                else:
-                    # Create new project
-                    project = Project(
-                        name=repo_data['name'],
-                        full_name=repo_data['full_name'],
-                        description=repo_data['description'],
-                        language=repo_data['language'],
-                        stars=repo_data['stars'],
-                        url=repo_data['url'],
-                        created_at=datetime.now()
-                    )
-                    self.db.add(project)
-                    self.db.flush()
-
-                # Create snapshot
-                snapshot = TrendingSnapshot(
-                    date=snapshot_date,
-                    project_id=project.id,
-                    stars_at_snapshot=repo_data['stars'],
-                    rank=repo_data['rank'],
-                    created_at=datetime.now()
-                )
-                self.db.add(snapshot)
-                saved_count += 1
-
-            self.db.commit()
+            with SCRAPER_STAGE.time(stage="ingest"):
+                saved_count = bulk_ingest(self.db, trending_data, since=since, language=language)
+                self.db.commit()
+            ROWS_INGESTED.inc(saved_count)
             logger.info(f"Saved {saved_count} repositories to database")
             return saved_count
 
@@ -182,8 +318,50 @@ class TrendingScraper:
             language: Programming language filter
             since: Time range
 
+        Returns:
+            Number of saved repositories (0 if the page has not changed)
+        """
+        trending_data = self.scrape_trending(language=language, since=since, skip_unchanged=True)
+        if trending_data is None:
+            return 0
+        try:
+            return self.save_to_database(trending_data, since=since, language=language)
+        except Exception:
+            self._forget_page(language=language, since=since)
+            raise
+
+    def fetch_and_save_many(
+        self,
+        languages: Iterable[Optional[str]] = (None,),
+        ranges: Iterable[str] = ("daily",)
+    ) -> int:
+        """
+        Concurrently scrape several trending pages and save each as it arrives
+
+        Pages are downloaded in parallel; database writes stay on the calling
+        thread because the session is not thread-safe. Pages identical to
+        their cached copy are neither parsed nor saved. A page that fails to
+        save is logged, dropped from the response cache so the next run
+        fetches it again, and skipped.
+
+        Args:
+            languages: Programming language filters (None for all languages)
+            ranges: Time ranges
+
         Returns:
             Number of saved repositories
         """
-        trending_data = self.scrape_trending(language=language, since=since)
-        return self.save_to_database(trending_data)
+        total = 0
+        for language, since, trending_data in self.scrape_many(
+            languages=languages, ranges=ranges, skip_unchanged=True
+        ):
+            try:
+                total += self.save_to_database(trending_data, since=since, language=language)
+            except Exception as e:
+                logger.error(f"Skipping trending page language={language} since={since}: {e}")
+                self._forget_page(language=language, since=since)
+
+        if self.cache:
+            logger.info(f"Response cache stats: {self.cache.stats()}")
+        logger.info(f"Rate limiter stats: {self.rate_limiter.stats()}")
+        return total
@@ -1,6 +1,17 @@
 """Daily report generation module"""
-from src.generate.table_generator import TableGenerator
-from src.generate.trend_analyzer import TrendAnalyzer
-from src.generate.report_generator import ReportGenerator
+from typing import TYPE_CHECKING
+from src.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from src.generate.table_generator import TableGenerator
+    from src.generate.trend_analyzer import TrendAnalyzer
+    from src.generate.report_generator import ReportGenerator
+
+# Submodules load on first use so importing the package stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'TableGenerator': 'src.generate.table_generator',
+    'TrendAnalyzer': 'src.generate.trend_analyzer',
+    'ReportGenerator': 'src.generate.report_generator'
+})
 
 __all__ = ['TableGenerator', 'TrendAnalyzer', 'ReportGenerator']
@@ -0,0 +1,295 @@
+"""Render trending rows as Markdown, HTML and CSV without pandas
+
+The output matches what the previous pandas/tabulate implementation
+produced (``tabulate(tablefmt='pipe')``, ``DataFrame.to_html`` and
+``DataFrame.to_csv``), except that HTML text is now escaped and a
+Markdown column mixing "True"/"False" with decimals, on which tabulate
+raises, is rendered as text.
+
+Markdown columns follow pandas' dtype inference, so None in a numeric
+column shows as "nan". The HTML and CSV renderers stream rows and cannot
+see the whole column: there None in rank or stars (which ingest never
+writes) stays empty instead of NaN, and integers are not shown as floats.
+"""
+import csv
+import html
+import io
+import math
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from wcwidth import wcswidth as _wcswidth
+except ImportError:
+    _wcswidth = None
+
+MARKDOWN_COLUMNS: Sequence[Tuple[str, str]] = (
+    ('rank', 'Rank'),
+    ('name', 'Project Name'),
+    ('language', 'Language'),
+    ('stars', 'Stars'),
+    ('description', 'Description')
+)
+
+HTML_COLUMNS: Sequence[str] = ('Rank', 'Project', 'Language', 'Stars', 'Description')
+
+# tabulate's type ranking: a column takes the most generic type of its cells
+_NONE, _BOOL, _INT, _FLOAT, _STR = range(5)
+_MULTILINE = re.compile(r"\r|\n")
+_LINE_BREAK = re.compile("[\r\n]")
+_HTML_CONTROL = str.maketrans({"\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _convertible(conv, value) -> bool:
+    try:
+        conv(value)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def _is_number(value) -> bool:
+    if not _convertible(float, value):
+        return False
+    if isinstance(value, str) and (math.isinf(float(value)) or math.isnan(float(value))):
+        return value.lower() in ("inf", "-inf", "nan")
+    return True
+
+
+def _is_int(value) -> bool:
+    return type(value) is int or isinstance(value, str) and _convertible(int, value)
+
+
+def _cell_type(value) -> int:
+    if value is None:
+        return _NONE
+    if type(value) is bool or isinstance(value, str) and value in ("True", "False"):
+        return _BOOL
+    if _is_int(value):
+        return _INT
+    if _is_number(value):
+        return _FLOAT
+    return _STR
+
+
+def _dataframe_column(column: List[Any]) -> List[Any]:
+    """
+    Apply pandas' dtype inference to a column of raw values
+
+    Numbers mixed with None or floats become a float64 column (None is
+    NaN, shown as "nan"); anything else keeps its values as they are.
+    """
+    numbers = [value for value in column if value is not None]
+    if not numbers or any(type(value) not in (int, float) for value in numbers):
+        return column
+    if len(numbers) == len(column) and all(type(value) is int for value in numbers):
+        return column
+    return [math.nan if value is None else float(value) for value in column]
+
+
+def _column_type(column: List[Any]) -> int:
+    """The most generic tabulate type of a column's cells"""
+    types = [_cell_type(value) for value in column]
+    column_type = max([_BOOL] + types)
+    if column_type == _FLOAT and _BOOL in types:
+        # tabulate would fail to format "True" as a number
+        return _STR
+    return column_type
+
+
+def _format_cell(value, column_type: int) -> str:
+    if value is None:
+        return ""
+    if column_type == _INT:
+        return format(value, "")
+    if column_type == _FLOAT:
+        return format(float(value), "g")
+    return f"{value}"
+
+
+def _after_point(cell: str) -> int:
+    """Digits after the decimal point (or exponent) of a numeric cell, -1 if none"""
+    if not _is_number(cell) or _is_int(cell):
+        return -1
+    pos = cell.rfind(".")
+    pos = cell.lower().rfind("e") if pos < 0 else pos
+    return len(cell) - pos - 1 if pos >= 0 else -1
+
+
+def _line_width(text: str) -> int:
+    # Printable ASCII is one column per character; skip the wcwidth lookup
+    if _wcswidth is None or text.isascii() and text.isprintable():
+        return len(text)
+    return _wcswidth(text)
+
+
+def _cell_width(cell: str, multiline: bool) -> int:
+    if multiline:
+        return max(map(_line_width, _LINE_BREAK.split(cell)))
+    return _line_width(cell)
+
+
+def _align_column(cells: List[str], numeric: bool, min_width: int, multiline: bool) -> List[str]:
+    """Pad a column's cells to a common width (numbers right, text left)"""
+    if numeric:
+        decimals = [_after_point(cell) for cell in cells]
+        most = max(decimals)
+        cells = [cell + (most - places) * " " for cell, places in zip(cells, decimals)]
+        pad = str.rjust
+    else:
+        cells = [cell.strip() for cell in cells]
+        pad = str.ljust
+
+    if not multiline:
+        widths = [_line_width(cell) for cell in cells]
+        width = max(max(widths), min_width)
+        return [pad(cell, width - (w - len(cell))) for cell, w in zip(cells, widths)]
+
+    line_widths = [[_line_width(line) for line in _LINE_BREAK.split(cell)] for cell in cells]
+    width = max(max(max(widths) for widths in line_widths), min_width)
+    if _wcswidth is None:
+        return ["\n".join(pad(line, width) for line in cell.splitlines()) for cell in cells]
+    padded = []
+    for cell, widths in zip(cells, line_widths):
+        lengths = [len(line) for line in _LINE_BREAK.split(cell)]
+        targets = [width - (w - n) for w, n in zip(widths, lengths)]
+        padded.append("\n".join(pad(line, target) for line, target in zip(cell.splitlines() or cell, targets)))
+    return padded
+
+
+def _pipe_row(cells: Sequence[str]) -> str:
+    return "|" + "|".join(f" {cell} " for cell in cells) + "|"
+
+
+def markdown_table(rows: Iterable[Dict[str, Any]], columns: Sequence[Tuple[str, str]] = MARKDOWN_COLUMNS) -> str:
+    """
+    Render rows as a GitHub pipe table
+
+    Column widths depend on every cell, so the rows are read in full
+    before anything is emitted.
+
+    Args:
+        rows: Project data dictionaries
+        columns: (key, header) pairs to display
+
+    Returns:
+        Markdown table string
+    """
+    headers = [header for _, header in columns]
+    values = [[row.get(key) for key, _ in columns] for row in rows]
+    if not values:
+        return ""
+
+    raw = headers + [str(value) for row in values for value in row]
+    multiline = any(_MULTILINE.search(text) for text in raw)
+
+    widths, numeric, aligned = [], [], []
+    for index, header in enumerate(headers):
+        column = _dataframe_column([row[index] for row in values])
+        column_type = _column_type(column)
+        is_numeric = column_type in (_INT, _FLOAT)
+        cells = _align_column(
+            [_format_cell(value, column_type) for value in column],
+            is_numeric,
+            _cell_width(header, multiline) + 2,
+            multiline
+        )
+        width = max(_cell_width(header, multiline) + 2, max(_cell_width(cell, multiline) for cell in cells))
+        widths.append(width)
+        numeric.append(is_numeric)
+        aligned.append(cells)
+
+    header_cells = [
+        (str.rjust if is_numeric else str.ljust)(header, width - (_line_width(header) - len(header)))
+        for header, width, is_numeric in zip(headers, widths, numeric)
+    ]
+    rule = "|" + "|".join(
+        "-" * (width + 1) + ":" if is_numeric else ":" + "-" * (width + 1)
+        for width, is_numeric in zip(widths, numeric)
+    ) + "|"
+
+    def row_lines(cells: Sequence[str]) -> List[str]:
+        if not multiline:
+            return [_pipe_row(cells)]
+        cell_lines = [cell.splitlines() for cell in cells]
+        height = max(map(len, cell_lines))
+        cell_lines = [split + [" " * width] * (height - len(split)) for split, width in zip(cell_lines, widths)]
+        return [_pipe_row([split[i] for split in cell_lines]) for i in range(height)]
+
+    lines = row_lines(header_cells) + [rule]
+    for cells in zip(*aligned):
+        lines.extend(row_lines(cells))
+    return "\n".join(lines)
+
+
+def _html_text(value, strip: bool = True) -> str:
+    text = str(value).translate(_HTML_CONTROL)
+    return html.escape(text.strip() if strip else text, quote=False)
+
+
+def iter_html_table(rows: Iterable[Dict[str, Any]], classes: Sequence[str] = ('trending-table',)) -> Iterator[str]:
+    """
+    Stream rows as an HTML table, project names linked to GitHub
+
+    Text is HTML-escaped; as with pandas, cells are stripped and tabs and
+    line breaks show as ``\\t``/``\\n``.
+
+    Args:
+        rows: Project data dictionaries
+        classes: CSS classes added after "dataframe"
+
+    Yields:
+        Chunks of HTML that concatenate to the table
+    """
+    class_attr = " ".join(("dataframe",) + tuple(classes))
+    yield f'<table border="1" class="{class_attr}">\n  <thead>\n    <tr style="text-align: right;">\n'
+    for header in HTML_COLUMNS:
+        yield f"      <th>{header}</th>\n"
+    yield "    </tr>\n  </thead>\n  <tbody>\n"
+    for row in rows:
+        link = (
+            f'<a href="{html.escape(str(row["url"]).translate(_HTML_CONTROL))}" target="_blank">'
+            f'{_html_text(row["name"], strip=False)}</a>'
+        )
+        cells = (_html_text(row['rank']), link, _html_text(row['language']),
+                 _html_text(row['stars']), _html_text(row['description']))
+        yield "    <tr>\n" + "".join(f"      <td>{cell}</td>\n" for cell in cells) + "    </tr>\n"
+    yield "  </tbody>\n</table>"
+
+
+def html_table(rows: Iterable[Dict[str, Any]], classes: Sequence[str] = ('trending-table',)) -> str:
+    """Render rows as an HTML table (see iter_html_table)"""
+    return "".join(iter_html_table(rows, classes))
+
+
+def iter_csv(rows: Iterable[Dict[str, Any]], columns: Optional[Sequence[str]] = None) -> Iterator[str]:
+    """
+    Stream rows as CSV with a header line
+
+    Args:
+        rows: Project data dictionaries
+        columns: Keys to write (defaults to the keys of the first row)
+
+    Yields:
+        One CSV line per row, header first
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    def flush() -> str:
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    for row in rows:
+        if columns is None:
+            columns = list(row)
+            writer.writerow(columns)
+        writer.writerow([row.get(key) for key in columns])
+        yield flush()
+
+
+def csv_text(rows: Iterable[Dict[str, Any]], columns: Optional[Sequence[str]] = None) -> str:
+    """Render rows as CSV (see iter_csv)"""
+    return "".join(iter_csv(rows, columns))
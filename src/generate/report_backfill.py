@@ -0,0 +1,174 @@
+"""Parallel rebuild of daily reports for a date range"""
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from sqlalchemy.orm import Session
+from src.config.settings import settings
+from src.database.runs import get_runs_between, get_runs_for_range
+from src.generate.report_cache import ReportCache, atomic_write
+from src.generate.report_generator import ReportGenerator
+
+logger = logging.getLogger(__name__)
+
+# Per-process report generator, created by _init_worker
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(
+    output_dir: str,
+    cache_dir: Optional[str],
+    include_analysis: bool,
+    include_commentary: bool
+) -> None:
+    """
+    Give a worker process its own database session and report generator
+
+    Args:
+        output_dir: Directory to save reports
+        cache_dir: Report cache directory of the parent (None for no cache)
+        include_analysis: Include trend analysis
+        include_commentary: Include AI-generated commentary
+    """
+    from src.database.base import SessionLocal, engine
+
+    # Connections inherited from the parent on fork must not be reused here
+    engine.dispose(close=False)
+    cache = ReportCache(cache_dir) if cache_dir else None
+    _worker['generator'] = ReportGenerator(SessionLocal(), output_dir=output_dir, cache=cache)
+    _worker['options'] = {'include_analysis': include_analysis, 'include_commentary': include_commentary}
+
+
+def _build_report(day: date) -> str:
+    """
+    Generate and save the report of one day (runs in a worker process)
+
+    Args:
+        day: Report date
+
+    Returns:
+        Path to saved report
+    """
+    generator = _worker['generator']
+    try:
+        report = generator.generate_daily_report(date=day, **_worker['options'])
+        return generator.save_report(report, date=day)
+    finally:
+        # End the read transaction so the next day sees current data
+        generator.db.rollback()
+
+
+def build_reports(
+    db: Session,
+    start: date,
+    end: date,
+    output_dir: str = "reports",
+    workers: Optional[int] = None,
+    include_analysis: bool = True,
+    include_commentary: bool = True,
+    cache: Optional[ReportCache] = None
+) -> List[str]:
+    """
+    Generate and save the daily reports of a date range on a process pool
+
+    Days without an all-languages daily run are skipped. Days whose
+    report is in the report cache (same run, analysis window runs and
+    options) are not regenerated: the cached report is written out if the
+    saved file differs, and left alone otherwise. An ingest only rebuilds
+    the days it touched. The remaining days are split across worker
+    processes, each with its own database session and the same cache.
+
+    Args:
+        db: Database session
+        start: First day
+        end: Last day (inclusive)
+        output_dir: Directory to save reports
+        workers: Number of report processes (default: CPU count)
+        include_analysis: Include trend analysis
+        include_commentary: Include AI-generated commentary
+        cache: Report cache (default: settings.REPORT_CACHE_DIR, none if REPORT_CACHE_ENABLED is off)
+
+    Returns:
+        Paths of the reports written
+    """
+    if cache is None and settings.REPORT_CACHE_ENABLED:
+        cache = ReportCache()
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+
+    runs = get_runs_for_range(db, start, end)
+    days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+    skipped_empty = sum(1 for day in days if day not in runs)
+    days = [day for day in days if day in runs]
+    logger.info(
+        f"Building reports for {len(days)} days from {start} to {end} "
+        f"({skipped_empty} days without a daily run skipped)"
+    )
+
+    written = []
+    pending = days
+    unchanged = 0
+    if cache is not None:
+        window_runs = []
+        if include_analysis and days:
+            window_runs = get_runs_between(db, ReportGenerator.analysis_window(days[0])[0], days[-1])
+        pending = []
+        for day in days:
+            first, last = ReportGenerator.analysis_window(day)
+            analysis_runs = [run for run in window_runs if first <= run.run_date <= last]
+            key = cache.make_key('report', ReportGenerator.report_inputs(
+                day, runs[day], analysis_runs, include_analysis, include_commentary
+            ))
+            report = cache.get('report', key)
+            if report is None:
+                pending.append(day)
+                continue
+            path = output / ReportGenerator.report_filename(day)
+            try:
+                if path.read_text(encoding='utf-8') == report:
+                    unchanged += 1
+                    continue
+            except OSError:
+                pass
+            atomic_write(path, report.encode('utf-8'))
+            written.append(str(path))
+        logger.info(
+            f"{unchanged} reports up to date, {len(written)} restored from cache, {len(pending)} to generate"
+        )
+
+    if not pending:
+        return written
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    started = time.monotonic()
+    failed = 0
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(
+            str(output), str(cache.cache_dir) if cache is not None else None,
+            include_analysis, include_commentary
+        )
+    ) as executor:
+        futures = {executor.submit(_build_report, day): day for day in pending}
+        for done, future in enumerate(as_completed(futures), 1):
+            day = futures[future]
+            try:
+                written.append(future.result())
+            except Exception as e:
+                failed += 1
+                logger.error(f"Error building report for {day}: {e}")
+            elapsed = time.monotonic() - started
+            rate = done / elapsed if elapsed else 0.0
+            eta = (len(pending) - done) / rate if rate else 0.0
+            logger.info(f"[{done}/{len(pending)}] {day} ({rate:.1f} reports/s, ETA {eta:.0f}s)")
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        f"Report build finished: {len(pending) - failed} generated, {failed} failed in {elapsed:.1f}s "
+        f"with {workers} workers ({(len(pending) - failed) / elapsed if elapsed else 0:.1f} reports/s)"
+    )
+    return written
@@ -0,0 +1,161 @@
+"""Content-addressed on-disk cache of rendered reports and report sections"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from src.config.settings import settings
+from src.metrics import REPORT_CACHE
+
+logger = logging.getLogger(__name__)
+
+# Bump when report or section rendering changes so old artifacts are not reused
+REPORT_FORMAT_VERSION = 2
+
+
+class ReportCache:
+    """
+    Report artifacts stored under a hash of everything they were built from
+
+    A key never changes meaning, so entries need no invalidation: when an
+    input changes (a new run, a data version bump, other options) the key
+    changes and the old file is simply no longer read. prune() removes
+    files that have not been used for a while.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize report cache
+
+        Args:
+            cache_dir: Directory for cached artifacts (defaults to settings.REPORT_CACHE_DIR)
+        """
+        self.cache_dir = Path(cache_dir or settings.REPORT_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(kind: str, inputs: Dict[str, Any]) -> str:
+        """
+        Build the content address of an artifact
+
+        Args:
+            kind: Artifact type (e.g. "report", "table", "analysis")
+            inputs: JSON-serializable values the artifact depends on
+
+        Returns:
+            Hex digest identifying the artifact
+        """
+        canonical = json.dumps(
+            [REPORT_FORMAT_VERSION, kind, inputs], sort_keys=True, default=str, separators=(',', ':')
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def path(self, kind: str, key: str, suffix: str = ".md") -> Path:
+        """Location of an artifact (whether or not it exists yet)"""
+        return self.cache_dir / kind / key[:2] / f"{key}{suffix}"
+
+    def lookup(self, kind: str, key: str, suffix: str = ".md") -> Optional[Path]:
+        """
+        Find a cached artifact
+
+        Args:
+            kind: Artifact type
+            key: Key from make_key()
+            suffix: File extension
+
+        Returns:
+            Path of the cached file, or None on a miss
+        """
+        path = self.path(kind, key, suffix)
+        if not path.exists():
+            REPORT_CACHE.inc(kind=kind, result="miss")
+            return None
+        REPORT_CACHE.inc(kind=kind, result="hit")
+        try:
+            # mtime doubles as last use for prune()
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def get(self, kind: str, key: str, suffix: str = ".md") -> Optional[str]:
+        """Read a cached artifact, or None on a miss"""
+        path = self.lookup(kind, key, suffix)
+        if path is None:
+            return None
+        try:
+            return path.read_text(encoding='utf-8')
+        except OSError:
+            return None
+
+    def put(self, kind: str, key: str, content: str, suffix: str = ".md") -> Path:
+        """
+        Store an artifact atomically
+
+        Args:
+            kind: Artifact type
+            key: Key from make_key()
+            content: Artifact text
+            suffix: File extension
+
+        Returns:
+            Path of the stored file
+        """
+        path = self.path(kind, key, suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, content.encode('utf-8'))
+        return path
+
+    def get_or_build(self, kind: str, inputs: Dict[str, Any], build: Callable[[], Optional[str]]) -> Optional[str]:
+        """
+        Return the cached artifact for ``inputs`` or build and store it
+
+        Args:
+            kind: Artifact type
+            inputs: Values the artifact depends on
+            build: Produces the artifact on a miss; None means "do not cache"
+
+        Returns:
+            Artifact text (None if build returned None)
+        """
+        key = self.make_key(kind, inputs)
+        content = self.get(kind, key)
+        if content is None:
+            content = build()
+            if content is not None:
+                self.put(kind, key, content)
+        return content
+
+    def prune(self, max_age_days: Optional[float] = None) -> int:
+        """
+        Delete artifacts not used within ``max_age_days``
+
+        Args:
+            max_age_days: Age limit (defaults to settings.REPORT_CACHE_MAX_AGE_DAYS)
+
+        Returns:
+            Number of files removed
+        """
+        max_age_days = settings.REPORT_CACHE_MAX_AGE_DAYS if max_age_days is None else max_age_days
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+        for path in self.cache_dir.glob("*/*/*"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            logger.info(f"Pruned {removed} cached report artifacts")
+        return removed
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write a file so readers never observe a partial write"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
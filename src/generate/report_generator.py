@@ -1,34 +1,91 @@
 """Generate daily reports for GitHub trending projects"""
 import logging
-from datetime import datetime
+from datetime import date as date_type, datetime, time, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from sqlalchemy.orm import Session
+from src.config.settings import settings
+from src.database.models import FetchRun
+from src.database.runs import get_run_for_date, get_runs_between
+from src.generate.report_cache import ReportCache, atomic_write
 from src.generate.table_generator import TableGenerator
 from src.generate.trend_analyzer import TrendAnalyzer
-from src.summarize.openai_client import OpenAIClient
+from src.metrics import REPORT_STAGE
 
 logger = logging.getLogger(__name__)
 
+COMMENTARY_UNAVAILABLE = "Commentary generation unavailable."
+
+# Days covered by the trend analysis section
+ANALYSIS_DAYS = 7
+
+
+def run_inputs(runs: Iterable[FetchRun]) -> List[List[Any]]:
+    """Identify fetch runs by id, fetch time and size, so a re-ingest changes them"""
+    return sorted([run.id, run.fetched_at.isoformat(), run.row_count] for run in runs)
+
 
 class ReportGenerator:
     """Generate comprehensive daily reports"""
 
-    def __init__(self, db_session: Session, output_dir: str = "reports"):
+    def __init__(self, db_session: Session, output_dir: str = "reports", cache: Optional[ReportCache] = None):
         """
         Initialize report generator
 
         Args:
             db_session: Database session
             output_dir: Directory to save reports
+            cache: Report cache (default: one in settings.REPORT_CACHE_DIR,
+                or none if REPORT_CACHE_ENABLED is off)
         """
         self.db = db_session
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
+        if cache is None and settings.REPORT_CACHE_ENABLED:
+            cache = ReportCache()
+        self.cache = cache
+
         self.table_gen = TableGenerator(db_session)
         self.trend_analyzer = TrendAnalyzer(db_session)
 
+    @staticmethod
+    def analysis_window(day: date_type) -> Tuple[date_type, date_type]:
+        """First and last run date read by the trend analysis of a day's report"""
+        return day - timedelta(days=ANALYSIS_DAYS), day
+
+    @staticmethod
+    def report_inputs(
+        day: date_type,
+        run: Optional[FetchRun],
+        analysis_runs: Iterable[FetchRun],
+        include_analysis: bool = True,
+        include_commentary: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Values a complete report is built from
+
+        Only the day's own run and, with analysis, the runs of the analysis
+        window are included, so ingests for other days do not invalidate it.
+
+        Args:
+            day: Report date
+            run: The day's all-languages daily fetch run (None if there is none)
+            analysis_runs: Fetch runs within analysis_window(day)
+            include_analysis: Include trend analysis
+            include_commentary: Include AI-generated commentary
+
+        Returns:
+            Cache inputs of the report
+        """
+        return {
+            'date': day.isoformat(),
+            'run': run_inputs([run]) if run else None,
+            'analysis_runs': run_inputs(analysis_runs) if include_analysis else None,
+            'analysis': include_analysis,
+            'commentary': include_commentary
+        }
+
     def generate_daily_report(
         self,
         date: datetime = None,
@@ -38,6 +95,11 @@ class ReportGenerator:
         """
         Generate complete daily report
 
+        With a cache, the report is looked up by the day's run, the runs
+        of its analysis window and the options; on a miss only the sections
+        whose own inputs changed are rebuilt. A report with a degraded section (e.g.
+        commentary while the LLM is unavailable) is returned but not cached.
+
         Args:
             date: Date for the report (default: today)
             include_analysis: Include trend analysis
@@ -48,8 +110,52 @@ class ReportGenerator:
         """
         if not date:
             date = datetime.now()
+        day = date.date() if isinstance(date, datetime) else date
+
+        if self.cache is None:
+            report, _ = self._build_report(day, None, include_analysis, include_commentary)
+            return report
 
-        date_str = date.strftime("%Y-%m-%d")
+        run = get_run_for_date(self.db, day)
+        analysis_runs = get_runs_between(self.db, *self.analysis_window(day)) if include_analysis else []
+        inputs = self.report_inputs(day, run, analysis_runs, include_analysis, include_commentary)
+        key = self.cache.make_key('report', inputs)
+        report = self.cache.get('report', key)
+        if report is not None:
+            logger.info(f"Using cached daily report for {day.isoformat()}")
+            return report
+
+        report, complete = self._build_report(day, inputs['analysis_runs'], include_analysis, include_commentary)
+        if complete:
+            self.cache.put('report', key, report)
+        return report
+
+    def _section(self, kind: str, inputs: Dict[str, Any], build: Callable[[], Optional[str]]) -> Optional[str]:
+        """Build a report section, or reuse the cached one built from the same inputs"""
+        if self.cache is None:
+            return build()
+        return self.cache.get_or_build(kind, inputs, build)
+
+    def _build_report(
+        self,
+        day: date_type,
+        analysis_runs: Optional[List[List[Any]]],
+        include_analysis: bool,
+        include_commentary: bool
+    ) -> Tuple[str, bool]:
+        """
+        Assemble a report from its (possibly cached) sections
+
+        Args:
+            day: Report date
+            analysis_runs: run_inputs() of the analysis window (cache key of that section)
+            include_analysis: Include trend analysis
+            include_commentary: Include AI-generated commentary
+
+        Returns:
+            Tuple of (report markdown, whether every requested section was built)
+        """
+        date_str = day.strftime("%Y-%m-%d")
         logger.info(f"Generating daily report for {date_str}")
 
         # Build report
@@ -58,11 +164,12 @@ class ReportGenerator:
         report += "---\n\n"
 
         # Get trending data
-        trending_data = self.table_gen.get_trending_data(date=date.date(), limit=30)
+        with REPORT_STAGE.time(stage="data"):
+            trending_data = self.table_gen.get_trending_data(date=day, limit=30)
 
         if not trending_data:
             report += "No trending data available for this date.\n"
-            return report
+            return report, True
 
         # Add summary statistics
         report += "## Summary Statistics\n\n"
@@ -75,44 +182,56 @@ class ReportGenerator:
         report += f"- **Total Stars**: {total_stars:,}\n"
         report += f"- **Average Stars**: {total_stars // len(trending_data):,}\n\n"
 
-        # Add trending table
+        # Add trending table (keyed by the rows themselves)
         report += "## Top Trending Projects\n\n"
-        table = self.table_gen.generate_markdown_table(trending_data)
+        with REPORT_STAGE.time(stage="table"):
+            table = self._section(
+                'table', {'rows': trending_data},
+                lambda: self.table_gen.generate_markdown_table(trending_data)
+            )
         report += table + "\n\n"
 
-        # Add trend analysis
+        # Add trend analysis of the 7 days up to the report date
         if include_analysis:
-            report += self.trend_analyzer.generate_analysis_summary()
+            as_of = min(datetime.now(), datetime.combine(day, time.max))
+            with REPORT_STAGE.time(stage="analysis"):
+                report += self._section(
+                    'analysis', {'date': day.isoformat(), 'runs': analysis_runs, 'days': ANALYSIS_DAYS},
+                    lambda: self.trend_analyzer.generate_analysis_summary(as_of=as_of)
+                )
             report += "\n"
 
         # Add AI commentary (optional)
+        complete = True
         if include_commentary:
             try:
-                commentary = self._generate_commentary(trending_data)
+                with REPORT_STAGE.time(stage="commentary"):
+                    commentary = self._generate_commentary(trending_data)
+                if commentary is None:
+                    complete = False
+                    commentary = COMMENTARY_UNAVAILABLE
                 report += "## AI Analysis & Commentary\n\n"
                 report += commentary + "\n\n"
             except Exception as e:
+                complete = False
                 logger.error(f"Failed to generate commentary: {e}")
 
         # Add footer
         report += "---\n\n"
         report += f"*Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
 
-        return report
-
-    def _generate_commentary(self, trending_data: list) -> str:
-        """Generate AI commentary on trends"""
-        try:
-            client = OpenAIClient()
+        return report, complete
 
-            # Prepare summary of top projects
-            top_5 = trending_data[:5]
-            projects_summary = "\n".join([
-                f"{i+1}. {p['name']} ({p['language']}) - {p['stars']} stars"
-                for i, p in enumerate(top_5)
-            ])
+    def _commentary_prompt(self, trending_data: List[Dict[str, Any]]) -> str:
+        """Build the LLM prompt from the top projects"""
+        # Prepare summary of top projects
+        top_5 = trending_data[:5]
+        projects_summary = "\n".join([
+            f"{i+1}. {p['name']} ({p['language']}) - {p['stars']} stars"
+            for i, p in enumerate(top_5)
+        ])
 
-            prompt = f"""Based on these top 5 trending GitHub projects today:
+        return f"""Based on these top 5 trending GitHub projects today:
 
 {projects_summary}
 
@@ -121,32 +240,53 @@ Provide a brief analysis (3-4 sentences) covering:
 2. Interesting insights about the trending technologies
 3. What this might indicate about current developer interests"""
 
-            commentary = client.generate_completion(
+    def _generate_commentary(self, trending_data: list) -> Optional[str]:
+        """Generate AI commentary on trends (reused while the prompt is unchanged); None if unavailable"""
+        prompt = self._commentary_prompt(trending_data)
+        return self._section('commentary', {'prompt': prompt}, lambda: self._complete(prompt))
+
+    def _complete(self, prompt: str) -> Optional[str]:
+        """Ask the LLM for commentary; None (never cached) if it is unavailable"""
+        try:
+            # openai is heavy; load it only when commentary is requested
+            from src.summarize.openai_client import OpenAIClient
+            client = OpenAIClient()
+
+            return client.generate_completion(
                 prompt=prompt,
                 max_tokens=300,
                 temperature=0.7
             )
-            return commentary
         except Exception as e:
             logger.error(f"Error generating commentary: {e}")
-            return "Commentary generation unavailable."
+            return None
 
-    def save_report(self, report: str, filename: str = None) -> str:
+    @staticmethod
+    def report_filename(day: date_type) -> str:
+        """File name of the report for a given day"""
+        return f"trending_report_{day.strftime('%Y%m%d')}.md"
+
+    def save_report(self, report: str, filename: str = None, date: datetime = None) -> str:
         """
         Save report to file
 
+        The file is replaced atomically, so readers never see a partial report.
+
         Args:
             report: Report content
-            filename: Output filename (default: auto-generated)
+            filename: Output filename (default: named after the report date)
+            date: Date of the report (default: today)
 
         Returns:
             Path to saved file
         """
         if not filename:
-            filename = f"trending_report_{datetime.now().strftime('%Y%m%d')}.md"
+            day = date or datetime.now()
+            filename = self.report_filename(day.date() if isinstance(day, datetime) else day)
 
         filepath = self.output_dir / filename
-        filepath.write_text(report, encoding='utf-8')
+        with REPORT_STAGE.time(stage="save"):
+            atomic_write(filepath, report.encode('utf-8'))
 
         logger.info(f"Report saved to {filepath}")
         return str(filepath)
@@ -162,4 +302,4 @@ Provide a brief analysis (3-4 sentences) covering:
             Path to saved report
         """
         report = self.generate_daily_report(date=date)
-        return self.save_report(report)
+        return self.save_report(report, date=date)
@@ -1,11 +1,11 @@
 """Generate formatted tables from trending project data"""
 import logging
-from typing import List, Dict, Any
-from datetime import datetime
-import pandas as pd
-from tabulate import tabulate
+from typing import List, Dict, Any, Iterable
+from datetime import date as date_type, datetime
+from sqlalchemy import exists, func, select
 from sqlalchemy.orm import Session
-from src.database.models import Project, TrendingSnapshot, Summary
+from src.database.models import FetchRun, Project, TrendingSnapshot, Summary
+from src.generate.renderers import csv_text, html_table, markdown_table
 
 logger = logging.getLogger(__name__)
 
@@ -13,14 +13,17 @@ logger = logging.getLogger(__name__)
 class TableGenerator:
     """Generate formatted tables for trending projects"""
 
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, use_pandas: bool = False):
         """
         Initialize table generator
 
         Args:
             db_session: Database session
+            use_pandas: Render with pandas/tabulate (imported on demand) instead
+                of the built-in renderers; HTML is then not escaped
         """
         self.db = db_session
+        self.use_pandas = use_pandas
 
     def get_trending_data(self, date: datetime = None, limit: int = 30) -> List[Dict[str, Any]]:
         """
@@ -35,31 +38,78 @@ class TableGenerator:
         """
         if not date:
             date = datetime.now().date()
+        if isinstance(date, datetime):
+            date = date.date()
 
-        # Query trending snapshots for the date
-        snapshots = self.db.query(TrendingSnapshot).join(Project).filter(
-            TrendingSnapshot.date >= date,
-            TrendingSnapshot.date < datetime.combine(date, datetime.max.time())
-        ).order_by(TrendingSnapshot.rank).limit(limit).all()
-
-        data = []
-        for snapshot in snapshots:
-            project = snapshot.project
-
-            # Get summary if available
-            summary = self.db.query(Summary).filter(
-                Summary.project_id == project.id
-            ).first()
-
-            data.append({
-                'rank': snapshot.rank,
-                'name': project.name,
-                'full_name': project.full_name,
-                'description': project.description[:100] + '...' if project.description and len(project.description) > 100 else project.description,
-                'language': project.language or 'N/A',
-                'stars': project.stars,
-                'url': project.url,
-                'has_summary': summary is not None
+        return self.get_trending_data_many([date], limit=limit).get(date, [])
+
+    def get_trending_data_many(
+        self,
+        dates: Iterable[date_type],
+        limit: int = 30,
+        since: str = "daily"
+    ) -> Dict[date_type, List[Dict[str, Any]]]:
+        """
+        Get trending projects data for several dates in one query
+
+        Each day's all-languages run is joined with its snapshots and
+        projects, the top ``limit`` ranks are kept with a window function,
+        and has_summary comes from an EXISTS subquery.
+
+        Args:
+            dates: Dates to load
+            limit: Maximum number of projects per date
+            since: Time range of the runs
+
+        Returns:
+            Dictionary of date -> list of project data dictionaries
+            (dates without a run are left out)
+        """
+        days = sorted({day.date() if isinstance(day, datetime) else day for day in dates})
+        if not days:
+            return {}
+
+        position = func.row_number().over(
+            partition_by=TrendingSnapshot.run_id,
+            order_by=(TrendingSnapshot.rank, TrendingSnapshot.id)
+        ).label('position')
+        ranked = select(
+            FetchRun.run_date,
+            TrendingSnapshot.rank,
+            Project.name,
+            Project.full_name,
+            Project.description,
+            Project.language,
+            Project.stars,
+            Project.url,
+            exists().where(Summary.project_id == Project.id).label('has_summary'),
+            position
+        ).join(
+            TrendingSnapshot, TrendingSnapshot.run_id == FetchRun.id
+        ).join(
+            Project, TrendingSnapshot.project_id == Project.id
+        ).where(
+            FetchRun.run_date.in_(days),
+            FetchRun.since == since,
+            FetchRun.language == ""
+        ).subquery()
+
+        rows = self.db.execute(
+            select(ranked).where(ranked.c.position <= limit).order_by(ranked.c.run_date, ranked.c.position)
+        ).all()
+
+        data = {}
+        for row in rows:
+            description = row.description
+            data.setdefault(row.run_date, []).append({
+                'rank': row.rank,
+                'name': row.name,
+                'full_name': row.full_name,
+                'description': description[:100] + '...' if description and len(description) > 100 else description,
+                'language': row.language or 'N/A',
+                'stars': row.stars,
+                'url': row.url,
+                'has_summary': bool(row.has_summary)
             })
 
         return data
@@ -77,23 +127,9 @@ class TableGenerator:
         if not data:
             return "No trending data available."
 
-        # Create DataFrame
-        df = pd.DataFrame(data)
-
-        # Select and rename columns for display
-        display_columns = {
-            'rank': 'Rank',
-            'name': 'Project Name',
-            'language': 'Language',
-            'stars': 'Stars',
-            'description': 'Description'
-        }
-
-        df_display = df[list(display_columns.keys())].rename(columns=display_columns)
-
-        # Generate markdown table
-        markdown = tabulate(df_display, headers='keys', tablefmt='pipe', showindex=False)
-        return markdown
+        if self.use_pandas:
+            return self._pandas_markdown_table(data)
+        return markdown_table(data)
 
     def generate_html_table(self, data: List[Dict[str, Any]]) -> str:
         """
@@ -108,22 +144,9 @@ class TableGenerator:
         if not data:
             return "<p>No trending data available.</p>"
 
-        # Create DataFrame
-        df = pd.DataFrame(data)
-
-        # Add clickable links
-        df['name_link'] = df.apply(
-            lambda row: f'<a href="{row["url"]}" target="_blank">{row["name"]}</a>',
-            axis=1
-        )
-
-        # Select columns for display
-        display_df = df[['rank', 'name_link', 'language', 'stars', 'description']].copy()
-        display_df.columns = ['Rank', 'Project', 'Language', 'Stars', 'Description']
-
-        # Generate HTML table
-        html = display_df.to_html(escape=False, index=False, classes=['trending-table'])
-        return html
+        if self.use_pandas:
+            return self._pandas_html_table(data)
+        return html_table(data)
 
     def generate_csv(self, data: List[Dict[str, Any]]) -> str:
         """
@@ -138,5 +161,41 @@ class TableGenerator:
         if not data:
             return ""
 
+        if self.use_pandas:
+            import pandas as pd
+            return pd.DataFrame(data).to_csv(index=False)
+        return csv_text(data)
+
+    def _pandas_markdown_table(self, data: List[Dict[str, Any]]) -> str:
+        import pandas as pd
+        from tabulate import tabulate
+
         df = pd.DataFrame(data)
-        return df.to_csv(index=False)
+
+        # Select and rename columns for display
+        display_columns = {
+            'rank': 'Rank',
+            'name': 'Project Name',
+            'language': 'Language',
+            'stars': 'Stars',
+            'description': 'Description'
+        }
+
+        df_display = df[list(display_columns.keys())].rename(columns=display_columns)
+        return tabulate(df_display, headers='keys', tablefmt='pipe', showindex=False)
+
+    def _pandas_html_table(self, data: List[Dict[str, Any]]) -> str:
+        import pandas as pd
+
+        df = pd.DataFrame(data)
+
+        # Add clickable links
+        df['name_link'] = df.apply(
+            lambda row: f'<a href="{row["url"]}" target="_blank">{row["name"]}</a>',
+            axis=1
+        )
+
+        # Select columns for display
+        display_df = df[['rank', 'name_link', 'language', 'stars', 'description']].copy()
+        display_df.columns = ['Rank', 'Project', 'Language', 'Stars', 'Description']
+        return display_df.to_html(escape=False, index=False, classes=['trending-table'])
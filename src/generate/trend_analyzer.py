@@ -1,6 +1,6 @@
 """Analyze trends in GitHub projects"""
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from sqlalchemy import func
 from sqlalchemy.orm import Session
@@ -21,17 +21,19 @@ class TrendAnalyzer:
         """
         self.db = db_session
 
-    def analyze_language_trends(self, days: int = 7) -> Dict[str, Any]:
+    def analyze_language_trends(self, days: int = 7, as_of: Optional[datetime] = None) -> Dict[str, Any]:
         """
         Analyze which programming languages are trending
 
         Args:
             days: Number of days to analyze
+            as_of: End of the analyzed period (default: now)
 
         Returns:
             Dictionary with language statistics
         """
-        date_from = datetime.now() - timedelta(days=days)
+        as_of = as_of or datetime.now()
+        date_from = as_of - timedelta(days=days)
 
         # Get language distribution
         results = self.db.query(
@@ -40,6 +42,7 @@ class TrendAnalyzer:
             func.avg(Project.stars).label('avg_stars')
         ).join(TrendingSnapshot).filter(
             TrendingSnapshot.date >= date_from,
+            TrendingSnapshot.date <= as_of,
             Project.language.isnot(None)
         ).group_by(Project.language).order_by(func.count(TrendingSnapshot.id).desc()).all()
 
@@ -57,22 +60,30 @@ class TrendAnalyzer:
             'languages': languages[:10]  # Top 10
         }
 
-    def identify_rising_stars(self, min_stars: int = 100, days: int = 7) -> List[Dict[str, Any]]:
+    def identify_rising_stars(
+        self,
+        min_stars: int = 100,
+        days: int = 7,
+        as_of: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
         """
         Identify projects that are rapidly gaining popularity
 
         Args:
             min_stars: Minimum star count
             days: Number of days to analyze
+            as_of: End of the analyzed period (default: now)
 
         Returns:
             List of rising star projects
         """
         # Get projects that appeared recently in trending
-        date_from = datetime.now() - timedelta(days=days)
+        as_of = as_of or datetime.now()
+        date_from = as_of - timedelta(days=days)
 
         snapshots = self.db.query(TrendingSnapshot).join(Project).filter(
             TrendingSnapshot.date >= date_from,
+            TrendingSnapshot.date <= as_of,
             Project.stars >= min_stars
         ).order_by(Project.stars.desc()).limit(10).all()
 
@@ -89,16 +100,19 @@ class TrendAnalyzer:
 
         return rising_stars
 
-    def generate_analysis_summary(self) -> str:
+    def generate_analysis_summary(self, as_of: Optional[datetime] = None) -> str:
         """
         Generate a comprehensive trend analysis summary
 
+        Args:
+            as_of: End of the 7-day period (default: now)
+
         Returns:
             Text summary of trends
         """
         # Analyze language trends
-        lang_trends = self.analyze_language_trends(days=7)
-        rising_stars = self.identify_rising_stars(min_stars=100, days=7)
+        lang_trends = self.analyze_language_trends(days=7, as_of=as_of)
+        rising_stars = self.identify_rising_stars(min_stars=100, days=7, as_of=as_of)
 
         summary = "## GitHub Trending Analysis\n\n"
 
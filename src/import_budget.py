@@ -0,0 +1,167 @@
+"""Startup import-time budget for the CLI, scheduler and API entry points
+
+Absolute import times vary several-fold between machines, so each entry
+point is compared with a baseline measured alongside it: the import time
+of the third-party packages it needs anyway. An accidental heavy import
+(pandas, openai, lxml, ...) pushes the ratio far above the budget on any
+machine.
+"""
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from src.config.settings import settings
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# Entry point -> statement that loads it
+ENTRY_POINTS: Dict[str, str] = {
+    'main': "import main",
+    'scheduler': "import scheduler",
+    'api': "from src.api import app",
+}
+
+# Entry point -> third-party and stdlib imports it cannot avoid
+BASELINES: Dict[str, str] = {
+    'main': "import argparse, logging, datetime",
+    'scheduler': "import logging, threading, schedule",
+    'api': "import fastapi, orjson, pydantic, sqlalchemy.ext.asyncio",
+}
+
+
+class ImportTiming(NamedTuple):
+    """Import cost of one entry point"""
+    name: str
+    milliseconds: float
+    budget_ms: float
+    heaviest: List[Tuple[str, float]]
+    error: Optional[str] = None
+    baseline_ms: Optional[float] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.milliseconds <= self.budget_ms
+
+
+def relative_budget(baseline_ms: float) -> float:
+    """Budget in milliseconds for an entry point whose baseline took ``baseline_ms``"""
+    return baseline_ms * settings.IMPORT_BUDGET_RATIO + settings.IMPORT_BUDGET_SLACK_MS
+
+
+def _importtime(statement: str) -> Tuple[List[Tuple[int, str, float]], str]:
+    """Run a statement in a fresh interpreter with -X importtime"""
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    entries = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((depth, name.strip(), int(cumulative) / 1000))
+    error = process.stderr.strip().splitlines()[-1] if process.returncode else ""
+    return entries, error
+
+
+def startup_modules() -> Set[str]:
+    """Modules the interpreter imports before running any code"""
+    entries, _ = _importtime("pass")
+    return {name for _, name, _ in entries}
+
+
+def measure(
+    statement: str,
+    runs: int = 5,
+    startup: Optional[Set[str]] = None
+) -> Tuple[float, List[Tuple[str, float]], str]:
+    """
+    Measure the import cost of a statement
+
+    The cost is the cumulative -X importtime of every top-level module
+    imported beyond interpreter startup; the fastest of ``runs`` fresh
+    interpreters is kept to damp noise.
+
+    Args:
+        statement: Python statement, e.g. "import scheduler"
+        runs: Fresh interpreters to try
+        startup: Modules to ignore (defaults to the interpreter's startup imports)
+
+    Returns:
+        (milliseconds, heaviest direct imports of the fastest run, error or "")
+    """
+    startup = startup_modules() if startup is None else startup
+    best = None
+    for _ in range(runs):
+        entries, error = _importtime(statement)
+        if error:
+            return 0.0, [], error
+        # importtime prints children before their parent: each top-level
+        # line closes the subtree of the lines since the previous one
+        total, children, subtree = 0.0, [], []
+        for depth, name, milliseconds in entries:
+            if depth > 0:
+                subtree.append((depth, name, milliseconds))
+                continue
+            if name not in startup:
+                total += milliseconds
+                children.extend((child, ms) for child_depth, child, ms in subtree if child_depth == 1)
+            subtree = []
+        if best is None or total < best[0]:
+            best = (total, sorted(children, key=lambda item: -item[1])[:5])
+    return best[0], best[1], ""
+
+
+def check_import_budgets(budgets: Optional[Dict[str, float]] = None, runs: int = 5) -> List[ImportTiming]:
+    """
+    Measure every entry point against its startup budget
+
+    Without explicit budgets, each entry point's baseline (BASELINES) is
+    measured in the same way and the budget is relative_budget() of it.
+
+    Args:
+        budgets: Entry point -> absolute budget in milliseconds
+        runs: Fresh interpreters per entry point
+
+    Returns:
+        One timing per entry point
+    """
+    startup = startup_modules()
+    timings = []
+    for name, statement in ENTRY_POINTS.items():
+        baseline_ms = None
+        if budgets:
+            budget_ms = budgets[name]
+        else:
+            baseline_ms, _, error = measure(BASELINES[name], runs, startup)
+            if error:
+                timings.append(ImportTiming(name, 0.0, 0.0, [], f"baseline {error}"))
+                continue
+            budget_ms = relative_budget(baseline_ms)
+        milliseconds, heaviest, error = measure(statement, runs, startup)
+        timings.append(ImportTiming(name, milliseconds, budget_ms, heaviest, error or None, baseline_ms))
+    return timings
+
+
+def format_report(timings: List[ImportTiming]) -> str:
+    """Render timings as text, with the heaviest imports of each entry point"""
+    lines = []
+    for timing in timings:
+        if timing.error:
+            lines.append(f"FAIL {timing.name}: import failed: {timing.error}")
+            continue
+        status = "ok  " if timing.ok else "FAIL"
+        budget = f"budget {timing.budget_ms:.0f} ms"
+        if timing.baseline_ms is not None:
+            budget += f" from a {timing.baseline_ms:.0f} ms baseline"
+        lines.append(f"{status} {timing.name}: {timing.milliseconds:.0f} ms ({budget})")
+        for module, milliseconds in timing.heaviest:
+            lines.append(f"       {milliseconds:7.1f} ms  {module}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    results = check_import_budgets()
+    print(format_report(results))
+    sys.exit(0 if all(result.ok for result in results) else 1)
@@ -0,0 +1,176 @@
+"""Background job queue and the process-wide ingest lock"""
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from src.config.settings import settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_ingest_thread_lock = threading.Lock()
+
+
+@contextmanager
+def ingest_lock(path: Optional[str] = None):
+    """
+    Hold the ingest lock so only one scrape/ingest writes at a time
+
+    Serializes threads of this process with a mutex and separate processes
+    (API workers, the scheduler, CLI commands) with an advisory file lock.
+
+    Args:
+        path: Lock file (defaults to settings.INGEST_LOCK_PATH)
+    """
+    path = path or settings.INGEST_LOCK_PATH
+    with _ingest_thread_lock:
+        if fcntl is None:
+            yield
+            return
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
+class Job:
+    """State of one queued background job"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    def __init__(self, key: str):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.status = Job.QUEUED
+        self.created_at = datetime.now()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in (Job.SUCCEEDED, Job.FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "key": self.key,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error
+        }
+
+
+class JobQueue:
+    """Bounded worker pool that coalesces identical in-flight jobs"""
+
+    def __init__(self, max_workers: Optional[int] = None, history: Optional[int] = None):
+        """
+        Initialize job queue
+
+        Args:
+            max_workers: Jobs run concurrently (defaults to settings.JOB_MAX_WORKERS)
+            history: Finished jobs kept for status lookups (defaults to settings.JOB_HISTORY)
+        """
+        self.history = history or settings.JOB_HISTORY
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or settings.JOB_MAX_WORKERS,
+            thread_name_prefix="job"
+        )
+        self._jobs = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key: str, fn: Callable[[], Any]) -> Job:
+        """
+        Queue a job, or return the in-flight job with the same key
+
+        Args:
+            key: Identity of the work; equal keys are coalesced
+            fn: Callable run on a worker thread; its return value becomes the result
+
+        Returns:
+            New or existing job
+
+        Raises:
+            RuntimeError: The queue has been shut down (the job is marked failed)
+        """
+        with self._lock:
+            job = self._in_flight.get(key)
+            if job is not None:
+                return job
+
+            job = Job(key)
+            self._jobs[job.id] = job
+            self._in_flight[key] = job
+            self._prune()
+
+        try:
+            self._executor.submit(self._run, job, fn)
+        except Exception as e:
+            # e.g. the executor was shut down; the key must not stay in flight
+            # or every later submit would coalesce onto a job that never runs
+            self._finish(job, error=str(e))
+            raise
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: Job, fn: Callable[[], Any]) -> None:
+        job.status = Job.RUNNING
+        job.started_at = datetime.now()
+        error = None
+        try:
+            if settings.SQL_PROFILE:
+                from src.database.profiler import profile
+                with profile(f"job {job.key}"):
+                    job.result = fn()
+            else:
+                job.result = fn()
+        except Exception as e:
+            logger.error(f"Job {job.key} ({job.id}) failed: {e}", exc_info=True)
+            error = str(e)
+        finally:
+            self._finish(job, error)
+
+    def _finish(self, job: Job, error: Optional[str] = None) -> None:
+        """Record the outcome of a job and release its key"""
+        job.error = error
+        job.status = Job.FAILED if error is not None else Job.SUCCEEDED
+        job.finished_at = datetime.now()
+        with self._lock:
+            self._in_flight.pop(job.key, None)
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond the history limit"""
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
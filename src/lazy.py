@@ -0,0 +1,34 @@
+"""Lazy package exports (PEP 562) for modules with heavy dependencies"""
+import importlib
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build module ``__getattr__``/``__dir__`` hooks that import on first access
+
+    ``from package import Name`` keeps working, but the submodule defining
+    ``Name`` (and whatever it imports) only loads when the name is used.
+
+    Args:
+        package: ``__name__`` of the package
+        exports: Exported name -> module that defines it
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        # Cache on the package so later lookups skip this hook
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
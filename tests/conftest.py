@@ -0,0 +1,95 @@
+"""Shared fixtures: an isolated database, cache directories and sample pages"""
+import os
+import tempfile
+from pathlib import Path
+
+# Settings are read at import time, so point everything at a scratch
+# directory before any src module is imported
+_TMP = Path(tempfile.mkdtemp(prefix="gh_trending_tests_"))
+os.environ.update({
+    'DATABASE_URL': f"sqlite:///{_TMP / 'test.db'}",
+    'SCRAPER_CACHE_DIR': '',
+    'SCRAPER_ARCHIVE_DIR': '',
+    'SCRAPER_RATE_LIMIT': '1000',
+    'SCRAPER_RATE_BURST': '1000',
+    'SCRAPER_BACKOFF_BASE': '0',
+    'INGEST_LOCK_PATH': str(_TMP / 'ingest.lock'),
+    'API_CACHE_PATH': str(_TMP / 'api_cache.db'),
+    'REPORT_CACHE_DIR': str(_TMP / 'reports'),
+    'OPENAI_API_KEY': '',
+})
+
+import pytest  # noqa: E402
+from sqlalchemy import event, text  # noqa: E402
+from src.database.base import Base, SessionLocal, engine, get_async_engine  # noqa: E402
+from src.database.search import DROP_SEARCH_INDEX_DDL  # noqa: E402
+
+pytest_plugins = ["src.database.pytest_plugin", "pytester"]
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def db():
+    """Session on an empty database"""
+    with engine.begin() as conn:
+        for statement in DROP_SEARCH_INDEX_DDL:
+            conn.execute(text(statement))
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def api_client(db, monkeypatch):
+    """TestClient of the API with an empty response cache that re-reads the data version per request"""
+    from fastapi.testclient import TestClient
+    import src.api as api
+    from src.api_cache import MemoryCacheBackend, ResponseCache
+
+    monkeypatch.setattr(api, "response_cache", ResponseCache(MemoryCacheBackend(1024 * 1024), ttl=300))
+    monkeypatch.setattr(api.data_version, "check_interval", 0)
+    api.data_version.invalidate()
+    with TestClient(api.app) as client:
+        yield client
+
+
+@pytest.fixture
+def statements():
+    """Count statements the API sends to the database (it runs on another thread)"""
+    executed = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    engine = get_async_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    yield executed
+    event.remove(engine, "before_cursor_execute", count)
+
+
+@pytest.fixture
+def trending_html():
+    """Saved GitHub trending page"""
+    return (FIXTURES / "trending_daily.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def make_repos():
+    """Factory of scraped repository dictionaries shaped like the parsers' output"""
+    def make(count: int, prefix: str = "owner", language: str = "Python"):
+        return [{
+            'rank': i,
+            'name': f"repo{i}",
+            'full_name': f"{prefix}/repo{i}",
+            'owner': prefix,
+            'description': f"Repository number {i}",
+            'language': language,
+            'stars': 1000 - i,
+            'url': f"https://github.com/{prefix}/repo{i}",
+        } for i in range(1, count + 1)]
+    return make
@@ -0,0 +1,119 @@
+"""ETag revalidation, response cache invalidation and compression of the API"""
+from datetime import datetime, timedelta
+import pytest
+from fastapi.testclient import TestClient
+import src.api as api
+from src.database.data_version import bump_data_version
+from src.database.ingest import bulk_ingest
+
+
+@pytest.fixture
+def client(db, make_repos, monkeypatch):
+    bulk_ingest(db, make_repos(30), snapshot_date=datetime.now())
+    db.commit()
+    # Trust a read data version for the whole test unless a test invalidates it
+    monkeypatch.setattr(api.data_version, "check_interval", 3600)
+    api.data_version.invalidate()
+    with TestClient(api.app) as client:
+        yield client
+
+
+def test_warm_client_gets_304_without_touching_the_database(client, statements):
+    first = client.get("/api/trending")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    statements.clear()
+    second = client.get("/api/trending", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert second.content == b""
+    assert statements == []
+
+
+def test_etag_depends_on_the_query(client):
+    assert client.get("/api/trending?limit=5").headers["etag"] != client.get("/api/trending").headers["etag"]
+
+
+def test_ingest_invalidates_etag_and_cached_body(client, db, make_repos):
+    first = client.get("/api/trending?limit=100")
+    etag = first.headers["etag"]
+    assert len(first.json()) == 30
+
+    bulk_ingest(db, make_repos(40), snapshot_date=datetime.now())
+    db.commit()
+    api.data_version.invalidate()
+
+    second = client.get("/api/trending?limit=100", headers={"If-None-Match": etag})
+    assert second.status_code == 200
+    assert second.headers["etag"] != etag
+    assert len(second.json()) == 40
+
+
+def test_data_version_bump_invalidates(client, db):
+    etag = client.get("/api/trending").headers["etag"]
+    bump_data_version(db)
+    db.commit()
+
+    # Until the version is re-read the old representation stays valid
+    assert client.get("/api/trending", headers={"If-None-Match": etag}).status_code == 304
+    api.data_version.invalidate()
+    assert client.get("/api/trending", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_large_responses_are_gzipped(client):
+    compressed = client.get("/api/trending", headers={"Accept-Encoding": "gzip"})
+    identity = client.get("/api/trending", headers={"Accept-Encoding": "identity"})
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in identity.headers
+    assert compressed.content == identity.content
+    # Bytes on the wire: the compressed body is a fraction of the JSON
+    assert int(compressed.headers["content-length"]) < int(identity.headers["content-length"]) / 3
+
+
+def test_small_responses_are_not_compressed(client):
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+
+def test_etag_is_weak_and_responses_vary_on_encoding(client):
+    for encoding in ("gzip", "identity"):
+        response = client.get("/api/trending", headers={"Accept-Encoding": encoding})
+        assert response.headers["etag"].startswith('W/"')
+        assert "Accept-Encoding" in response.headers["vary"]
+
+    # The gzipped and identity bodies are the same representation
+    etag = client.get("/api/trending", headers={"Accept-Encoding": "gzip"}).headers["etag"]
+    revalidated = client.get("/api/trending", headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["vary"] == "Accept-Encoding"
+
+
+def test_if_none_match_uses_weak_comparison(client):
+    etag = client.get("/api/trending").headers["etag"]
+    strong = etag.removeprefix("W/")
+    assert client.get("/api/trending", headers={"If-None-Match": strong}).status_code == 304
+    assert client.get("/api/trending", headers={"If-None-Match": f'"other", {etag}'}).status_code == 304
+
+
+class _Tomorrow(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return datetime.now(tz) + timedelta(days=1)
+
+
+@pytest.mark.parametrize("report_cache", ["disk", "memory"])
+def test_html_report_etag_changes_with_the_date(client, monkeypatch, report_cache):
+    if report_cache == "memory":
+        monkeypatch.setattr(api, "report_cache", None)
+    today = client.get("/api/report/html")
+    assert today.status_code == 200
+    assert client.get("/api/report/html", headers={"If-None-Match": today.headers["etag"]}).status_code == 304
+
+    # Same data version, but a new day renders a different report
+    monkeypatch.setattr(api, "datetime", _Tomorrow)
+    tomorrow = client.get("/api/report/html", headers={"If-None-Match": today.headers["etag"]})
+    assert tomorrow.status_code == 200
+    assert tomorrow.headers["etag"] != today.headers["etag"]
+    assert tomorrow.text != today.text
@@ -0,0 +1,88 @@
+"""Page archive and the offline backfill from it"""
+import gzip
+from concurrent.futures import Future
+from datetime import date, datetime, timedelta
+import pytest
+import src.fetch_data.backfill as backfill
+from src.fetch_data.archive import PageArchive, read_archive_file
+from src.fetch_data.backfill import backfill_archive
+
+
+class InlineExecutor:
+    """Runs tasks on submit and records how many results are waiting to be consumed"""
+
+    def __init__(self, max_workers=None):
+        self.pending = 0
+        self.max_pending = 0
+        InlineExecutor.last = self
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        self.pending += 1
+        self.max_pending = max(self.max_pending, self.pending)
+        executor = self
+        result = future.result
+
+        def consume(timeout=None):
+            executor.pending -= 1
+            return result(timeout)
+
+        future.result = consume
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def test_backfill_keeps_a_bounded_window_of_parsed_days(db, tmp_path, trending_html, monkeypatch):
+    archive = PageArchive(str(tmp_path / "archive"))
+    first = date(2024, 1, 1)
+    for offset in range(10):
+        fetched_at = datetime.combine(first + timedelta(days=offset), datetime.min.time()).replace(hour=10)
+        archive.append(trending_html, url="https://github.com/trending", since="daily", fetched_at=fetched_at)
+    monkeypatch.setattr(backfill, "ProcessPoolExecutor", InlineExecutor)
+
+    saved = backfill_archive(db, first, first + timedelta(days=9), archive=archive, workers=2)
+
+    assert saved == 10 * 24
+    # Two tasks per worker at most, however many days are archived
+    assert InlineExecutor.last.max_pending == 4
+
+
+def _corrupt_deflate_stream(member: bytes) -> bytes:
+    # Invalid block type bits right after the 10-byte gzip header
+    return member[:10] + b"\xff" * 8 + member[18:]
+
+
+@pytest.mark.parametrize("damage", [
+    pytest.param(lambda member: member[:len(member) // 2], id="truncated"),
+    pytest.param(lambda member: b"this is not gzip", id="not-gzip"),
+    pytest.param(_corrupt_deflate_stream, id="corrupt-deflate"),
+    pytest.param(lambda member: gzip.compress(b'{"fetched_at": "2024-01-01T10:00'), id="partial-json"),
+])
+def test_damaged_archive_keeps_the_records_before_the_damage(tmp_path, damage):
+    archive = PageArchive(str(tmp_path))
+    fetched_at = datetime(2024, 1, 1, 10)
+    path = archive.append("<html>first</html>", url="u", since="daily", fetched_at=fetched_at)
+    intact = path.read_bytes()
+    archive.append("<html>second</html>", url="u", since="daily", fetched_at=fetched_at)
+    second = path.read_bytes()[len(intact):]
+    path.write_bytes(intact + damage(second))
+
+    records = list(read_archive_file(path))
+
+    assert [record["html"] for record in records] == ["<html>first</html>"]
+    assert records[0]["fetched_at"] == fetched_at
+
+
+def test_backfill_continues_past_a_corrupt_day(db, tmp_path, trending_html):
+    archive = PageArchive(str(tmp_path))
+    for day in (1, 2):
+        archive.append(trending_html, url="u", since="daily", fetched_at=datetime(2024, 1, day, 10))
+    archive.day_path(date(2024, 1, 1)).write_bytes(b"garbage")
+
+    assert backfill_archive(db, date(2024, 1, 1), date(2024, 1, 2), archive=archive, workers=1) == 24
@@ -0,0 +1,67 @@
+"""New-run announcements of the SSE broadcaster"""
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+import pytest_asyncio
+from src.database.base import get_async_engine
+from src.database.data_version import bump_data_version
+from src.database.ingest import bulk_ingest
+from src.events import RunBroadcaster
+
+
+@pytest_asyncio.fixture
+async def broadcaster(db):
+    broadcaster = RunBroadcaster()
+    queue = asyncio.Queue()
+    broadcaster._subscribers.add(queue)
+    broadcaster.queue = queue
+    yield broadcaster
+    # Pooled aiosqlite connections belong to this test's event loop
+    await get_async_engine().dispose()
+
+
+def _ingest(db, repos, snapshot_date, language=None):
+    bulk_ingest(db, repos, snapshot_date=snapshot_date, language=language)
+    db.commit()
+
+
+@pytest.mark.asyncio
+async def test_only_new_daily_runs_are_announced(broadcaster, db, make_repos):
+    yesterday = datetime.now() - timedelta(days=1)
+    _ingest(db, make_repos(5), yesterday)
+    await broadcaster._check()
+    assert broadcaster.queue.empty()
+
+    # Other pages and bare version bumps leave the latest daily run alone
+    _ingest(db, make_repos(3, prefix="rust"), datetime.now(), language="rust")
+    await broadcaster._check()
+    bump_data_version(db)
+    db.commit()
+    await broadcaster._check()
+    assert broadcaster.queue.empty()
+
+    repos = make_repos(5)
+    repos[0]['rank'], repos[1]['rank'] = 2, 1
+    _ingest(db, repos, datetime.now())
+    await broadcaster._check()
+    message = broadcaster.queue.get_nowait()
+    assert message.startswith(b"event: run\n")
+    assert b'"moved":[{"full_name":"owner/repo2","from":2,"to":1}' in message
+
+    # Nothing changed since the last poll
+    await broadcaster._check()
+    assert broadcaster.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_same_day_refetch_is_announced(broadcaster, db, make_repos):
+    now = datetime.now()
+    _ingest(db, make_repos(5), now - timedelta(minutes=5))
+    await broadcaster._check()
+
+    # The day's run is reused, with a new fetched_at
+    run_id = broadcaster.latest_run[0]
+    _ingest(db, make_repos(6), now)
+    await broadcaster._check()
+    assert broadcaster.latest_run == (run_id, now)
+    assert f'"run_id":{run_id},'.encode() in broadcaster.queue.get_nowait()
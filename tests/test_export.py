@@ -0,0 +1,111 @@
+"""Streaming table export and its API"""
+import csv
+import io
+import sys
+from datetime import date, datetime
+import orjson
+import pytest
+from src.database.ingest import bulk_ingest
+from src.export import EXPORT_TABLES, export_table
+
+DAY_1 = datetime(2024, 3, 1, 10)
+DAY_2 = datetime(2024, 3, 2, 10)
+
+
+@pytest.fixture
+def dataset(db, make_repos):
+    bulk_ingest(db, make_repos(10), snapshot_date=DAY_1)
+    bulk_ingest(db, make_repos(3, prefix="late"), snapshot_date=DAY_2)
+    db.commit()
+    return db
+
+
+def _csv_rows(data: bytes):
+    return list(csv.DictReader(io.StringIO(data.decode("utf-8"))))
+
+
+def _ndjson_rows(data: bytes):
+    return [orjson.loads(line) for line in data.splitlines()]
+
+
+def test_csv_streams_one_chunk_per_batch_with_a_single_header(dataset):
+    chunks = list(export_table(dataset, "snapshots", "csv", batch_size=4))
+
+    assert len(chunks) == 4
+    assert chunks[0].startswith(b"id,")
+    rows = _csv_rows(b"".join(chunks))
+    assert len(rows) == 13
+    assert [int(row["id"]) for row in rows] == sorted(int(row["id"]) for row in rows)
+    assert set(rows[0]) == {column.name for column in EXPORT_TABLES["snapshots"].columns}
+
+
+def test_ndjson_streams_every_row(dataset):
+    chunks = list(export_table(dataset, "projects", "ndjson", batch_size=5))
+
+    assert len(chunks) == 3
+    rows = _ndjson_rows(b"".join(chunks))
+    assert len(rows) == 13
+    assert rows[0]["full_name"] == "owner/repo1"
+
+
+@pytest.mark.parametrize("table, expected", [
+    ("snapshots", 3),
+    ("runs", 1),
+    ("projects", 3),
+])
+def test_date_filter(dataset, table, expected):
+    rows = _ndjson_rows(b"".join(export_table(dataset, table, "ndjson", date_from=DAY_2.date())))
+    assert len(rows) == expected
+
+    rows = _ndjson_rows(b"".join(export_table(dataset, table, "ndjson", date_to=DAY_1.date())))
+    assert len(rows) == {"snapshots": 10, "runs": 1, "projects": 10}[table]
+
+
+def test_unknown_table_or_format_is_rejected(db):
+    with pytest.raises(ValueError, match="Unknown export table"):
+        export_table(db, "users")
+    with pytest.raises(ValueError, match="Unknown export format"):
+        export_table(db, "projects", "xlsx")
+
+
+def test_parquet_without_pyarrow_is_a_runtime_error(db, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+    with pytest.raises(RuntimeError, match="pyarrow"):
+        export_table(db, "projects", "parquet")
+
+
+def test_export_endpoint_csv(dataset, api_client):
+    response = api_client.get("/api/export/snapshots")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="snapshots.csv"'
+    assert len(_csv_rows(response.content)) == 13
+
+
+def test_export_endpoint_ndjson_with_date_filter(dataset, api_client, monkeypatch):
+    import src.api as api
+    monkeypatch.setattr(api.settings, "API_STREAM_BATCH_SIZE", 2)
+
+    response = api_client.get("/api/export/snapshots", params={
+        "format": "ndjson", "date_from": "2024-03-02", "date_to": "2024-03-02"
+    })
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.headers["content-disposition"] == 'attachment; filename="snapshots.ndjson"'
+    rows = _ndjson_rows(response.content)
+    assert len(rows) == 3
+    assert {row["date"][:10] for row in rows} == {date(2024, 3, 2).isoformat()}
+
+
+def test_export_endpoint_unknown_table_is_404(api_client):
+    assert api_client.get("/api/export/users").status_code == 404
+    assert api_client.get("/api/export/projects", params={"format": "xlsx"}).status_code == 422
+
+
+def test_export_endpoint_parquet_without_pyarrow_is_501(api_client, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+    response = api_client.get("/api/export/projects", params={"format": "parquet"})
+    assert response.status_code == 501
+    assert "pyarrow" in response.json()["detail"]
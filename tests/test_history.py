@@ -0,0 +1,153 @@
+"""Snapshot history: cursors, keyset pages and the NDJSON stream"""
+import base64
+from datetime import datetime
+import orjson
+import pytest
+import src.api as api
+from src.database.history import decode_cursor, encode_cursor, snapshot_page_stmt
+from src.database.ingest import bulk_ingest
+from src.database.models import Project, TrendingSnapshot
+
+DAY_1 = datetime(2024, 3, 1, 10)
+DAY_2 = datetime(2024, 3, 2, 10)
+
+
+@pytest.fixture
+def history(db, make_repos):
+    # The later day is ingested first so ids and dates disagree on the order
+    bulk_ingest(db, make_repos(5, prefix="late"), snapshot_date=DAY_2)
+    bulk_ingest(db, make_repos(20), snapshot_date=DAY_1)
+    bulk_ingest(db, make_repos(3), snapshot_date=DAY_2, since="weekly")
+    db.commit()
+    return db
+
+
+def _expected(db, **filters):
+    query = db.query(TrendingSnapshot.id).order_by(TrendingSnapshot.date, TrendingSnapshot.id)
+    if "project_id" in filters:
+        query = query.filter(TrendingSnapshot.project_id == filters["project_id"])
+    return [row.id for row in query]
+
+
+def _b64(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(DAY_1, 42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (DAY_1, 42)
+
+
+@pytest.mark.parametrize("cursor", [
+    pytest.param("!!!", id="not-base64"),
+    pytest.param(_b64("2024-03-01T10:00:00"), id="no-separator"),
+    pytest.param(_b64("2024-03-01T10:00:00|1|2"), id="extra-field"),
+    pytest.param(_b64("yesterday|1"), id="bad-date"),
+    pytest.param(_b64("2024-03-01T10:00:00|one"), id="bad-id"),
+    pytest.param(base64.urlsafe_b64encode(b"\xff\xfe|1").decode(), id="not-utf8"),
+])
+def test_malformed_cursor_is_rejected(cursor, api_client):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+    assert api_client.get("/api/snapshots", params={"cursor": cursor}).status_code == 400
+    assert api_client.get("/api/projects/1/history", params={"cursor": cursor}).status_code == 400
+
+
+def test_pages_seek_across_equal_dates_without_gaps_or_repeats(history):
+    seen, after = [], None
+    while True:
+        rows = history.execute(snapshot_page_stmt(7, after)).all()
+        seen += [row.id for row in rows]
+        if len(rows) < 7:
+            break
+        # Go through the opaque cursor like a client would
+        after = decode_cursor(encode_cursor(rows[-1].date, rows[-1].id))
+
+    assert seen == _expected(history)
+    assert len(seen) == 28
+
+
+def test_page_filters(history):
+    rows = history.execute(snapshot_page_stmt(100, since="weekly")).all()
+    assert len(rows) == 3 and {row.since for row in rows} == {"weekly"}
+
+    rows = history.execute(snapshot_page_stmt(100, date_from=DAY_2)).all()
+    assert len(rows) == 8 and {row.date for row in rows} == {DAY_2}
+
+    rows = history.execute(snapshot_page_stmt(100, date_to=DAY_1)).all()
+    assert len(rows) == 20
+
+    project = history.query(Project).filter(Project.full_name == "owner/repo1").one()
+    rows = history.execute(snapshot_page_stmt(100, project_id=project.id)).all()
+    assert [row.id for row in rows] == _expected(history, project_id=project.id)
+    assert [row.since for row in rows] == ["daily", "weekly"]
+
+
+def test_snapshots_endpoint_follows_next_cursor(history, api_client):
+    seen, params = [], {"limit": 7}
+    while True:
+        page = api_client.get("/api/snapshots", params=params).json()
+        seen += [item["id"] for item in page["items"]]
+        if not page["next_cursor"]:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    assert seen == _expected(history)
+
+
+def _ndjson(response):
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [orjson.loads(line) for line in response.text.splitlines()]
+
+
+@pytest.mark.parametrize("negotiate", [
+    pytest.param({"params": {"format": "ndjson"}}, id="format-param"),
+    pytest.param({"headers": {"Accept": "application/x-ndjson"}}, id="accept-header"),
+])
+def test_ndjson_streams_the_rest_of_the_range_in_batches(history, api_client, monkeypatch, negotiate):
+    # Several batches, the last of them partial
+    monkeypatch.setattr(api.settings, "API_STREAM_BATCH_SIZE", 6)
+    everything = _expected(history)
+
+    items = _ndjson(api_client.get("/api/snapshots", **negotiate))
+    assert [item["id"] for item in items] == everything
+
+    first = api_client.get("/api/snapshots", params={"limit": 10}).json()
+    params = {**negotiate.get("params", {}), "cursor": first["next_cursor"]}
+    rest = _ndjson(api_client.get("/api/snapshots", params=params, headers=negotiate.get("headers")))
+    assert [item["id"] for item in rest] == everything[10:]
+
+
+def test_project_history(history, api_client):
+    project = history.query(Project).filter(Project.full_name == "owner/repo1").one()
+    expected = _expected(history, project_id=project.id)
+
+    page = api_client.get(f"/api/projects/{project.id}/history", params={"limit": 1}).json()
+    assert [item["id"] for item in page["items"]] == expected[:1]
+    assert page["items"][0]["full_name"] == "owner/repo1"
+
+    rest = _ndjson(api_client.get(
+        f"/api/projects/{project.id}/history", params={"format": "ndjson", "cursor": page["next_cursor"]}
+    ))
+    assert [item["id"] for item in rest] == expected[1:]
+
+
+def test_unknown_project_history_is_404(history, api_client):
+    assert api_client.get("/api/projects/999/history").status_code == 404
+    assert api_client.get("/api/projects/999/history", params={"format": "ndjson"}).status_code == 404
+
+
+def test_project_history_revalidates_before_querying(history, api_client, statements, monkeypatch):
+    project = history.query(Project).first()
+    url = f"/api/projects/{project.id}/history"
+    etag = api_client.get(url).headers["etag"]
+    monkeypatch.setattr(api.data_version, "check_interval", 3600)
+    api_client.get(url)
+    statements.clear()
+
+    response = api_client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert statements == []
@@ -0,0 +1,18 @@
+"""Startup import time of the entry points stays within budget"""
+from src.import_budget import BASELINES, check_import_budgets, format_report, measure, relative_budget
+
+
+def test_entry_points_within_import_budget():
+    timings = check_import_budgets(runs=3)
+    assert all(timing.ok for timing in timings), format_report(timings)
+
+
+def test_slow_import_exceeds_the_budget(tmp_path, monkeypatch):
+    baseline_ms, _, _ = measure(BASELINES['main'], runs=3)
+    budget_ms = relative_budget(baseline_ms)
+    (tmp_path / "slow_dependency.py").write_text(f"import time\ntime.sleep({budget_ms / 1000})\n")
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+
+    milliseconds, _, error = measure("import main, slow_dependency", runs=1)
+    assert not error
+    assert milliseconds > budget_ms
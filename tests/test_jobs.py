@@ -0,0 +1,188 @@
+"""Background job queue, its API and the ingest lock"""
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+import pytest
+import scheduler
+import src.api as api
+import src.fetch_data as fetch_data
+from src.jobs import Job, JobQueue, ingest_lock
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def queue():
+    queue = JobQueue(max_workers=1)
+    yield queue
+    queue.shutdown(wait=True)
+
+
+def test_identical_keys_share_one_job(queue):
+    release = threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        release.wait(5)
+        return 42
+
+    first = queue.submit("fetch:daily", work)
+    assert queue.submit("fetch:daily", work) is first
+    other = queue.submit("fetch:weekly", lambda: 0)
+    assert other is not first
+
+    release.set()
+    _wait_for(lambda: first.done and other.done)
+    assert first.status == Job.SUCCEEDED and first.result == 42
+    assert calls == [1]
+
+    # Once finished, the key is free again
+    again = queue.submit("fetch:daily", lambda: 7)
+    assert again is not first
+    _wait_for(lambda: again.done)
+    assert again.result == 7
+
+
+def test_failed_job_records_the_error_and_frees_the_key(queue):
+    def fail():
+        raise ValueError("boom")
+
+    job = queue.submit("fetch:daily", fail)
+    _wait_for(lambda: job.done)
+    assert job.status == Job.FAILED
+    assert job.error == "boom"
+    assert queue.submit("fetch:daily", lambda: 1) is not job
+
+
+def test_submit_after_shutdown_does_not_leave_the_key_in_flight():
+    queue = JobQueue(max_workers=1)
+    queue.shutdown()
+
+    with pytest.raises(RuntimeError):
+        queue.submit("fetch:daily", lambda: 1)
+    with pytest.raises(RuntimeError):
+        queue.submit("fetch:daily", lambda: 1)
+
+    failed = list(queue._jobs.values())
+    assert len(failed) == 2
+    assert all(job.status == Job.FAILED and job.finished_at for job in failed)
+
+
+@pytest.fixture
+def fetch_api(api_client, queue, monkeypatch):
+    """API whose fetch job blocks on an event instead of scraping"""
+    release = threading.Event()
+
+    def fake_fetch():
+        release.wait(5)
+        return 24
+
+    monkeypatch.setattr(api, "job_queue", queue)
+    monkeypatch.setattr(api, "_fetch_daily", fake_fetch)
+    return api_client, queue, release
+
+
+def test_job_status_goes_from_queued_to_succeeded(fetch_api):
+    client, queue, release = fetch_api
+    # Occupy the only worker so the fetch stays queued
+    blocker = queue.submit("other", lambda: release.wait(5))
+
+    response = client.post("/api/fetch")
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+    assert response.json()["status"] == Job.QUEUED
+    assert client.get(f"/api/jobs/{job_id}").json()["status"] == Job.QUEUED
+
+    # Concurrent clicks coalesce onto the queued job
+    assert client.post("/api/fetch").json()["id"] == job_id
+
+    release.set()
+    _wait_for(lambda: blocker.done and queue.get(job_id).done)
+    status = client.get(f"/api/jobs/{job_id}").json()
+    assert status["status"] == Job.SUCCEEDED
+    assert status["result"] == 24
+    assert status["started_at"] and status["finished_at"]
+
+
+def test_running_job_status(fetch_api):
+    client, queue, release = fetch_api
+    job_id = client.post("/api/fetch").json()["id"]
+    _wait_for(lambda: queue.get(job_id).status == Job.RUNNING)
+    assert client.get(f"/api/jobs/{job_id}").json()["status"] == Job.RUNNING
+    release.set()
+
+
+def test_unknown_job_is_404(api_client):
+    assert api_client.get("/api/jobs/does-not-exist").status_code == 404
+
+
+def test_fetch_after_shutdown_is_503(fetch_api):
+    client, queue, release = fetch_api
+    queue.shutdown()
+    assert client.post("/api/fetch").status_code == 503
+    assert client.post("/api/fetch").status_code == 503
+
+
+def test_api_job_and_scheduler_do_not_ingest_concurrently(queue, monkeypatch):
+    events = []
+    job_holds_lock = threading.Event()
+    release = threading.Event()
+
+    class FakeScraper:
+        def __init__(self, db):
+            pass
+
+        def fetch_and_save(self, since="daily"):
+            events.append("api start")
+            job_holds_lock.set()
+            release.wait(5)
+            events.append("api end")
+            return 0
+
+        def fetch_and_save_many(self, languages, ranges):
+            events.append("scheduler start")
+            return 0
+
+    monkeypatch.setattr(fetch_data, "TrendingScraper", FakeScraper, raising=False)
+    job = queue.submit("fetch:daily", api._fetch_daily)
+    assert job_holds_lock.wait(5)
+
+    daily = threading.Thread(target=scheduler.daily_job)
+    daily.start()
+    time.sleep(0.2)
+    # The scheduler is waiting for the lock held by the API job
+    assert events == ["api start"]
+
+    release.set()
+    daily.join(5)
+    _wait_for(lambda: job.done)
+    assert events == ["api start", "api end", "scheduler start"]
+
+
+def test_ingest_lock_excludes_other_processes(tmp_path):
+    lock_path = tmp_path / "ingest.lock"
+    holder = subprocess.Popen(
+        [sys.executable, "-c",
+         "import time\n"
+         "from src.jobs import ingest_lock\n"
+         f"with ingest_lock({str(lock_path)!r}):\n"
+         "    print('locked', flush=True)\n"
+         "    time.sleep(0.5)\n"],
+        cwd=Path(__file__).resolve().parents[1], stdout=subprocess.PIPE, text=True
+    )
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        start = time.monotonic()
+        with ingest_lock(str(lock_path)):
+            waited = time.monotonic() - start
+    finally:
+        holder.wait(5)
+    assert waited > 0.2
@@ -0,0 +1,124 @@
+"""Duplicate snapshot compaction"""
+from datetime import date, datetime
+import pytest
+from sqlalchemy import MetaData, UniqueConstraint, create_engine, event, func, insert, select, text
+from sqlalchemy.orm import Session
+from src.database.base import Base
+from src.database.data_version import get_data_version
+from src.database.ingest import bulk_ingest
+from src.database.maintenance import compact_snapshots
+from src.database.models import FetchRun, Project, TrendingSnapshot
+
+runs = FetchRun.__table__
+snapshots = TrendingSnapshot.__table__
+
+
+@pytest.fixture
+def make_legacy_db(tmp_path):
+    """Sessions on the schema from before the unique run/snapshot constraints"""
+    sessions = []
+
+    def make(with_run_date=True):
+        metadata = MetaData()
+        for table in Base.metadata.sorted_tables:
+            copy = table.to_metadata(metadata)
+            copy.constraints = {c for c in copy.constraints if not isinstance(c, UniqueConstraint)}
+        engine = create_engine(f"sqlite:///{tmp_path / f'legacy{len(sessions)}.db'}")
+        metadata.create_all(engine)
+        if not with_run_date:
+            with engine.begin() as conn:
+                conn.execute(text("ALTER TABLE fetch_runs DROP COLUMN run_date"))
+        session = Session(engine)
+        sessions.append(session)
+        session.execute(insert(Project.__table__), [
+            {'id': i, 'name': f"repo{i}", 'full_name': f"owner/repo{i}", 'owner': "owner", 'url': "u"}
+            for i in range(1, 6)
+        ])
+        return session
+
+    yield make
+    for session in sessions:
+        session.close()
+        session.get_bind().dispose()
+
+
+def _add_run(db, run_id, fetched_at, run_date=None, project_ids=(1, 2, 3)):
+    values = {'id': run_id, 'since': "daily", 'language': "", 'fetched_at': fetched_at,
+              'row_count': len(project_ids), 'created_at': fetched_at}
+    if run_date is not None:
+        values['run_date'] = run_date
+    db.execute(insert(runs).values(**values))
+    db.execute(insert(snapshots), [
+        {'project_id': project_id, 'run_id': run_id, 'rank': rank, 'stars_at_snapshot': 10, 'date': fetched_at}
+        for rank, project_id in enumerate(project_ids, 1)
+    ])
+    db.commit()
+
+
+def _run_ids(db):
+    return db.scalars(select(runs.c.id).order_by(runs.c.id)).all()
+
+
+def test_latest_run_of_each_run_date_is_kept(make_legacy_db):
+    db = make_legacy_db()
+    _add_run(db, 1, datetime(2026, 5, 2, 8), run_date=date(2026, 5, 2))
+    _add_run(db, 2, datetime(2026, 5, 2, 20), run_date=date(2026, 5, 2), project_ids=(1, 2))
+    # Another day's page, fetched on the same calendar day (e.g. a late backfill)
+    _add_run(db, 3, datetime(2026, 5, 2, 9), run_date=date(2026, 5, 1))
+
+    assert compact_snapshots(db, pause=0) == {'runs': 1, 'snapshots': 3}
+    assert _run_ids(db) == [2, 3]
+    assert db.scalar(select(func.count(snapshots.c.id))) == 5
+    assert get_data_version(db) == 1
+
+
+def test_databases_without_run_date_group_by_the_fetch_day(make_legacy_db):
+    db = make_legacy_db(with_run_date=False)
+    _add_run(db, 1, datetime(2026, 5, 2, 8))
+    _add_run(db, 2, datetime(2026, 5, 2, 20))
+    _add_run(db, 3, datetime(2026, 5, 3, 8))
+
+    assert compact_snapshots(db, pause=0) == {'runs': 1, 'snapshots': 3}
+    assert _run_ids(db) == [2, 3]
+
+
+def test_duplicate_snapshots_are_found_once_and_deleted_in_batches(make_legacy_db):
+    db = make_legacy_db()
+    _add_run(db, 1, datetime(2026, 5, 2, 8), run_date=date(2026, 5, 2),
+             project_ids=(1, 2, 1, 3, 1, 2, 4, 2, 3))
+    kept = db.scalars(
+        select(func.min(snapshots.c.id)).group_by(snapshots.c.project_id).order_by(snapshots.c.project_id)
+    ).all()
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    assert compact_snapshots(db, batch_size=2, pause=0) == {'runs': 0, 'snapshots': 5}
+
+    assert db.scalars(select(snapshots.c.id).order_by(snapshots.c.id)).all() == kept
+    assert db.scalar(select(runs.c.row_count)) == 4
+    # One search for the duplicates, then three batches of primary key deletes
+    assert sum("EXISTS" in statement for statement in statements) == 1
+    assert sum(statement.startswith("DELETE FROM trending_snapshots") for statement in statements) == 3
+
+
+def test_compaction_of_the_current_schema_keeps_distinct_run_dates(db, make_repos):
+    fetched_at = datetime(2026, 5, 2, 8, 0)
+    bulk_ingest(db, make_repos(4), snapshot_date=fetched_at)
+    bulk_ingest(db, make_repos(3), snapshot_date=datetime(2026, 5, 1, 8, 0))
+    # Fetched later the same day, but for the previous trending day
+    previous = db.scalars(select(FetchRun).where(FetchRun.run_date == date(2026, 5, 1))).one()
+    previous.fetched_at = fetched_at.replace(hour=10)
+    db.commit()
+
+    assert compact_snapshots(db, pause=0) == {'runs': 0, 'snapshots': 0}
+    assert db.scalar(select(func.count(TrendingSnapshot.id))) == 7
+
+
+def test_compaction_without_duplicates_keeps_the_data_version(db, make_repos):
+    bulk_ingest(db, make_repos(4), snapshot_date=datetime(2026, 5, 2, 8, 0))
+    db.commit()
+    version = get_data_version(db)
+
+    assert compact_snapshots(db, pause=0) == {'runs': 0, 'snapshots': 0}
+    assert get_data_version(db) == version
@@ -0,0 +1,122 @@
+"""Request metrics and their Prometheus text exposition"""
+import re
+from datetime import datetime
+import pytest
+from src.database.ingest import bulk_ingest
+from src.database.models import Project
+from src.metrics import Counter, Histogram, Registry
+
+NAME = r"[a-zA-Z_:][a-zA-Z0-9_:]*"
+LABEL = rf'{NAME}="(?:[^"\\\n]|\\.)*"'
+SAMPLE = re.compile(rf"^({NAME})(\{{{LABEL}(?:,{LABEL})*\}})? (\S+)$")
+
+
+def _parse(text):
+    """Validate Prometheus text format 0.0.4 and return {(name, labels): value}"""
+    assert text.endswith("\n")
+    samples, types = {}, {}
+    for line in text.splitlines():
+        if line.startswith("# HELP "):
+            continue
+        if line.startswith("# TYPE "):
+            _, _, name, kind = line.split(" ")
+            assert kind in {"counter", "gauge", "histogram", "summary", "untyped"}
+            assert name not in types, f"duplicate TYPE for {name}"
+            types[name] = kind
+            continue
+        match = SAMPLE.match(line)
+        assert match, f"invalid sample line: {line!r}"
+        name, labels, value = match.groups()
+        family = re.sub(r"_(bucket|sum|count)$", "", name) if name not in types else name
+        assert family in types, f"{name} has no TYPE line before it"
+        float(value.replace("+Inf", "inf"))
+        samples[(name, labels or "")] = value
+    return samples
+
+
+def _value(samples, name, **labels):
+    wanted = {f'{key}="{value}"' for key, value in labels.items()}
+    matches = [
+        float(value) for (sample, sample_labels), value in samples.items()
+        if sample == name and wanted <= set(sample_labels.strip("{}").split(","))
+    ]
+    assert len(matches) == 1, f"{name}{labels}: {matches}"
+    return matches[0]
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1))
+    for value in (0.05, 0.5, 0.5, 5):
+        histogram.observe(value, route="/a")
+
+    samples = _parse(registry.render())
+
+    assert _value(samples, "latency_seconds_bucket", route="/a", le="0.1") == 1
+    assert _value(samples, "latency_seconds_bucket", route="/a", le="1") == 3
+    assert _value(samples, "latency_seconds_bucket", route="/a", le="+Inf") == 4
+    assert _value(samples, "latency_seconds_count", route="/a") == 4
+    assert _value(samples, "latency_seconds_sum", route="/a") == pytest.approx(6.05)
+
+
+def test_counter_renders_help_type_and_labels():
+    registry = Registry()
+    counter = registry.register(Counter("jobs_total", "Jobs by result", ("result",)))
+    counter.inc(result="ok")
+    counter.inc(2, result="ok")
+    registry.register(Histogram("unused_seconds", "Never observed"))
+
+    text = registry.render()
+
+    assert text.splitlines()[:3] == [
+        "# HELP jobs_total Jobs by result",
+        "# TYPE jobs_total counter",
+        'jobs_total{result="ok"} 3',
+    ]
+    assert "# TYPE unused_seconds histogram" in text
+    _parse(text)
+
+
+def test_scrape_reports_the_request_by_route_template(db, make_repos, api_client):
+    bulk_ingest(db, make_repos(3), snapshot_date=datetime(2024, 3, 1, 10))
+    db.commit()
+    project_id = db.query(Project).first().id
+    route = "/api/projects/{project_id}/history"
+    before = _parse(api_client.get("/metrics").text)
+
+    assert api_client.get(f"/api/projects/{project_id}/history").status_code == 200
+    assert api_client.get("/api/projects/999999/history").status_code == 404
+    response = api_client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    after = _parse(response.text)
+
+    def delta(name, **labels):
+        try:
+            previous = _value(before, name, **labels)
+        except AssertionError:
+            previous = 0
+        return _value(after, name, **labels) - previous
+
+    # Raw paths would make a label value per project
+    assert f"/api/projects/{project_id}/history" not in response.text
+    assert delta("http_requests_total", method="GET", route=route, status="200") == 1
+    assert delta("http_requests_total", method="GET", route=route, status="404") == 1
+    assert delta("http_request_duration_seconds_count", method="GET", route=route) == 2
+
+    # The SQL issued by the async session is attributed to the request
+    assert delta("http_request_sql_queries_count", route=route) == 2
+    assert delta("http_request_sql_queries_sum", route=route) >= 2
+    assert delta("http_request_sql_seconds_sum", route=route) > 0
+    assert delta("db_queries_total") >= 2
+    assert delta("db_query_duration_seconds_count") == delta("db_queries_total")
+
+
+def test_unknown_paths_share_one_label(api_client):
+    api_client.get("/no/such/page")
+    api_client.get("/another/missing/page")
+    text = api_client.get("/metrics").text
+
+    assert "/no/such/page" not in text
+    assert _value(_parse(text), "http_requests_total", method="GET", route="unmatched", status="404") >= 2
@@ -0,0 +1,42 @@
+"""The lxml and BeautifulSoup parser backends must agree on saved pages"""
+from pathlib import Path
+import pytest
+from src.fetch_data.parsers import get_parser, parse_with_bs4, parse_with_lxml
+
+PAGES = sorted((Path(__file__).parent / "fixtures").glob("trending_*.html"))
+
+
+@pytest.mark.parametrize("page", PAGES, ids=lambda path: path.stem)
+def test_backends_return_identical_records(page):
+    html = page.read_text(encoding="utf-8")
+    assert parse_with_lxml(html) == parse_with_bs4(html)
+
+
+def test_daily_page_fields(trending_html):
+    repos = parse_with_lxml(trending_html)
+
+    # One article has no repository link and is skipped; ranks keep page order
+    assert len(repos) == 24
+    assert [repo['rank'] for repo in repos] == [r for r in range(1, 26) if r != 18]
+
+    first = repos[0]
+    assert first['full_name'] == f"{first['owner']}/{first['name']}"
+    assert first['url'] == f"https://github.com/{first['full_name']}"
+    assert first['stars'] == 12757
+
+    by_rank = {repo['rank']: repo for repo in repos}
+    assert by_rank[3]['description'] == "Type-safe ORM <with> migrations"
+    assert by_rank[4]['description'] == ""
+    assert by_rank[6]['language'] is None
+    assert by_rank[9]['stars'] == 0
+
+
+@pytest.mark.parametrize("html", ["", "   ", "<html><body></body></html>"])
+def test_pages_without_articles(html):
+    assert parse_with_lxml(html) == []
+    assert parse_with_bs4(html) == []
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_parser("regex")
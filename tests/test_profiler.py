@@ -0,0 +1,55 @@
+"""SQL profiler and the query budget pytest plugin"""
+import pytest
+from sqlalchemy import select, text
+from src.database.models import Project
+from src.database.profiler import QueryBudgetExceeded, normalize_sql, profile
+
+
+def test_normalize_sql_groups_literals():
+    assert normalize_sql("SELECT * FROM t WHERE id = 42 AND name = 'it''s'") == \
+        "SELECT * FROM t WHERE id = ? AND name = ?"
+    assert normalize_sql("SELECT * FROM t WHERE id IN (?, ?,  ?)") == "SELECT * FROM t WHERE id IN (?...)"
+
+
+def test_profile_flags_repeated_statements(db):
+    with profile("per-row lookups", log=False) as current:
+        for project_id in range(6):
+            db.execute(select(Project).where(Project.id == project_id)).first()
+
+    assert current.count == 6
+    [repeated] = current.n_plus_one(threshold=5)
+    assert repeated.count == 6
+
+
+def test_query_budget_fixture(db, query_budget):
+    with query_budget(2) as current:
+        db.execute(text("SELECT 1"))
+        db.execute(text("SELECT 2"))
+    assert current.count == 2
+
+    with pytest.raises(QueryBudgetExceeded):
+        with query_budget(1):
+            db.execute(text("SELECT 1"))
+            db.execute(text("SELECT 2"))
+
+
+@pytest.mark.query_budget(1)
+def test_query_budget_marker_within_budget(db):
+    db.execute(text("SELECT 1"))
+
+
+def test_query_budget_marker_fails_the_test(pytester):
+    pytester.makeconftest('pytest_plugins = ["src.database.pytest_plugin"]')
+    pytester.makepyfile("""
+        import pytest
+        from sqlalchemy import create_engine, text
+
+        @pytest.mark.query_budget(1)
+        def test_over_budget():
+            with create_engine("sqlite://").connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+    """)
+    result = pytester.runpytest_inprocess()
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["*Query budget of 1 exceeded*"])
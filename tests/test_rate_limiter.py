@@ -0,0 +1,181 @@
+"""Token bucket, back-off policy and the scraper's retrying GET, on a fake clock"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import pytest
+import requests
+import src.fetch_data.rate_limiter as rate_limiter
+import src.fetch_data.trending_scraper as trending_scraper
+from src.fetch_data.rate_limiter import RateLimiter, backoff_delay, parse_retry_after
+from src.fetch_data.trending_scraper import TrendingScraper
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping only advances monotonic()"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    monkeypatch.setattr(trending_scraper, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def full_jitter(monkeypatch):
+    """Make the jittered back-off always wait its upper bound"""
+    monkeypatch.setattr(rate_limiter.random, "uniform", lambda low, high: high)
+
+
+def test_bucket_allows_a_burst_then_the_sustained_rate(clock):
+    limiter = RateLimiter(rate=2, burst=3)
+
+    assert [limiter.acquire() for _ in range(3)] == [0, 0, 0]
+    assert clock.sleeps == []
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert clock.sleeps == pytest.approx([0.5, 0.5])
+
+
+def test_idle_time_refills_the_bucket_up_to_the_burst(clock):
+    limiter = RateLimiter(rate=2, burst=3)
+    for _ in range(3):
+        limiter.acquire()
+
+    clock.now += 60
+    assert [limiter.acquire() for _ in range(3)] == [0, 0, 0]
+    assert limiter.acquire() == pytest.approx(0.5)
+
+
+def test_pause_holds_back_callers_and_empties_the_bucket(clock):
+    limiter = RateLimiter(rate=2, burst=3)
+    limiter.pause(5)
+    # A shorter pause never shortens the current one
+    limiter.pause(1)
+
+    assert limiter.acquire() == pytest.approx(5)
+    assert clock.sleeps == pytest.approx([5])
+    assert limiter.stats() == {'requests': 1, 'wait_seconds': 5.0, 'retries': 0, 'throttled': 0}
+
+
+def test_backoff_doubles_up_to_the_cap(full_jitter):
+    assert [backoff_delay(attempt, base=1, cap=10) for attempt in range(6)] == [1, 2, 4, 8, 10, 10]
+
+
+def test_backoff_is_jittered_below_the_bound():
+    delays = [backoff_delay(3, base=1, cap=10) for _ in range(50)]
+    assert all(0 <= delay <= 8 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7
+    assert parse_retry_after("-3") == 0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(format_datetime(datetime.now(timezone.utc) - timedelta(hours=1), usegmt=True)) == 0
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 < parse_retry_after(later) <= 30
+
+
+class StubSession:
+    """requests.Session replaying canned responses (or exceptions) in order"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _response(status, retry_after=None):
+    response = requests.Response()
+    response.status_code = status
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return response
+
+
+@pytest.fixture
+def make_scraper(db, clock, monkeypatch):
+    monkeypatch.setattr(trending_scraper.settings, "SCRAPER_BACKOFF_BASE", 1.0)
+    monkeypatch.setattr(trending_scraper.settings, "SCRAPER_BACKOFF_MAX", 5.0)
+    monkeypatch.setattr(trending_scraper.settings, "SCRAPER_MAX_RETRIES", 4)
+
+    def make(*outcomes):
+        scraper = TrendingScraper(db, rate_limiter=RateLimiter(rate=1000, burst=1000))
+        scraper.session = StubSession(*outcomes)
+        return scraper
+    return make
+
+
+def test_429_then_200_waits_for_retry_after(make_scraper, clock):
+    scraper = make_scraper(_response(429, retry_after="3"), _response(200))
+
+    assert scraper._get("https://github.com/trending", {}).status_code == 200
+
+    assert scraper.session.calls == 2
+    # The pause is served by the limiter before the next request
+    assert clock.sleeps == pytest.approx([3])
+    assert scraper.rate_limiter.stats()['retries'] == 1
+    assert scraper.rate_limiter.stats()['throttled'] == 1
+
+
+def test_retry_after_is_capped(make_scraper, clock):
+    scraper = make_scraper(_response(429, retry_after="3600"), _response(200))
+
+    assert scraper._get("https://github.com/trending", {}).status_code == 200
+    assert clock.sleeps == pytest.approx([5])
+
+
+def test_429_without_retry_after_backs_off_exponentially(make_scraper, clock, full_jitter):
+    scraper = make_scraper(_response(429), _response(429), _response(429), _response(200))
+
+    assert scraper._get("https://github.com/trending", {}).status_code == 200
+    assert scraper.session.calls == 4
+    assert clock.sleeps == pytest.approx([1, 2, 4])
+
+
+def test_server_errors_stop_after_max_retries(make_scraper, clock, full_jitter):
+    scraper = make_scraper(*[_response(503) for _ in range(5)])
+
+    assert scraper._get("https://github.com/trending", {}).status_code == 503
+    assert scraper.session.calls == 5
+    assert clock.sleeps == pytest.approx([1, 2, 4, 5])
+    assert scraper.rate_limiter.stats()['retries'] == 4
+    assert scraper.rate_limiter.stats()['throttled'] == 0
+
+
+def test_client_errors_are_not_retried(make_scraper, clock):
+    scraper = make_scraper(_response(404))
+
+    assert scraper._get("https://github.com/trending", {}).status_code == 404
+    assert scraper.session.calls == 1
+    assert clock.sleeps == []
+
+
+def test_connection_errors_are_retried_then_raised(make_scraper, clock, full_jitter):
+    scraper = make_scraper(requests.ConnectionError("reset"), _response(200))
+    assert scraper._get("https://github.com/trending", {}).status_code == 200
+    assert clock.sleeps == pytest.approx([1])
+
+    scraper = make_scraper(*[requests.Timeout("slow") for _ in range(5)])
+    with pytest.raises(requests.Timeout):
+        scraper._get("https://github.com/trending", {})
+    assert scraper.session.calls == 5
@@ -0,0 +1,81 @@
+"""Built-in table renderers against the pandas/tabulate implementation"""
+from pathlib import Path
+import pytest
+from src.fetch_data.parsers import parse_with_lxml
+from src.generate.renderers import markdown_table
+from src.generate.table_generator import TableGenerator
+
+pytest.importorskip("pandas")
+pytest.importorskip("tabulate")
+
+PAGES = sorted((Path(__file__).parent / "fixtures").glob("trending_*.html"))
+
+
+def _table_rows(repos):
+    """Shape parsed repositories like TableGenerator.get_trending_data rows"""
+    return [{
+        'rank': repo['rank'],
+        'name': repo['name'],
+        'full_name': repo['full_name'],
+        'description': repo['description'][:100] + '...' if len(repo['description']) > 100 else repo['description'],
+        'language': repo['language'] or 'N/A',
+        'stars': repo['stars'],
+        'url': repo['url'],
+        'has_summary': False
+    } for repo in repos]
+
+
+def _row(rank, description, language="Python"):
+    return {'rank': rank, 'name': f"repo{rank}", 'full_name': f"owner/repo{rank}", 'description': description,
+            'language': language, 'stars': 100 * rank, 'url': f"https://github.com/owner/repo{rank}",
+            'has_summary': False}
+
+
+EDGE_CASES = {
+    'numeric_descriptions_with_empty': [_row(1, "42"), _row(2, ""), _row(3, "3.14")],
+    'none_description': [_row(1, None), _row(2, "A web framework")],
+    'only_none_descriptions': [_row(1, None), _row(2, None)],
+    'bool_and_integer_text': [_row(1, "True"), _row(2, "7")],
+    'wide_characters': [_row(1, "中文自然语言处理工具包"), _row(2, "emoji 🚀 launcher")],
+    'multiline': [_row(1, "first line\nsecond line"), _row(2, "one line")],
+    'missing_rank': [_row(1, "a"), {**_row(2, "b"), 'rank': None}],
+}
+
+
+@pytest.fixture
+def pandas_tables():
+    return TableGenerator(None, use_pandas=True)
+
+
+@pytest.fixture
+def tables():
+    return TableGenerator(None)
+
+
+@pytest.mark.parametrize("page", PAGES, ids=lambda path: path.stem)
+def test_fixture_pages_match_pandas(page, tables, pandas_tables):
+    rows = _table_rows(parse_with_lxml(page.read_text(encoding="utf-8")))
+    assert tables.generate_markdown_table(rows) == pandas_tables.generate_markdown_table(rows)
+    assert tables.generate_csv(rows) == pandas_tables.generate_csv(rows)
+    # pandas does not escape HTML; the fixtures contain "&" and "<"
+    escaped = [{**row, 'description': row['description'].replace("&", "and").replace("<", "").replace(">", "")}
+               for row in rows]
+    assert tables.generate_html_table(escaped) == pandas_tables.generate_html_table(escaped)
+
+
+@pytest.mark.parametrize("rows", EDGE_CASES.values(), ids=EDGE_CASES.keys())
+def test_edge_cases_match_pandas(rows, tables, pandas_tables):
+    assert tables.generate_markdown_table(rows) == pandas_tables.generate_markdown_table(rows)
+
+
+def test_bool_and_decimal_text_renders_as_text():
+    # tabulate raises ValueError on this column; the built-in renderer keeps it as text
+    table = markdown_table([_row(1, "True"), _row(2, "3.14")])
+    assert table.splitlines()[1].endswith("|:--------------|")
+    assert "| True          |" in table
+
+
+def test_html_is_escaped(tables):
+    html = tables.generate_html_table([_row(1, "<script>alert(1)</script> & more")])
+    assert "&lt;script&gt;alert(1)&lt;/script&gt; &amp; more" in html
+    assert "<script>" not in html
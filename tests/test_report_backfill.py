@@ -0,0 +1,60 @@
+"""Incremental date-range report builds"""
+from datetime import date, datetime
+from pathlib import Path
+import pytest
+from src.database.ingest import bulk_ingest
+from src.generate.report_backfill import build_reports
+from src.generate.report_cache import ReportCache
+
+DAYS = [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3)]
+
+
+def _ingest(db, repos, day, language=None):
+    bulk_ingest(db, repos, snapshot_date=datetime.combine(day, datetime.min.time()), language=language)
+    db.commit()
+
+
+@pytest.fixture
+def history(db, make_repos):
+    for day in DAYS:
+        _ingest(db, make_repos(5), day)
+    return db
+
+
+def _build(db, tmp_path, **kwargs):
+    written = build_reports(
+        db, DAYS[0], DAYS[-1],
+        output_dir=str(tmp_path / "reports"),
+        workers=2,
+        include_commentary=False,
+        cache=ReportCache(str(tmp_path / "cache")),
+        **kwargs
+    )
+    return sorted(Path(path).name for path in written)
+
+
+def test_workers_use_the_callers_cache(history, tmp_path):
+    assert _build(history, tmp_path) == [
+        "trending_report_20260101.md", "trending_report_20260102.md", "trending_report_20260103.md"
+    ]
+    assert len(list((tmp_path / "cache" / "report").glob("*/*.md"))) == 3
+
+    assert _build(history, tmp_path) == []
+
+
+def test_ingest_only_rebuilds_the_days_it_touched(history, make_repos, tmp_path):
+    _build(history, tmp_path, include_analysis=False)
+
+    _ingest(history, make_repos(6), DAYS[1])
+    assert _build(history, tmp_path, include_analysis=False) == ["trending_report_20260102.md"]
+
+    # Another page on another day leaves every all-languages report alone
+    _ingest(history, make_repos(3, prefix="py"), DAYS[2], language="python")
+    assert _build(history, tmp_path, include_analysis=False) == []
+
+
+def test_analysis_reports_follow_their_window(history, make_repos, tmp_path):
+    _build(history, tmp_path)
+
+    _ingest(history, make_repos(3, prefix="py"), DAYS[2], language="python")
+    assert _build(history, tmp_path) == ["trending_report_20260103.md"]
@@ -0,0 +1,45 @@
+"""Report caching must never keep a report with a degraded section"""
+import pytest
+from src.database.ingest import bulk_ingest
+from src.generate.report_cache import ReportCache
+from src.generate.report_generator import COMMENTARY_UNAVAILABLE, ReportGenerator
+
+
+@pytest.fixture
+def generator(db, make_repos, tmp_path):
+    bulk_ingest(db, make_repos(10))
+    db.commit()
+    return ReportGenerator(db, output_dir=str(tmp_path / "reports"), cache=ReportCache(str(tmp_path / "cache")))
+
+
+def test_unavailable_commentary_is_not_cached(generator, monkeypatch):
+    monkeypatch.setattr(ReportGenerator, "_complete", lambda self, prompt: None)
+    assert COMMENTARY_UNAVAILABLE in generator.generate_daily_report()
+
+    monkeypatch.setattr(ReportGenerator, "_complete", lambda self, prompt: "Python dominates today.")
+    report = generator.generate_daily_report()
+    assert "Python dominates today." in report
+    assert COMMENTARY_UNAVAILABLE not in report
+
+
+def test_failed_commentary_is_not_cached(generator, monkeypatch):
+    def broken(self, trending_data):
+        raise RuntimeError("prompt too long")
+
+    monkeypatch.setattr(ReportGenerator, "_generate_commentary", broken)
+    assert "AI Analysis & Commentary" not in generator.generate_daily_report()
+
+    monkeypatch.undo()
+    monkeypatch.setattr(ReportGenerator, "_complete", lambda self, prompt: "Python dominates today.")
+    assert "Python dominates today." in generator.generate_daily_report()
+
+
+def test_complete_report_is_served_from_cache(generator, monkeypatch):
+    monkeypatch.setattr(ReportGenerator, "_complete", lambda self, prompt: "Python dominates today.")
+    report = generator.generate_daily_report()
+
+    def unreachable(self, *args):
+        raise AssertionError("report should come from the cache")
+
+    monkeypatch.setattr(ReportGenerator, "_build_report", unreachable)
+    assert generator.generate_daily_report() == report
@@ -0,0 +1,98 @@
+"""Fetch run creation on ingest and run lookups"""
+from datetime import date, datetime
+from sqlalchemy import func, select
+from src.database.ingest import _get_or_create_run, bulk_ingest
+from src.database.models import FetchRun, TrendingSnapshot
+from src.database.runs import get_latest_run, get_run_for_date, get_runs_between, get_runs_for_range
+
+NOW = datetime(2026, 5, 2, 12, 0)
+
+
+def _run_count(db):
+    return db.scalar(select(func.count(FetchRun.id)))
+
+
+def test_get_or_create_run_creates_a_run_for_a_new_page_and_day(db):
+    run = _get_or_create_run(db, datetime(2026, 5, 2, 8), "daily", "", 25, NOW)
+
+    assert run.id is not None
+    assert (run.run_date, run.since, run.language) == (date(2026, 5, 2), "daily", "")
+    assert run.fetched_at == datetime(2026, 5, 2, 8)
+    assert run.row_count == 25
+    assert run.created_at == NOW
+
+
+def test_get_or_create_run_reuses_and_refreshes_the_days_run(db):
+    first = _get_or_create_run(db, datetime(2026, 5, 2, 8), "daily", "", 25, NOW)
+    db.commit()
+
+    again = _get_or_create_run(db, datetime(2026, 5, 2, 20), "daily", "", 24, datetime(2026, 5, 2, 21))
+
+    assert again.id == first.id
+    assert again.fetched_at == datetime(2026, 5, 2, 20)
+    assert again.row_count == 24
+    # created_at records the first fetch of the day
+    assert again.created_at == NOW
+    assert _run_count(db) == 1
+
+
+def test_get_or_create_run_keeps_pages_and_days_apart(db):
+    ids = {
+        _get_or_create_run(db, datetime(2026, 5, 2, 8), "daily", "", 25, NOW).id,
+        _get_or_create_run(db, datetime(2026, 5, 2, 8), "weekly", "", 25, NOW).id,
+        _get_or_create_run(db, datetime(2026, 5, 2, 8), "daily", "python", 25, NOW).id,
+        _get_or_create_run(db, datetime(2026, 5, 3, 8), "daily", "", 25, NOW).id,
+    }
+    assert len(ids) == 4
+
+
+def test_reingest_replaces_the_days_snapshots(db, make_repos):
+    bulk_ingest(db, make_repos(5), snapshot_date=datetime(2026, 5, 2, 8))
+    bulk_ingest(db, make_repos(3), snapshot_date=datetime(2026, 5, 2, 20))
+    db.commit()
+
+    run = get_run_for_date(db, date(2026, 5, 2))
+    assert _run_count(db) == 1
+    assert run.fetched_at == datetime(2026, 5, 2, 20)
+    assert run.row_count == 3
+    assert db.scalar(select(func.count(TrendingSnapshot.id)).where(TrendingSnapshot.run_id == run.id)) == 3
+
+
+def _ingest_days(db, make_repos):
+    for day in (1, 2, 4):
+        bulk_ingest(db, make_repos(2), snapshot_date=datetime(2026, 5, day, 8))
+    bulk_ingest(db, make_repos(2), snapshot_date=datetime(2026, 5, 2, 9), since="weekly")
+    bulk_ingest(db, make_repos(2), snapshot_date=datetime(2026, 5, 2, 10), language="rust")
+    db.commit()
+
+
+def test_get_runs_for_range_maps_each_fetched_day_of_one_page(db, make_repos):
+    _ingest_days(db, make_repos)
+
+    runs = get_runs_for_range(db, date(2026, 5, 1), date(2026, 5, 3))
+
+    assert sorted(runs) == [date(2026, 5, 1), date(2026, 5, 2)]
+    assert all(run.since == "daily" and run.language == "" for run in runs.values())
+    assert list(get_runs_for_range(db, date(2026, 5, 2), date(2026, 5, 4), since="weekly")) == [date(2026, 5, 2)]
+    assert list(get_runs_for_range(db, date(2026, 5, 1), date(2026, 5, 4), language="rust")) == [date(2026, 5, 2)]
+    assert get_runs_for_range(db, date(2026, 6, 1), date(2026, 6, 30)) == {}
+
+
+def test_get_runs_between_returns_every_page_oldest_day_first(db, make_repos):
+    _ingest_days(db, make_repos)
+
+    runs = get_runs_between(db, date(2026, 5, 2), date(2026, 5, 4))
+
+    assert [run.run_date for run in runs] == [date(2026, 5, 2)] * 3 + [date(2026, 5, 4)]
+    assert {(run.since, run.language) for run in runs[:3]} == {("daily", ""), ("weekly", ""), ("daily", "rust")}
+    assert get_runs_between(db, date(2026, 5, 3), date(2026, 5, 3)) == []
+
+
+def test_latest_and_dated_run_lookups(db, make_repos):
+    _ingest_days(db, make_repos)
+
+    assert get_latest_run(db).run_date == date(2026, 5, 4)
+    assert get_latest_run(db, language="rust").run_date == date(2026, 5, 2)
+    assert get_latest_run(db, since="monthly") is None
+    assert get_run_for_date(db, datetime(2026, 5, 1, 23)).run_date == date(2026, 5, 1)
+    assert get_run_for_date(db, date(2026, 5, 3)) is None
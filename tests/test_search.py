@@ -0,0 +1,144 @@
+"""Full-text project search: query building, ranking, filters and the API"""
+from datetime import datetime
+import pytest
+from sqlalchemy import update
+from src.database.ingest import bulk_ingest
+from src.database.models import Project
+from src.database.search import match_query, rebuild_search_index, search_stmt
+
+DAY_1 = datetime(2024, 3, 1, 10)
+DAY_2 = datetime(2024, 3, 8, 10)
+
+
+def _repo(rank, full_name, description, language="Python", stars=100):
+    owner, name = full_name.split("/")
+    return {
+        'rank': rank,
+        'name': name,
+        'full_name': full_name,
+        'owner': owner,
+        'description': description,
+        'language': language,
+        'stars': stars,
+        'url': f"https://github.com/{full_name}",
+    }
+
+
+@pytest.fixture
+def projects(db):
+    bulk_ingest(db, [
+        _repo(1, "acme/vector-db", "A database for embeddings", stars=500),
+        _repo(2, "acme/notes", "Notes app with vector search built in", stars=900),
+        _repo(3, "rusty/vector", "Vector math for games", language="Rust", stars=50),
+    ], snapshot_date=DAY_1)
+    bulk_ingest(db, [
+        _repo(1, "late/vectorize", "Turns images into vectors", language="Rust", stars=10),
+    ], snapshot_date=DAY_2)
+    db.commit()
+    return db
+
+
+def _names(db, statement):
+    return [row.full_name for row in db.execute(statement)]
+
+
+def test_match_query_quotes_every_word_and_prefixes_the_last():
+    assert match_query("vector db") == '"vector" "db"*'
+    assert match_query("  fast-api ") == '"fast" "api"*'
+
+
+def test_match_query_neutralizes_fts_syntax():
+    assert match_query('vector OR "db" NEAR(x') == '"vector" "OR" "db" "NEAR" "x"*'
+    assert match_query("col:value*") == '"col" "value"*'
+
+
+def test_match_query_without_words_is_empty():
+    assert match_query("") == ""
+    assert match_query(' "*:() ') == ""
+
+
+def test_fts_ranks_name_matches_above_description_matches(projects):
+    names = _names(projects, search_stmt("vector", "sqlite"))
+
+    # "vectorize" matches through the prefix on the last word
+    assert set(names) == {"acme/vector-db", "acme/notes", "rusty/vector", "late/vectorize"}
+    # bm25 weighs name/full_name above description, regardless of stars
+    assert names.index("acme/vector-db") < names.index("acme/notes")
+    assert names.index("rusty/vector") < names.index("acme/notes")
+
+
+def test_fts_requires_every_word(projects):
+    assert _names(projects, search_stmt("vector games", "sqlite")) == ["rusty/vector"]
+
+
+def test_fts_language_filter(projects):
+    names = _names(projects, search_stmt("vector", "sqlite", language="Rust"))
+    assert set(names) == {"rusty/vector", "late/vectorize"}
+
+
+def test_fts_date_filters_use_trending_dates(projects):
+    assert _names(projects, search_stmt("vector", "sqlite", date_from=datetime(2024, 3, 5))) == ["late/vectorize"]
+    names = _names(projects, search_stmt("vector", "sqlite", date_to=datetime(2024, 3, 5)))
+    assert "late/vectorize" not in names and len(names) == 3
+
+
+def test_fts_limit_and_offset_page_through_the_ranking(projects):
+    everything = _names(projects, search_stmt("vector", "sqlite"))
+    pages = _names(projects, search_stmt("vector", "sqlite", limit=2)) + \
+        _names(projects, search_stmt("vector", "sqlite", limit=2, offset=2))
+    assert pages == everything
+
+
+def test_like_fallback_matches_substrings_by_stars(projects):
+    names = _names(projects, search_stmt("vector", "postgresql"))
+    # Case-insensitive substring of full_name or description, most stars first
+    assert names == ["acme/notes", "acme/vector-db", "rusty/vector", "late/vectorize"]
+    assert _names(projects, search_stmt("vector", "postgresql", language="Rust")) == [
+        "rusty/vector", "late/vectorize"
+    ]
+
+
+def test_triggers_keep_the_index_in_sync(projects):
+    projects.execute(
+        update(Project).where(Project.full_name == "acme/notes").values(description="Plain text notes")
+    )
+    projects.commit()
+    assert "acme/notes" not in _names(projects, search_stmt("search", "sqlite"))
+
+    projects.query(Project).filter(Project.full_name == "rusty/vector").delete()
+    projects.commit()
+    assert "rusty/vector" not in _names(projects, search_stmt("games", "sqlite"))
+
+
+def test_rebuild_indexes_every_project(projects):
+    assert rebuild_search_index(projects) == 4
+    assert len(_names(projects, search_stmt("vector", "sqlite"))) == 4
+
+
+def test_search_endpoint_paginates(projects, api_client):
+    first = api_client.get("/api/search", params={"q": "vector", "limit": 3})
+    assert first.status_code == 200
+    page = first.json()
+    assert len(page["items"]) == 3
+    assert page["next_offset"] == 3
+    assert page["items"][0]["full_name"] in {"acme/vector-db", "rusty/vector"}
+    assert {"id", "name", "description", "language", "stars", "url", "score"} <= set(page["items"][0])
+
+    rest = api_client.get("/api/search", params={"q": "vector", "limit": 3, "offset": 3}).json()
+    assert len(rest["items"]) == 1
+    assert rest["next_offset"] is None
+
+    found = {item["full_name"] for item in page["items"] + rest["items"]}
+    assert found == {"acme/vector-db", "acme/notes", "rusty/vector", "late/vectorize"}
+
+
+def test_search_endpoint_filters(projects, api_client):
+    page = api_client.get("/api/search", params={
+        "q": "vector", "language": "Rust", "date_from": "2024-03-05T00:00:00"
+    }).json()
+    assert [item["full_name"] for item in page["items"]] == ["late/vectorize"]
+
+
+def test_search_endpoint_rejects_queries_without_words(api_client):
+    assert api_client.get("/api/search", params={"q": "***"}).status_code == 400
+    assert api_client.get("/api/search", params={"q": "x", "limit": 0}).status_code == 422
@@ -0,0 +1,53 @@
+"""Batched trending data loader"""
+from datetime import date, datetime
+import pytest
+from src.database.ingest import bulk_ingest
+from src.database.models import Project, Summary
+from src.generate.table_generator import TableGenerator
+
+DAYS = [date(2026, 3, day) for day in range(1, 8)]
+
+
+@pytest.fixture
+def history(db, make_repos):
+    for offset, day in enumerate(DAYS):
+        bulk_ingest(db, make_repos(40 + offset), snapshot_date=datetime.combine(day, datetime.min.time()))
+        # Another page the same day must not leak into the all-languages table
+        bulk_ingest(db, make_repos(5, prefix="rust"), snapshot_date=datetime.combine(day, datetime.min.time()),
+                    language="rust")
+    project = db.query(Project).filter_by(full_name="owner/repo2").one()
+    db.add(Summary(project_id=project.id, summary_text="A summary"))
+    db.commit()
+    return db
+
+
+def test_many_dates_load_in_one_query(history, query_budget):
+    with query_budget(1):
+        data = TableGenerator(history).get_trending_data_many(DAYS + [date(2026, 2, 1)], limit=30)
+
+    assert sorted(data) == DAYS
+    for rows in data.values():
+        assert [row['rank'] for row in rows] == list(range(1, 31))
+        assert {row['full_name'] for row in rows if row['has_summary']} == {"owner/repo2"}
+
+
+@pytest.mark.query_budget(1)
+def test_single_date_is_one_query(history):
+    rows = TableGenerator(history).get_trending_data(date=DAYS[0], limit=100)
+
+    assert len(rows) == 40
+    assert rows[0] == {
+        'rank': 1,
+        'name': "repo1",
+        'full_name': "owner/repo1",
+        'description': "Repository number 1",
+        'language': "Python",
+        'stars': 999,
+        'url': "https://github.com/owner/repo1",
+        'has_summary': False
+    }
+
+
+@pytest.mark.query_budget(1)
+def test_date_without_a_run(db):
+    assert TableGenerator(db).get_trending_data(date=DAYS[0]) == []
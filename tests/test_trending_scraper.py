@@ -0,0 +1,167 @@
+"""Scraper against a local stub of the trending page"""
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from datetime import date
+from sqlalchemy import func, select
+import src.fetch_data.trending_scraper as trending_scraper
+from src.database.models import FetchRun, Project, TrendingSnapshot
+from src.fetch_data.archive import PageArchive, read_archive_file
+from src.fetch_data.backfill import backfill_archive
+from src.fetch_data.rate_limiter import RateLimiter
+from src.fetch_data.response_cache import ResponseCache
+from src.fetch_data.trending_scraper import TrendingScraper
+
+
+class StubTrending(BaseHTTPRequestHandler):
+    """Serves the saved trending page with an ETag and answers revalidation with 304"""
+
+    body = b""
+    requests = []
+
+    def do_GET(self):
+        etag = '"' + hashlib.sha1(self.body).hexdigest() + '"'
+        StubTrending.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server(trending_html):
+    StubTrending.body = trending_html.encode("utf-8")
+    StubTrending.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubTrending)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/trending"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def scraper(db, stub_server, tmp_path):
+    scraper = TrendingScraper(
+        db,
+        max_workers=2,
+        cache=ResponseCache(str(tmp_path / "http")),
+        rate_limiter=RateLimiter(rate=1000, burst=1000)
+    )
+    scraper.BASE_URL = stub_server
+    return scraper
+
+
+def _snapshot_count(db, language=""):
+    return db.scalar(
+        select(func.count(TrendingSnapshot.id))
+        .join(FetchRun, TrendingSnapshot.run_id == FetchRun.id)
+        .where(FetchRun.language == language)
+    )
+
+
+def _fail_ingest_once(monkeypatch, language=None):
+    """Make the next bulk_ingest of ``language`` raise, as a locked or full database would"""
+    real_ingest = trending_scraper.bulk_ingest
+    failed = []
+
+    def flaky_ingest(db, trending_data, **kwargs):
+        if not failed and kwargs.get("language") == language:
+            failed.append(True)
+            raise RuntimeError("database is locked")
+        return real_ingest(db, trending_data, **kwargs)
+
+    monkeypatch.setattr(trending_scraper, "bulk_ingest", flaky_ingest)
+
+
+def test_unchanged_page_is_revalidated_and_skipped(scraper, db):
+    assert scraper.fetch_and_save() == 24
+    assert scraper.fetch_and_save() == 0
+
+    assert StubTrending.requests[1][1] is not None
+    assert scraper.cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_failed_save_does_not_poison_the_cache(scraper, db, monkeypatch):
+    _fail_ingest_once(monkeypatch)
+
+    with pytest.raises(RuntimeError):
+        scraper.fetch_and_save()
+    assert _snapshot_count(db) == 0
+
+    # The retry must download and save the page again instead of getting a 304
+    assert scraper.fetch_and_save() == 24
+    assert StubTrending.requests[1][1] is None
+    assert _snapshot_count(db) == 24
+
+
+def test_failed_parse_does_not_poison_the_cache(scraper, db, monkeypatch):
+    real_parser = scraper.parser
+
+    def broken_parser(html):
+        raise ValueError("unexpected markup")
+
+    scraper.parser = broken_parser
+    with pytest.raises(ValueError):
+        scraper.fetch_and_save()
+
+    scraper.parser = real_parser
+    assert scraper.fetch_and_save() == 24
+
+
+def test_fetch_and_save_many_skips_only_the_failed_page(scraper, db, monkeypatch):
+    _fail_ingest_once(monkeypatch, language="python")
+
+    assert scraper.fetch_and_save_many(languages=[None, "python"]) == 24
+    assert _snapshot_count(db) == 24
+    assert _snapshot_count(db, "python") == 0
+
+    # Only the failed page is downloaded again; the saved one revalidates to 304
+    assert scraper.fetch_and_save_many(languages=[None, "python"]) == 24
+    assert _snapshot_count(db, "python") == 24
+    assert scraper.fetch_and_save_many(languages=[None, "python"]) == 0
+
+
+def _snapshots(db):
+    return sorted(db.execute(
+        select(FetchRun.run_date, FetchRun.since, FetchRun.language, Project.full_name,
+               TrendingSnapshot.rank, TrendingSnapshot.stars_at_snapshot)
+        .join(FetchRun, TrendingSnapshot.run_id == FetchRun.id)
+        .join(Project, TrendingSnapshot.project_id == Project.id)
+    ).all())
+
+
+def test_archived_pages_backfill_to_the_live_snapshots(scraper, db, tmp_path):
+    scraper.archive = PageArchive(str(tmp_path / "archive"))
+    assert scraper.fetch_and_save() == 24
+    assert scraper.fetch_and_save(language="python") == 24
+    # A 304 is archived too: the backfill must see every fetch, not only changes
+    assert scraper.fetch_and_save() == 0
+
+    today = date.today()
+    records = list(read_archive_file(scraper.archive.day_path(today)))
+    assert [(record["language"], record["since"]) for record in records] == [
+        (None, "daily"), ("python", "daily"), (None, "daily")
+    ]
+
+    live = _snapshots(db)
+    assert len(live) == 48
+    for model in (TrendingSnapshot, FetchRun, Project):
+        db.query(model).delete()
+    db.commit()
+
+    assert backfill_archive(db, today, today, archive=scraper.archive, workers=1) == 72
+    assert _snapshots(db) == live